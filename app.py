@@ -6,10 +6,13 @@ All business logic is properly separated into layers with dependency injection.
 """
 
 import os
+import asyncio
 import logging
+import weakref
 from typing import Optional
 
 import chainlit as cl
+from chainlit.server import app as server
 from dotenv import load_dotenv
 
 from src import app
@@ -19,29 +22,28 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Chainlit profiles per precomputed variant; entries go away when popularity refreshes replace the variants
+_rendered_profiles = weakref.WeakKeyDictionary()
+
 
 @cl.set_chat_profiles
 async def setup_chat_profile():
     """Configure the chat profile with welcome message, avatar, and starter questions."""
     try:
-        chat_profile_config = app.get_chat_profile_config()
-        profile_data = chat_profile_config.create_chat_profile(app.is_hybrid_available())
-        
-        starters = []
-        for starter_data in profile_data['starters']:
-            starter = cl.Starter(
-                label=starter_data['label'],
-                message=starter_data['message'],
-                icon=starter_data['icon']
+        # Profile variants are precomputed; each is turned into Chainlit objects once
+        variant = app.get_chat_profile_config().choose_variant()
+        profile = _rendered_profiles.get(variant)
+        if profile is None:
+            profile = cl.ChatProfile(
+                name=variant.name,
+                markdown_description=variant.description,
+                icon=variant.icon,
+                starters=[
+                    cl.Starter(label=starter.label, message=starter.content, icon=starter.icon)
+                    for starter in variant.starters
+                ],
             )
-            starters.append(starter)
-        
-        profile = cl.ChatProfile(
-            name=profile_data['name'],
-            markdown_description=profile_data['description'],
-            icon=profile_data['icon'],
-            starters=starters,
-        )
+            _rendered_profiles[variant] = profile
         
         return [profile]
     except Exception as e:
@@ -56,21 +58,38 @@ async def setup_chat_profile():
         ]
 
 
+@server.get("/api/suggest")
+async def suggest(q: str = "", limit: int = 5):
+    """Type-ahead suggestions for the chat input; served locally, never hits the backend."""
+    suggestions = await app.search_use_case.suggest(q[:200])
+    return {"query": q, "suggestions": suggestions[:max(0, limit)]}
+
+# Chainlit ends its routes with a catch-all for the frontend; keep ours in front of it
+server.router.routes.insert(0, server.router.routes.pop())
+
+
 @cl.on_message
 async def handle_user_message(message: cl.Message):
     """Handle incoming user messages through the chat controller."""
     try:
-        # Add detailed logging for debugging Docker issues
-        logger.info(f"Received message: '{message.content}' (type: {type(message.content)}, length: {len(message.content) if message.content else 0})")
-        
         # Validate message content early
         if not message.content or not isinstance(message.content, str) or not message.content.strip():
-            logger.warning(f"Invalid message content received: {repr(message.content)}")
+            logger.warning("Invalid message content received")
             error_message = "❌ **Error:** Pesan tidak boleh kosong. Silakan masukkan pertanyaan Anda."
             await cl.Message(content=error_message, author="Assistant").send()
             return
         
         chat_controller = app.get_chat_controller()
+        session_registry = app.get_session_registry()
+        session_id = cl.context.session.id
+
+        # Shutting down: answers in flight finish, new questions go to the next instance
+        if not session_registry.accepting:
+            await cl.Message(
+                content="🔄 Server sedang dimulai ulang. Silakan kirim ulang pertanyaan Anda dalam beberapa detik.",
+                author="System"
+            ).send()
+            return
         
         # Always use hybrid search and show sources
         search_mode = SearchStrategy.HYBRID.value
@@ -80,11 +99,16 @@ async def handle_user_message(message: cl.Message):
             step.input = message.content
             
             try:
-                # Process message through controller with hybrid search and sources enabled
-                response_text = await chat_controller.process_message(
-                    message.content, 
-                    search_strategy=search_mode,
-                    show_sources=show_sources
+                # Process message through controller with hybrid search and sources enabled.
+                # The call is owned by the session so it is cancelled if the user disconnects.
+                response_text = await session_registry.run(
+                    session_id,
+                    chat_controller.process_message(
+                        message.content, 
+                        search_strategy=search_mode,
+                        show_sources=show_sources,
+                        session_id=session_id
+                    )
                 )
                 
                 # Check if response indicates an error
@@ -101,6 +125,12 @@ async def handle_user_message(message: cl.Message):
                 step.output = response_text
         
         await cl.Message(content=response_text, author="Assistant").send()        
+    except asyncio.CancelledError:
+        logger.info("Message handling cancelled")
+        # Re-raise when this handler itself is being cancelled (stop button);
+        # only the owned backend call was cancelled otherwise (session closed)
+        if asyncio.current_task().cancelling():
+            raise
     except Exception as e:
         logger.error(f"Critical error in message handling: {e}")
         error_message = f"❌ **System Error:** Terjadi kesalahan sistem yang tidak terduga. Silakan coba lagi atau hubungi administrator."
@@ -111,6 +141,8 @@ async def handle_user_message(message: cl.Message):
 async def on_chat_start():
     """Initialize chat session."""
     logger.info("New chat session started - Using Hybrid Search with sources enabled by default")
+    app.start_background_tasks()
+    app.get_session_registry().open(cl.context.session.id)
     
     if not app.is_hybrid_available():
         warning_message = """
@@ -122,10 +154,18 @@ Silakan lanjutkan dengan mengetikkan pertanyaan Anda.
         await cl.Message(content=warning_message, author="System").send()
 
 
+@cl.on_stop
+async def on_stop():
+    """Abort the in-flight backend request when the user hits stop."""
+    await app.get_session_registry().cancel_inflight(cl.context.session.id)
+
+
 @cl.on_chat_end
 async def on_chat_end():
     """Clean up when chat session ends."""
-    logger.info("Chat session ended")
+    session_registry = app.get_session_registry()
+    await session_registry.close(cl.context.session.id)
+    logger.info(f"Chat session ended ({session_registry.session_count()} live sessions)")
 
 
 if __name__ == "__main__":
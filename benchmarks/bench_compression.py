@@ -0,0 +1,117 @@
+"""Benchmark: size and latency trade-off of compressing backend traffic.
+
+Builds realistic /api/v1/batch request and response bodies (Indonesian
+questions, long answers with source URL lists), compresses them with every
+available encoding and reports size, CPU time and the modelled transfer
+time (compress + bytes on the wire + decompress) at several link speeds.
+
+Run with: python -m benchmarks.bench_compression [--questions 20]
+"""
+
+import argparse
+import json
+import random
+import timeit
+from typing import Dict, List, Optional, Tuple
+
+from src.infrastructure.compression import available_encodings, compress, decompress
+
+_WORDS = (
+    "mahasiswa universitas gunadarma program studi fakultas pendaftaran biaya kuliah semester "
+    "jadwal ujian beasiswa kampus depok kalimalang dosen akademik nilai krs wisuda sarjana "
+    "magister informatika sistem informasi teknik ekonomi psikologi sastra laboratorium "
+    "perpustakaan fasilitas kegiatan organisasi syarat dokumen formulir online pembayaran "
+    "rektorat sertifikat praktikum skripsi pembimbing kurikulum akreditasi penerimaan"
+).split()
+
+_OPENERS = ("Bagaimana cara", "Berapa", "Apa saja", "Dimana", "Kapan", "Apakah")
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    words = [rng.choice(_WORDS) for _ in range(length)]
+    return " ".join(words).capitalize() + "."
+
+
+def make_bodies(questions: int, seed: int = 7) -> Tuple[bytes, bytes]:
+    """A batch request body and a matching response body."""
+    rng = random.Random(seed)
+    asked = [
+        f"{rng.choice(_OPENERS)} {' '.join(rng.choice(_WORDS) for _ in range(rng.randint(4, 10)))}?"
+        for _ in range(questions)
+    ]
+    request = {"questions": asked, "use_cache": True, "use_hybrid": True}
+
+    results = []
+    for _ in asked:
+        paragraphs = [
+            " ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(3, 6)))
+            for _ in range(rng.randint(2, 5))
+        ]
+        urls = [
+            f"https://{rng.choice(['www.gunadarma.ac.id', 'baak.gunadarma.ac.id', 'pmb.gunadarma.ac.id'])}"
+            f"/{rng.choice(_WORDS)}/{rng.choice(_WORDS)}-{rng.randint(1, 500)}"
+            for _ in range(rng.randint(2, 8))
+        ]
+        results.append({
+            "answer": "\n\n".join(paragraphs),
+            "source_urls": urls,
+            "status": "success",
+            "source_count": len(urls),
+            "response_time": round(rng.uniform(0.5, 6.0), 3),
+            "cached": rng.random() < 0.3,
+            "cache_type": None,
+            "search_type": "hybrid"
+        })
+    response = {"results": results, "total_questions": questions, "processing_time": 12.5}
+
+    def encode(data: Dict) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    return encode(request), encode(response)
+
+
+def measure(body: bytes, encoding: Optional[str]) -> Tuple[int, float, float]:
+    """Compressed size and best-of compress / decompress seconds."""
+    if encoding is None:
+        return len(body), 0.0, 0.0
+    compressed = compress(body, encoding)
+    assert decompress(compressed, encoding) == body
+    number = 20
+    compress_s = min(timeit.repeat(lambda: compress(body, encoding), number=number, repeat=3)) / number
+    decompress_s = min(timeit.repeat(lambda: decompress(compressed, encoding), number=number, repeat=3)) / number
+    return len(compressed), compress_s, decompress_s
+
+
+def report(name: str, body: bytes, links_mbit: List[float]) -> None:
+    """Print the trade-off table for one body."""
+    print(f"\n{name}: {len(body) / 1024:.1f} KB uncompressed")
+    header = f"{'encoding':<10}{'size KB':>9}{'ratio':>7}{'comp ms':>9}{'decomp ms':>10}"
+    header += "".join(f"{f'@{link:g}Mbit ms':>14}" for link in links_mbit)
+    print(header)
+    for encoding in (None, *available_encodings()):
+        size, compress_s, decompress_s = measure(body, encoding)
+        row = f"{encoding or 'identity':<10}{size / 1024:>9.1f}{len(body) / size:>7.2f}"
+        row += f"{compress_s * 1000:>9.3f}{decompress_s * 1000:>10.3f}"
+        for link in links_mbit:
+            total = compress_s + size * 8 / (link * 1_000_000) + decompress_s
+            row += f"{total * 1000:>14.2f}"
+        print(row)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=20, help="questions per batch")
+    parser.add_argument("--links", default="10,100,1000", help="link speeds in Mbit/s")
+    args = parser.parse_args()
+
+    links = [float(link) for link in args.links.split(",")]
+    request, response = make_bodies(args.questions)
+    print(f"encodings available: {', '.join(available_encodings())}")
+    report("batch request", request, links)
+    report("batch response", response, links)
+    small, _ = make_bodies(1)
+    report("single-question request (below API_COMPRESSION_MIN_BYTES is sent as is)", small, links)
+
+
+if __name__ == "__main__":
+    main()
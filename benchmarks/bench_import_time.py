@@ -0,0 +1,46 @@
+"""Benchmark: worker cold-start cost of the composition root.
+
+Each sample runs in a fresh interpreter so module caches do not hide import
+cost. Reports the time to ``import src`` and the time to build the chat stack
+on first use.
+
+Run with: python -m benchmarks.bench_import_time [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+_PROBE = """
+import time
+start = time.perf_counter()
+from src import app
+imported = time.perf_counter()
+app.get_chat_controller()
+built = time.perf_counter()
+print(imported - start, built - imported)
+"""
+
+
+def _sample() -> tuple:
+    """Measure one cold start in a subprocess."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), float(output[1])
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    samples = [_sample() for _ in range(runs)]
+    imports = [s[0] * 1000 for s in samples]
+    builds = [s[1] * 1000 for s in samples]
+
+    print(f"runs: {runs}")
+    print(f"import src:            median {statistics.median(imports):7.2f} ms  max {max(imports):7.2f} ms")
+    print(f"first chat controller: median {statistics.median(builds):7.2f} ms  max {max(builds):7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
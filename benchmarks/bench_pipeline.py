@@ -0,0 +1,93 @@
+"""Benchmark: per-call cost of the search pipeline and of each interceptor.
+
+Wraps an in-memory search service (no I/O, so only the pipeline is
+measured) and times sequential awaited searches through: the bare service,
+an empty pipeline, every stage present but disabled, and each stage on its
+own. Reports microseconds per call and the overhead over the bare service.
+
+Run with: python -m benchmarks.bench_pipeline [--calls 200000]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Tuple
+
+from src.application import SearchPipeline, MetricsInterceptor, CoalescingInterceptor, RateLimitInterceptor
+from src.core import SearchServiceInterface
+from src.domain import SearchQuery, SearchResponse, BatchRequest, BatchResponse
+from src.infrastructure import PipelineConfig
+
+
+class EchoSearchService(SearchServiceInterface):
+    """Answers instantly with a prebuilt response."""
+
+    def __init__(self):
+        self.response = SearchResponse(query=None, answer="jawaban")
+
+    async def search(self, query: SearchQuery) -> SearchResponse:
+        return self.response
+
+    async def batch_search(self, batch_request: BatchRequest) -> BatchResponse:
+        return BatchResponse(results=[], total_questions=0, processing_time=0.0)
+
+    async def health_check(self) -> Dict[str, Any]:
+        return {}
+
+    async def get_search_suggestions(self, text: str) -> List[str]:
+        return []
+
+
+def make_pipeline(service: SearchServiceInterface, names: Tuple[str, ...], rate: float) -> SearchPipeline:
+    """Pipeline with every stage available and ``names`` configured."""
+    config = PipelineConfig(interceptors=names, rate_limit_per_second=rate, rate_limit_burst=10 ** 9)
+    stages = {
+        "metrics": MetricsInterceptor(),
+        "coalesce": CoalescingInterceptor(),
+        "rate_limit": RateLimitInterceptor(config)
+    }
+    return SearchPipeline(service, stages, config)
+
+
+async def per_call(service: SearchServiceInterface, calls: int, repeat: int = 3) -> float:
+    """Best-of seconds per awaited search."""
+    query = SearchQuery(text="Berapa biaya kuliah per semester?")
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            await service.search(query)
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+async def run(calls: int) -> None:
+    echo = EchoSearchService()
+    all_stages = PipelineConfig.STAGES
+    cases = [
+        ("bare service", echo),
+        ("empty pipeline", make_pipeline(echo, (), 0.0)),
+        ("rate_limit listed but disabled", make_pipeline(echo, ("rate_limit",), 0.0)),
+        ("metrics", make_pipeline(echo, ("metrics",), 0.0)),
+        ("coalesce", make_pipeline(echo, ("coalesce",), 0.0)),
+        ("rate_limit", make_pipeline(echo, ("rate_limit",), 1e9)),
+        ("all stages", make_pipeline(echo, all_stages, 1e9)),
+    ]
+
+    baseline = None
+    print(f"{'configuration':<36}{'us/call':>10}{'overhead us':>13}")
+    for name, service in cases:
+        seconds = await per_call(service, calls)
+        baseline = seconds if baseline is None else baseline
+        print(f"{name:<36}{seconds * 1e6:>10.2f}{(seconds - baseline) * 1e6:>13.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000, help="searches per measurement")
+    args = parser.parse_args()
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
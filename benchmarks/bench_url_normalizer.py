@@ -0,0 +1,63 @@
+"""Micro-benchmark: memoized UrlNormalizer vs. per-call urlparse normalization.
+
+Run with: python -m benchmarks.bench_url_normalizer
+"""
+
+import random
+import timeit
+from typing import List
+
+from src.infrastructure.urls import UrlNormalizer, normalize_url
+
+
+def _baseline_normalize_many(urls: List[str]) -> List[str]:
+    """Previous RAGApiClient behaviour: re-parse every URL on every response."""
+    seen = set()
+    unique_urls = []
+    for url in urls:
+        if not url or not isinstance(url, str):
+            continue
+        normalized = normalize_url(url)
+        if normalized.lower() not in seen:
+            seen.add(normalized.lower())
+            unique_urls.append(normalized)
+    return unique_urls
+
+
+def _make_responses(count: int = 1000, pool_size: int = 300) -> List[List[str]]:
+    """Build response source lists drawn from a small pool of gunadarma URLs."""
+    rng = random.Random(42)
+    pool = [
+        f"https://www.gunadarma.ac.id/{section}/page-{i}/"
+        for i, section in enumerate(
+            rng.choice(["akademik", "pmb", "fasilitas", "beasiswa", "berita"])
+            for _ in range(pool_size)
+        )
+    ]
+    return [rng.sample(pool, rng.randint(1, 6)) for _ in range(count)]
+
+
+def main() -> None:
+    responses = _make_responses()
+    normalizer = UrlNormalizer()
+
+    assert all(
+        _baseline_normalize_many(urls) == normalizer.normalize_many(urls)
+        for urls in responses
+    )
+
+    baseline = min(timeit.repeat(
+        lambda: [_baseline_normalize_many(urls) for urls in responses], number=5, repeat=3
+    ))
+    memoized = min(timeit.repeat(
+        lambda: [normalizer.normalize_many(urls) for urls in responses], number=5, repeat=3
+    ))
+
+    print(f"baseline (urlparse per call): {baseline * 1000:.2f} ms")
+    print(f"memoized UrlNormalizer:       {memoized * 1000:.2f} ms")
+    print(f"speedup:                      {baseline / memoized:.1f}x")
+    print(f"cache: {normalizer.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
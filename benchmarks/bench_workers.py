@@ -0,0 +1,98 @@
+"""Benchmark: throughput scaling of multi-worker mode.
+
+Starts the worker supervisor with 1, 2, 4 ... up to the CPU count workers
+and drives /api/suggest (served entirely by the frontend, so the backend is
+not the bottleneck) from concurrent clients, each with its own
+X-Forwarded-For address so the sticky proxy spreads them over the workers.
+Reports requests/s and the speed-up over one worker.
+
+Run with: python -m benchmarks.bench_workers [--max-workers 8] [--duration 10]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import List
+
+import httpx
+
+from src.infrastructure.config import WorkerConfig
+from src.infrastructure.workers import Supervisor
+
+_QUERIES = ("bi", "biaya kul", "jadwal", "cara daftar", "beasis", "wisuda", "krs", "fasilitas")
+
+
+async def _wait_ready(url: str, timeout: float = 60.0) -> None:
+    """Wait until every worker answers through the proxy."""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url, params={"q": "bi"})).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise TimeoutError(f"{url} did not become ready")
+
+
+async def _client(url: str, index: int, stop_at: float, counts: List[int]) -> None:
+    """Send requests back to back until ``stop_at``."""
+    headers = {"X-Forwarded-For": f"10.0.{index // 250}.{index % 250 + 1}"}
+    async with httpx.AsyncClient(headers=headers, timeout=10.0) as client:
+        while time.monotonic() < stop_at:
+            try:
+                response = await client.get(url, params={"q": _QUERIES[counts[index] % len(_QUERIES)]})
+                if response.status_code == 200:
+                    counts[index] += 1
+            except httpx.HTTPError:
+                pass
+
+
+async def measure(workers: int, port: int, clients: int, duration: float) -> float:
+    """Requests/s with ``workers`` worker processes."""
+    config = WorkerConfig(workers=workers, host="127.0.0.1", port=port, base_port=port + 1, drain_timeout=5.0, trust_forwarded=True)
+    supervisor = Supervisor(config)
+    runner = asyncio.create_task(supervisor.run())
+    url = f"http://127.0.0.1:{port}/api/suggest"
+    try:
+        await _wait_ready(url)
+        # Warm every worker (imports, first suggestion lookups)
+        await asyncio.gather(*(_client(url, i, time.monotonic() + 1.0, [0] * clients) for i in range(clients)))
+
+        counts = [0] * clients
+        started = time.monotonic()
+        await asyncio.gather(*(_client(url, i, started + duration, counts) for i in range(clients)))
+        return sum(counts) / (time.monotonic() - started)
+    finally:
+        supervisor._stopping.set()
+        await runner
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--clients", type=int, default=64, help="concurrent clients (distinct addresses)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per measurement")
+    parser.add_argument("--port", type=int, default=18080)
+    args = parser.parse_args()
+
+    counts = []
+    workers = 1
+    while workers <= args.max_workers:
+        counts.append(workers)
+        workers *= 2
+    if counts[-1] != args.max_workers:
+        counts.append(args.max_workers)
+
+    print(f"{'workers':>8}{'req/s':>10}{'speed-up':>10}")
+    baseline = None
+    for workers in counts:
+        rate = asyncio.run(measure(workers, args.port, args.clients, args.duration))
+        baseline = baseline or rate
+        print(f"{workers:>8}{rate:>10.0f}{rate / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
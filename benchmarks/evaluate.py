@@ -0,0 +1,223 @@
+"""Offline answer-quality and latency evaluation through SearchService.batch_search.
+
+The question set is a CSV or JSONL file with a ``question`` column and
+optional ``id`` and ``expected_sources`` columns (a JSON list, or URLs
+separated by ``;`` in CSV). Results are appended to a JSONL file one
+window at a time, so an interrupted run resumes where it stopped: ids
+already answered successfully are skipped, failed ones (and a record
+cut off mid-line) are retried.
+
+Run with: python -m benchmarks.evaluate questions.csv results.jsonl \
+    --backend-url http://localhost:8000 --chunk-size 20 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterator, List, Set
+
+from src.application import SearchService
+from src.domain import BatchRequest
+from src.infrastructure import ApiConfig, LatencyWindow, SearchConfig, normalize_url
+
+
+def _question_id(row: Dict[str, Any]) -> str:
+    """Explicit id, or a stable hash of the question text."""
+    if row.get("id"):
+        return str(row["id"])
+    return hashlib.sha1(row["question"].strip().encode("utf-8")).hexdigest()[:12]
+
+
+def _expected_sources(value: Any) -> List[str]:
+    """Expected source URLs from a list or a ``;``-separated string."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(";")
+    return [url.strip() for url in value if url and url.strip()]
+
+
+def load_questions(path: str) -> Iterator[Dict[str, Any]]:
+    """Read a CSV or JSONL question set."""
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        rows = csv.DictReader(file) if path.lower().endswith(".csv") else (
+            json.loads(line) for line in file if line.strip()
+        )
+        for row in rows:
+            question = (row.get("question") or "").strip()
+            if not question:
+                continue
+            yield {
+                "id": _question_id(row),
+                "question": question,
+                "expected_sources": _expected_sources(row.get("expected_sources"))
+            }
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """Latest result per id from an existing output file."""
+    results: Dict[str, Dict[str, Any]] = {}
+    if not os.path.exists(path):
+        return results
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Truncated last line from an interrupted run
+                continue
+            results[record["id"]] = record
+    return results
+
+
+def _source_key(url: str) -> str:
+    """Comparable form of a source URL."""
+    return normalize_url(url).lower().rstrip("/")
+
+
+def score(item: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    """Build the output record for one answered question."""
+    found = {_source_key(url) for url in result.source_urls}
+    expected = {_source_key(url) for url in item["expected_sources"]}
+    matched = len(expected & found)
+    return {
+        "id": item["id"],
+        "question": item["question"],
+        "status": result.status,
+        "latency": round(result.response_time, 4),
+        "cached": result.cached,
+        "cache_type": result.cache_type,
+        "source_count": result.source_count,
+        "answered": bool(result.answer.strip()) and result.status != "error",
+        "source_hit": matched > 0 if expected else None,
+        "source_recall": round(matched / len(expected), 4) if expected else None,
+        "answer": result.answer,
+        "source_urls": result.source_urls
+    }
+
+
+def _drop_partial_line(path: str) -> None:
+    """Truncate an interrupted run's incomplete last line so new records start on their own line."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as file:
+        end = file.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            step = min(4096, position)
+            file.seek(position - step)
+            newline = file.read(step).rfind(b"\n")
+            if newline != -1:
+                position = position - step + newline + 1
+                break
+            position -= step
+        if position < end:
+            file.truncate(position)
+
+
+async def evaluate(
+    items: List[Dict[str, Any]],
+    service: SearchService,
+    output: str,
+    window: int
+) -> None:
+    """Answer pending items window by window, appending each window to the output."""
+    _drop_partial_line(output)
+    with open(output, "a", encoding="utf-8") as file:
+        for offset in range(0, len(items), window):
+            batch = items[offset:offset + window]
+            started = time.perf_counter()
+            response = await service.batch_search(BatchRequest(questions=[item["question"] for item in batch]))
+            for item, result in zip(batch, response.results):
+                file.write(json.dumps(score(item, result), ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+            print(f"{offset + len(batch)}/{len(items)} done ({time.perf_counter() - started:.1f}s for {len(batch)})")
+
+
+def summarize(results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate quality and latency figures over all results."""
+    records = list(results.values())
+    ok = [record for record in records if record["status"] != "error"]
+    latencies = LatencyWindow(size=max(1, len(ok)))
+    for record in ok:
+        latencies.observe(record["latency"])
+    with_expected = [record for record in ok if record["source_hit"] is not None]
+
+    def rate(values: List[Any]) -> float:
+        return round(sum(1 for value in values if value) / len(values), 4) if values else 0.0
+
+    return {
+        "questions": len(records),
+        "errors": len(records) - len(ok),
+        "answered_rate": rate([record["answered"] for record in records]),
+        "cache_hit_rate": rate([record["cached"] for record in ok]),
+        "mean_source_count": round(sum(record["source_count"] for record in ok) / len(ok), 2) if ok else 0.0,
+        "source_hit_rate": rate([record["source_hit"] for record in with_expected]),
+        "mean_source_recall": round(
+            sum(record["source_recall"] for record in with_expected) / len(with_expected), 4
+        ) if with_expected else 0.0,
+        "latency": {
+            f"p{pct}": round(latencies.percentile(pct), 4)
+            for pct in (50, 95, 99) if latencies.percentile(pct) is not None
+        }
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Evaluate answers for a question set.")
+    parser.add_argument("questions", help="CSV or JSONL question set")
+    parser.add_argument("output", help="JSONL results file (appended to, enables resume)")
+    parser.add_argument("--backend-url", default="http://localhost:8000")
+    parser.add_argument("--chunk-size", type=int, default=20, help="questions per backend batch call")
+    parser.add_argument("--concurrency", type=int, default=4, help="batch calls in flight")
+    parser.add_argument("--window", type=int, default=None, help="questions per checkpoint (default chunk size × concurrency)")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    # Importing src already configured logging; per-request client logs would drown the progress output
+    logging.getLogger().setLevel(logging.WARNING)
+
+    items: List[Dict[str, Any]] = []
+    seen: Set[str] = set()
+    for item in load_questions(args.questions):
+        if item["id"] not in seen:
+            seen.add(item["id"])
+            items.append(item)
+
+    done = {
+        record_id for record_id, record in load_results(args.output).items()
+        if record["status"] != "error"
+    }
+    pending = [item for item in items if item["id"] not in done]
+    print(f"{len(items)} questions, {len(items) - len(pending)} already done, {len(pending)} to run")
+
+    api_config = ApiConfig(base_url=args.backend_url, timeout=args.timeout)
+    search_config = SearchConfig(batch_chunk_size=args.chunk_size, batch_concurrency=args.concurrency)
+    api_config.validate()
+    search_config.validate()
+    service = SearchService(api_config, search_config)
+
+    async def run() -> None:
+        try:
+            await evaluate(pending, service, args.output, args.window or args.chunk_size * args.concurrency)
+        finally:
+            await service.client.aclose()
+
+    if pending:
+        asyncio.run(run())
+
+    results = load_results(args.output)
+    summary = summarize({item["id"]: results[item["id"]] for item in items if item["id"] in results})
+    print(json.dumps(summary, indent=2))
+    with open(f"{os.path.splitext(args.output)[0]}.summary.json", "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Replay a recorded query log against a mock or staging backend.
+
+Questions are re-issued open-loop on the recorded schedule, compressed by
+``--speed`` (0 sends as fast as ``--concurrency`` allows), and the latency
+distribution is reported next to the one recorded in production. Save a
+report per build with ``--output`` and diff two builds with ``--compare``.
+
+Run with: python -m benchmarks.replay_queries .cache/query_log.jsonl \
+    --backend-url http://localhost:8000 --speed 4 --output build.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.infrastructure import ApiConfig, LatencyWindow, RAGApiClient, read_query_log
+
+
+def _distribution(latencies: List[float]) -> Dict[str, float]:
+    """Summary statistics of latency samples in seconds."""
+    if not latencies:
+        return {}
+    window = LatencyWindow(size=len(latencies))
+    for value in latencies:
+        window.observe(value)
+    summary = {f"p{pct}": round(window.percentile(pct), 4) for pct in (50, 90, 95, 99)}
+    summary["max"] = round(max(latencies), 4)
+    summary["mean"] = round(sum(latencies) / len(latencies), 4)
+    return summary
+
+
+def _replayable(entries: Iterable[Dict[str, Any]], limit: Optional[int]) -> List[Dict[str, Any]]:
+    """Entries with usable question text (fully redacted ones cannot be replayed)."""
+    selected = []
+    for entry in entries:
+        question = entry.get("q")
+        if not question or question.startswith("<redacted"):
+            continue
+        selected.append(entry)
+        if limit and len(selected) >= limit:
+            break
+    return selected
+
+
+async def replay(
+    entries: List[Dict[str, Any]],
+    client: RAGApiClient,
+    speed: float,
+    concurrency: int
+) -> Tuple[List[Tuple[float, bool, bool]], float]:
+    """Issue every entry on schedule; returns (latency, ok, cached) samples and wall time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: List[Tuple[float, bool, bool]] = []
+
+    async def issue(question: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.search(question)
+            samples.append((time.perf_counter() - started, not response.error, response.cached))
+
+    tasks = []
+    started = time.monotonic()
+    first = entries[0]["t"] if entries else 0.0
+    for entry in entries:
+        if speed > 0:
+            delay = (entry["t"] - first) / speed - (time.monotonic() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(issue(entry["q"])))
+    await asyncio.gather(*tasks)
+    return samples, time.monotonic() - started
+
+
+def build_report(entries: List[Dict[str, Any]], samples: List[Tuple[float, bool, bool]], wall: float) -> Dict[str, Any]:
+    """Replay report including the recorded production distribution."""
+    count = len(samples)
+    return {
+        "requests": count,
+        "errors": sum(1 for _, ok, _ in samples if not ok),
+        "cache_hit_rate": round(sum(1 for _, _, cached in samples if cached) / count, 4) if count else 0.0,
+        "throughput_rps": round(count / wall, 2) if wall else 0.0,
+        "wall_seconds": round(wall, 2),
+        "latency": _distribution([latency for latency, ok, _ in samples if ok]),
+        "recorded_latency": _distribution([entry["l"] for entry in entries if entry.get("ok", 1) and "l" in entry])
+    }
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    """Print a report, with deltas against a baseline report if given."""
+    rows = [(key, report[key], baseline.get(key) if baseline else None)
+            for key in ("requests", "errors", "cache_hit_rate", "throughput_rps", "wall_seconds")]
+    for group in ("latency", "recorded_latency"):
+        for stat, value in report[group].items():
+            rows.append((f"{group}.{stat}", value, (baseline or {}).get(group, {}).get(stat)))
+
+    for name, value, base in rows:
+        line = f"{name:<26}{value:>12}"
+        if base is not None:
+            delta = f"{(value - base) / base * 100:+.1f}%" if base else "n/a"
+            line += f"{base:>12}{delta:>10}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a recorded query log.")
+    parser.add_argument("log", help="query log path (rotated backups next to it are included)")
+    parser.add_argument("--backend-url", default="http://localhost:8000")
+    parser.add_argument("--speed", type=float, default=1.0, help="time compression factor, 0 = no pacing")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--compare", help="baseline JSON report to diff against")
+    args = parser.parse_args()
+
+    # Importing src already configured logging; per-request client logs would drown the report
+    logging.getLogger().setLevel(logging.WARNING)
+    entries = _replayable(read_query_log(args.log), args.limit)
+    if not entries:
+        raise SystemExit(f"No replayable entries in {args.log}")
+
+    config = ApiConfig(base_url=args.backend_url, timeout=args.timeout, max_retries=1)
+    config.validate()
+    client = RAGApiClient(config)
+
+    async def run() -> Tuple[List[Tuple[float, bool, bool]], float]:
+        try:
+            return await replay(entries, client, args.speed, args.concurrency)
+        finally:
+            await client.aclose()
+
+    pace = f"{args.speed}x" if args.speed > 0 else "max speed"
+    print(f"Replaying {len(entries)} queries at {pace} against {args.backend_url}")
+    samples, wall = asyncio.run(run())
+    report = build_report(entries, samples, wall)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
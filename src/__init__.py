@@ -1,93 +1,454 @@
 """Main module - Clean architecture bootstrap."""
 
-import os
+import asyncio
 import logging
-from typing import Optional
+import os
+import signal
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from .infrastructure import ApiConfig, RAGApiClient, SimpleCache
-from .application import SearchService, ChatbotService, SearchUseCase, ChatUseCase, HealthCheckUseCase, BatchSearchUseCase
-from .presentation import ChatController, BatchController, ResponseFormatter, ChatProfileConfig
-from .domain import SearchStrategy
-from .core import ChatbotException
+if TYPE_CHECKING:
+    from .application import SessionRegistry
+    from .presentation import BatchController, ChatController, ChatProfileConfig
 
 
 logger = logging.getLogger(__name__)
 
 
 class Application:
-    """Main application class - Dependency injection container."""
-    
+    """
+    Main application class - Dependency injection container.
+
+    Components are built on first use, and each layer is only imported when
+    a component that needs it is requested, so importing ``src`` is cheap.
+    """
+
     def __init__(self):
         self._setup_logging()
-        self._initialize_dependencies()
-    
+        self._hybrid_available = None
+        self._background_tasks: List[asyncio.Task] = []
+        self._shutdown_task: Optional[asyncio.Task] = None
+        self._published_metrics: Dict[str, float] = {}
+
     def _setup_logging(self):
         """Setup application logging."""
         logging.basicConfig(level=logging.INFO)
-    
-    def _initialize_dependencies(self):
-        """Initialize all dependencies using dependency injection."""
+
+    @cached_property
+    def settings_manager(self):
+        """Validated settings with hot reload (also switches to structured logging)."""
+        from .infrastructure import SettingsManager, configure_logging
+        manager = SettingsManager()
+        manager.on_reload(self._on_settings_reload)
+        configure_logging(manager.settings.logging, manager.settings.log_level)
+        return manager
+
+    @property
+    def settings(self):
+        """Current settings."""
+        return self.settings_manager.settings
+
+    @cached_property
+    def api_config(self):
+        """API client configuration."""
+        return self.settings.api
+
+    @cached_property
+    def search_service(self):
+        """Search service (owns the backend API client)."""
+        from .application import SearchService
+        return SearchService(
+            self.api_config,
+            self.settings.search,
+            self.settings.fallback,
+            self.suggestion_index,
+            self.settings.scheduler
+        )
+
+    @cached_property
+    def search_pipeline(self):
+        """Search service wrapped in the interceptor stages listed in PIPELINE_INTERCEPTORS."""
+        from .application import SearchPipeline, MetricsInterceptor, CoalescingInterceptor, RateLimitInterceptor
+        config = self.settings.pipeline
+        stages = {
+            "metrics": MetricsInterceptor(),
+            "coalesce": CoalescingInterceptor(),
+            # Workers share one rate limit through the supervisor's state
+            "rate_limit": RateLimitInterceptor(config, self.shared_state if self._worker_id is not None else None)
+        }
+        return SearchPipeline(self.search_service, stages, config)
+
+    @cached_property
+    def suggestion_index(self):
+        """Type-ahead index, seeded with the starter questions."""
+        from .application import SuggestionIndex
+        return SuggestionIndex(self.settings.suggestions, self._starter_messages())
+
+    def _starter_messages(self) -> List[str]:
+        """Text of every starter question in the catalog."""
+        catalog = self.chat_profile_config.base_catalog
+        return [question.content for category in catalog.categories for question in category.questions]
+
+    @cached_property
+    def enrichment_service(self):
+        """Background source title enrichment."""
+        from .application import SourceEnrichmentService
+        return SourceEnrichmentService(self.settings.enrichment)
+
+    @cached_property
+    def session_registry(self) -> 'SessionRegistry':
+        """Registry of per-session resources."""
+        from .application import SessionRegistry
+        registry = SessionRegistry()
+        registry.register_store(self.conversation_store)
+        registry.register_store(self.continuation_store)
+        return registry
+
+    @cached_property
+    def conversation_store(self):
+        """Per-session conversation memory."""
+        from .infrastructure import ConversationStore
+        return ConversationStore(self.settings.conversation)
+
+    @cached_property
+    def query_log(self):
+        """Replayable log of asked questions (writes only when enabled)."""
+        from .infrastructure import QueryLogWriter
+        # Workers each append to their own file; readers merge them
+        return QueryLogWriter(self.settings.query_log, self._worker_id)
+
+    @property
+    def _worker_id(self):
+        """Worker number in multi-worker mode, else None."""
+        workers = self.settings.workers
+        return workers.worker_id if workers.shared_state_socket else None
+
+    @cached_property
+    def shared_state(self):
+        """State shared with the other workers (process-local in single-worker mode)."""
+        from .infrastructure import LocalState, SharedStateClient
+        socket_path = self.settings.workers.shared_state_socket
+        return SharedStateClient(socket_path) if socket_path else LocalState()
+
+    @cached_property
+    def faq_service(self):
+        """Precomputed answers for the starters and the most asked questions."""
+        from .application import FaqService
+        from .infrastructure import FaqStore, count_questions
+        config = self.settings.faq
+
+        def popular():
+            query_log = self.settings.query_log
+            # Follow-ups only make sense within their conversation
+            return count_questions(query_log.path, standalone_only=True) if query_log.enabled else {}
+
+        return FaqService(self.search_pipeline, FaqStore(config.path), config, self._starter_messages(), popular)
+
+    @cached_property
+    def continuation_store(self):
+        """Remainders of truncated answers, served by /more."""
+        from .application import ContinuationStore
+        return ContinuationStore()
+
+    @cached_property
+    def renderer(self):
+        """Markdown renderer shared by the chat service and formatter."""
+        from .application import ResponseRenderer
+        return ResponseRenderer(self.settings.render, self.enrichment_service, self.continuation_store)
+
+    @cached_property
+    def chatbot_service(self):
+        """Chatbot service."""
+        from .application import ChatbotService
+        return ChatbotService(
+            self.search_pipeline,
+            self.enrichment_service,
+            self.conversation_store,
+            self.query_log,
+            self.renderer,
+            self.suggestion_index,
+            self.faq_service
+        )
+
+    @cached_property
+    def search_use_case(self):
+        """Search use case."""
+        from .application import SearchUseCase
+        return SearchUseCase(self.search_pipeline)
+
+    @cached_property
+    def batch_search_use_case(self):
+        """Batch search use case."""
+        from .application import BatchSearchUseCase
+        return BatchSearchUseCase(self.search_pipeline)
+
+    @cached_property
+    def chat_use_case(self):
+        """Chat use case."""
+        from .application import ChatUseCase
+        return ChatUseCase(self.chatbot_service)
+
+    @cached_property
+    def health_check_use_case(self):
+        """Health check use case."""
+        from .application import HealthCheckUseCase
+        shared_state = self.shared_state if self._worker_id is not None else None
+        return HealthCheckUseCase(self.search_pipeline, shared_state)
+
+    @cached_property
+    def formatter(self):
+        """Response formatter."""
+        from .presentation import ResponseFormatter
+        return ResponseFormatter(
+            show_debug_info=False,
+            enrichment_service=self.enrichment_service,
+            renderer=self.renderer
+        )
+
+    @cached_property
+    def chat_controller(self) -> 'ChatController':
+        """Chat controller."""
+        from .presentation import ChatController
+        return ChatController(
+            self.chat_use_case,
+            self.search_use_case,
+            self.health_check_use_case,
+            self.formatter,
+            self.session_registry,
+            request_deadline=self.api_config.request_deadline
+        )
+
+    @cached_property
+    def batch_controller(self) -> 'BatchController':
+        """Batch controller."""
+        from .presentation import BatchController
+        return BatchController(
+            self.chat_use_case,
+            self.batch_search_use_case,
+            self.formatter
+        )
+
+    @cached_property
+    def chat_profile_config(self) -> 'ChatProfileConfig':
+        """Chat profile with precomputed starter variants."""
+        from .presentation import ChatProfileConfig, StarterCatalog
+        config = self.settings.starters
+        return ChatProfileConfig(StarterCatalog.load(config.path), config.variants)
+
+    def start_background_tasks(self) -> None:
+        """Start loop-bound background work (idempotent)."""
+        self.settings_manager.start()
+        if not self._background_tasks:
+            loop = asyncio.get_running_loop()
+            self._background_tasks.append(loop.create_task(self._refresh_starters()))
+            self._background_tasks.append(loop.create_task(self._load_suggestions()))
+            self._background_tasks.append(loop.create_task(self._refresh_faq()))
+            if self._worker_id is not None:
+                self._background_tasks.append(loop.create_task(self._publish_metrics()))
+            self._install_shutdown_handler(loop)
+
+    def _install_shutdown_handler(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Drain on SIGTERM before handing the signal to the server's own handler."""
+        previous = signal.getsignal(signal.SIGTERM)
+
+        def handle() -> None:
+            if self._shutdown_task is None:
+                self._shutdown_task = loop.create_task(self._shutdown_then(previous))
+            else:
+                # Second SIGTERM: stop waiting
+                self._hand_over(previous)
+
+        try:
+            loop.add_signal_handler(signal.SIGTERM, handle)
+        except (NotImplementedError, AttributeError, RuntimeError):
+            # No signal handling here (Windows or not the main thread); atexit hooks still flush
+            pass
+
+    async def _shutdown_then(self, previous: Any) -> None:
+        """Shut down, then let the server exit."""
         try:
-            self.api_config = ApiConfig.from_env()
-            self.api_client = RAGApiClient(self.api_config)
-            self.cache = SimpleCache()
-            
-            self.search_service = SearchService(self.api_config)
-            self.chatbot_service = ChatbotService(self.search_service)
-            
-            self.search_use_case = SearchUseCase(self.search_service)
-            self.batch_search_use_case = BatchSearchUseCase(self.search_service)
-            self.chat_use_case = ChatUseCase(self.chatbot_service)
-            self.health_check_use_case = HealthCheckUseCase(self.search_service)
-            
-            self.formatter = ResponseFormatter(show_debug_info=False)
-            self.chat_controller = ChatController(
-                self.chat_use_case,
-                self.search_use_case,
-                self.health_check_use_case,
-                self.formatter
-            )
-            
-            self.batch_controller = BatchController(
-                self.chat_use_case,
-                self.batch_search_use_case,
-                self.formatter
-            )
-            
-            self.hybrid_available = True
-            logger.info("✅ Application initialized successfully with hybrid search and batch processing")
-            
-        except ImportError as e:
-            logger.warning(f"⚠️ Hybrid search not available: {e}")
-            self._initialize_fallback()
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize application: {e}")
-            raise ChatbotException(f"Application initialization failed: {e}")
-    
-    def _initialize_fallback(self):
-        """Initialize with fallback configuration."""
-        self.api_config = ApiConfig.from_env()
-        self.formatter = ResponseFormatter()
-        self.hybrid_available = False
-        
-        logger.info("⚠️ Application initialized with fallback configuration")
-    
-    def get_chat_controller(self) -> ChatController:
+            await self.shutdown()
+        finally:
+            self._hand_over(previous)
+
+    @staticmethod
+    def _hand_over(previous: Any) -> None:
+        """Deliver SIGTERM to whoever handled it before us."""
+        loop = asyncio.get_running_loop()
+        loop.remove_signal_handler(signal.SIGTERM)
+        if callable(previous):
+            previous(signal.SIGTERM, None)
+        elif previous == signal.SIG_DFL:
+            os.kill(os.getpid(), signal.SIGTERM)
+
+    async def shutdown(self) -> None:
+        """
+        Stop admitting messages, let in-flight answers finish, then flush and close everything.
+
+        Answers still running after ``SHUTDOWN_DRAIN_TIMEOUT`` seconds are
+        cancelled. Components that were never built are skipped.
+        """
+        from .infrastructure import log_event, metrics, shutdown_logging
+        built = self.__dict__
+        cut_off = 0
+        if 'session_registry' in built:
+            cut_off = await self.session_registry.drain(self.settings.workers.shutdown_timeout)
+
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        if 'session_registry' in built:
+            await self.session_registry.close_all()
+
+        closers = [
+            ('search_service', 'aclose'),
+            ('enrichment_service', 'aclose'),
+            ('query_log', 'aclose')
+        ]
+        for name, method in closers:
+            if name in built:
+                try:
+                    await getattr(built[name], method)()
+                except Exception as e:
+                    logger.warning(f"Failed to close {name}: {e}")
+
+        if self._worker_id is not None and 'shared_state' in built:
+            await self._flush_metrics(self._published_metrics)
+        if 'shared_state' in built:
+            await self.shared_state.aclose()
+        if 'settings_manager' in built:
+            await self.settings_manager.stop()
+
+        log_event(logger, "app.shutdown", cut_off=cut_off, metrics=metrics.snapshot())
+        shutdown_logging()
+
+    async def _refresh_starters(self) -> None:
+        """Periodically re-rank starter questions by popularity in the query log."""
+        from .infrastructure import count_questions
+        profile = self.chat_profile_config
+        wanted = profile.base_catalog.normalized_messages()
+        while True:
+            query_log = self.settings.query_log
+            if query_log.enabled:
+                try:
+                    counts = await asyncio.to_thread(count_questions, query_log.path, wanted)
+                    profile.update_popularity(counts, self.settings.starters.popularity_weight)
+                except OSError as e:
+                    logger.warning(f"Failed to read query log for starter popularity: {e}")
+            await asyncio.sleep(self.settings.starters.refresh_interval)
+
+    async def _load_suggestions(self) -> None:
+        """Seed the suggestion index with the questions in the query log."""
+        from .application import SuggestionIndex
+        from .infrastructure import count_questions
+        query_log = self.settings.query_log
+        if not query_log.enabled:
+            return
+
+        def build() -> SuggestionIndex:
+            index = SuggestionIndex(self.settings.suggestions, self._starter_messages())
+            index.add_counts(count_questions(query_log.path))
+            return index
+
+        try:
+            self.suggestion_index.replace(await asyncio.to_thread(build))
+        except OSError as e:
+            logger.warning(f"Failed to read query log for suggestions: {e}")
+
+    async def _refresh_faq(self) -> None:
+        """Keep the FAQ answers fresh through the batch endpoint."""
+        faq = self.faq_service
+        while True:
+            await asyncio.sleep(faq.seconds_until_refresh())
+            if not faq.config.enabled:
+                await asyncio.sleep(faq.config.refresh_interval)
+                continue
+            if not await self._claim("faq.refresh", faq.config.refresh_interval):
+                # Another worker refreshes; pick up the file it publishes
+                if not faq.store.reload():
+                    await asyncio.sleep(min(60.0, faq.config.refresh_interval))
+                continue
+            try:
+                await faq.refresh()
+            except Exception as e:
+                logger.warning(f"FAQ refresh failed: {e}")
+                await asyncio.sleep(faq.config.refresh_interval)
+
+    async def _claim(self, job: str, ttl: float) -> bool:
+        """Check if this process should run a periodic job shared by all workers."""
+        worker_id = self._worker_id
+        if worker_id is None:
+            return True
+        try:
+            if await self.shared_state.set(f"lock.{job}", worker_id, ttl=ttl, nx=True):
+                return True
+            return await self.shared_state.get(f"lock.{job}") == worker_id
+        except OSError as e:
+            logger.warning(f"Shared state unavailable, worker 0 runs {job}: {e}")
+            return worker_id == 0
+
+    async def _publish_metrics(self) -> None:
+        """Periodically add this worker's counters to the cluster totals and heartbeat."""
+        while True:
+            interval = self.settings.workers.metrics_publish_interval
+            if await self._flush_metrics(self._published_metrics):
+                try:
+                    await self.shared_state.set(f"workers.{self._worker_id}", {"pid": os.getpid()}, ttl=3 * interval)
+                except OSError as e:
+                    logger.warning(f"Failed to send heartbeat: {e}")
+            await asyncio.sleep(interval)
+
+    async def _flush_metrics(self, published: Dict[str, float]) -> bool:
+        """Send counter deltas since the last flush; returns whether the shared state was reachable."""
+        from .infrastructure import metrics
+        counters = {
+            name: value for name, value in metrics.snapshot().items()
+            if not name.endswith((".p50", ".p99"))
+        }
+        try:
+            for name, value in counters.items():
+                if value != published.get(name, 0):
+                    await self.shared_state.incr(f"metrics.{name}", value - published.get(name, 0))
+                    published[name] = value
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to publish metrics: {e}")
+            return False
+
+    def _on_settings_reload(self, settings) -> None:
+        """Propagate reloaded settings that components copied at construction."""
+        if 'chat_controller' in self.__dict__:
+            self.chat_controller.request_deadline = settings.api.request_deadline
+        if 'search_pipeline' in self.__dict__:
+            self.search_pipeline.rebuild()
+
+    def get_chat_controller(self) -> 'ChatController':
         """Get the chat controller."""
         return self.chat_controller
-    
-    def get_batch_controller(self) -> BatchController:
+
+    def get_batch_controller(self) -> 'BatchController':
         """Get the batch controller."""
         return self.batch_controller
-    
+
+    def get_session_registry(self) -> 'SessionRegistry':
+        """Get the session registry."""
+        return self.session_registry
+
     def get_chat_profile_config(self) -> 'ChatProfileConfig':
         """Get chat profile configuration."""
-        return ChatProfileConfig()
-    
+        return self.chat_profile_config
+
     def is_hybrid_available(self) -> bool:
-        """Check if hybrid search is available."""
-        return self.hybrid_available
+        """Check if hybrid search is available (builds the chat stack on first call)."""
+        if self._hybrid_available is None:
+            try:
+                self.chat_controller
+                self._hybrid_available = True
+                logger.info("✅ Application initialized successfully with hybrid search and batch processing")
+            except ImportError as e:
+                logger.warning(f"⚠️ Hybrid search not available: {e}")
+                self._hybrid_available = False
+        return self._hybrid_available
 
 
 app = Application()
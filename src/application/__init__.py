@@ -1,11 +1,27 @@
 """Application layer - Use cases and application services."""
 
-from .services import SearchService, ChatbotService
+from .rendering import ResponseRenderer, ContinuationStore
+from .services import SearchService, ChatbotService, SourceEnrichmentService
+from .suggestions import SuggestionIndex
+from .faq import FaqService
+from .pipeline import SearchPipeline, MetricsInterceptor, CoalescingInterceptor, RateLimitInterceptor
+from .sessions import SessionRegistry, SessionState
 from .use_cases import SearchUseCase, ChatUseCase, HealthCheckUseCase, BatchSearchUseCase
 
 __all__ = [
     'SearchService',
     'ChatbotService',
+    'SourceEnrichmentService',
+    'ResponseRenderer',
+    'ContinuationStore',
+    'SuggestionIndex',
+    'FaqService',
+    'SearchPipeline',
+    'MetricsInterceptor',
+    'CoalescingInterceptor',
+    'RateLimitInterceptor',
+    'SessionRegistry',
+    'SessionState',
     'SearchUseCase',
     'ChatUseCase',
     'HealthCheckUseCase',
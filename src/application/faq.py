@@ -0,0 +1,106 @@
+"""Application FAQ - Fast path for exact matches of frequently asked questions."""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Iterable, List, Mapping, Optional
+
+from ..core import SearchServiceInterface
+from ..domain import SearchQuery, SearchResponse, BatchRequest, NOT_AVAILABLE_MESSAGE
+from ..infrastructure import FaqConfig, FaqEntry, FaqStore, normalize_question, redact_text, log_event
+
+
+logger = logging.getLogger(__name__)
+
+
+class FaqService:
+    """
+    Serves precomputed answers for curated and popular questions.
+
+    Curated questions (the starters) and the most asked questions from
+    ``popular`` are answered through the batch endpoint on every refresh;
+    a message whose normalized text matches one is answered from the store
+    without any backend call.
+    """
+
+    def __init__(
+        self,
+        search_service: SearchServiceInterface,
+        store: FaqStore,
+        config: Optional[FaqConfig] = None,
+        questions: Iterable[str] = (),
+        popular: Optional[Callable[[], Mapping[str, int]]] = None
+    ):
+        self.search_service = search_service
+        self.store = store
+        self.config = config or FaqConfig()
+        self.questions = list(questions)
+        self.popular = popular
+
+    def lookup(self, query: SearchQuery) -> Optional[SearchResponse]:
+        """Answer a query from the store on an exact normalized match (never for follow-ups)."""
+        # Stored answers were fetched without history, so they only fit standalone questions
+        if not self.config.enabled or query.context:
+            return None
+        entry = self.store.get(query.text)
+        if entry is None:
+            return None
+
+        log_event(logger, "faq.hit", version=entry.version)
+        return SearchResponse(
+            query=query,
+            answer=entry.answer,
+            source_urls=list(entry.source_urls),
+            cached=True,
+            cache_type="faq",
+            search_type="faq",
+            source_count=len(entry.source_urls)
+        )
+
+    async def candidates(self) -> List[str]:
+        """Curated questions followed by the most asked ones, without duplicates."""
+        questions = {normalize_question(q): q for q in self.questions}
+        if self.popular and self.config.promote_top:
+            counts = await asyncio.to_thread(self.popular)
+            ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+            promoted = 0
+            for question, count in ranked:
+                if promoted >= self.config.promote_top or count < self.config.promote_min_count:
+                    break
+                key = normalize_question(question)
+                # Masked log entries are not real questions
+                if key in questions or redact_text(key, "mask") != key or "<" in key:
+                    continue
+                questions[key] = question
+                promoted += 1
+        return list(questions.values())
+
+    async def refresh(self) -> int:
+        """Fetch fresh answers for all candidates; returns the number stored."""
+        questions = await self.candidates()
+        if not questions:
+            return 0
+
+        response = await self.search_service.batch_search(BatchRequest(questions=questions, use_cache=False))
+        now = time.time()
+        version = self.store.version + 1
+        entries = [
+            FaqEntry(
+                question=question,
+                answer=result.answer,
+                source_urls=list(result.source_urls),
+                version=version,
+                fetched_at=now,
+                expires_at=now + self.config.ttl
+            )
+            for question, result in zip(questions, response.results)
+            if result.status != "error" and result.answer.strip() not in ("", NOT_AVAILABLE_MESSAGE)
+        ]
+        self.store.publish(entries)
+        log_event(logger, "faq.refresh", version=self.store.version, fetched=len(entries),
+                  candidates=len(questions), stored=len(self.store))
+        return len(entries)
+
+    def seconds_until_refresh(self) -> float:
+        """Time left until the next scheduled refresh."""
+        return max(0.0, self.store.refreshed_at + self.config.refresh_interval - time.time())
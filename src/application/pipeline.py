@@ -0,0 +1,184 @@
+"""Application search pipeline - Ordered interceptor stages around the search service."""
+
+import asyncio
+import dataclasses
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+
+from ..core import SearchInterceptorInterface, SearchServiceInterface
+from ..domain import SearchQuery, SearchResponse, BatchRequest, BatchResponse, ResponseStatus
+from ..infrastructure import PipelineConfig, metrics
+
+
+class SearchPipeline(SearchServiceInterface):
+    """
+    Search service wrapped in the stages named by ``PIPELINE_INTERCEPTORS``.
+
+    The chain is composed once (and again on ``rebuild``), skipping stages
+    that are disabled or do not intercept a call, so an unused stage costs
+    nothing per request. With no active stage, calls go straight to the
+    wrapped service.
+    """
+
+    def __init__(
+        self,
+        service: SearchServiceInterface,
+        stages: Mapping[str, SearchInterceptorInterface],
+        config: PipelineConfig
+    ):
+        self.service = service
+        self.stages = dict(stages)
+        self.config = config
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recompose the chain from the configured order and each stage's ``enabled``."""
+        active = [self.stages[name] for name in self.config.interceptors if self.stages[name].enabled]
+        self.active = [name for name in self.config.interceptors if self.stages[name] in active]
+        self._search = self._chain(self.service.search, active, "search")
+        self._batch_search = self._chain(self.service.batch_search, active, "batch_search")
+
+    @staticmethod
+    def _chain(call: Callable[[Any], Awaitable[Any]], stages: List[SearchInterceptorInterface], method: str):
+        """Wrap ``call`` in every stage that overrides ``method``, first stage outermost."""
+        for stage in reversed(stages):
+            if getattr(type(stage), method) is not getattr(SearchInterceptorInterface, method):
+                call = partial(getattr(stage, method), call_next=call)
+        return call
+
+    async def search(self, query: SearchQuery) -> SearchResponse:
+        """Perform a search through the pipeline."""
+        return await self._search(query)
+
+    async def batch_search(self, batch_request: BatchRequest) -> BatchResponse:
+        """Perform a batch search through the pipeline."""
+        return await self._batch_search(batch_request)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Health of the wrapped service plus the active stages."""
+        health = await self.service.health_check()
+        health["pipeline"] = list(self.active)
+        return health
+
+    async def get_search_suggestions(self, text: str) -> List[str]:
+        """Get search suggestions from the wrapped service."""
+        return await self.service.get_search_suggestions(text)
+
+
+class MetricsInterceptor(SearchInterceptorInterface):
+    """Records latency and errors of every search as seen by callers."""
+
+    async def search(self, query, call_next):
+        start = time.monotonic()
+        response = await call_next(query)
+        metrics.observe("pipeline.search", time.monotonic() - start)
+        if response.error:
+            metrics.increment("pipeline.search.errors")
+        return response
+
+    async def batch_search(self, batch_request, call_next):
+        start = time.monotonic()
+        response = await call_next(batch_request)
+        metrics.observe("pipeline.batch", time.monotonic() - start)
+        return response
+
+
+class CoalescingInterceptor(SearchInterceptorInterface):
+    """
+    Lets concurrent identical questions share one backend call.
+
+    Follow-up questions carry conversation context and always go alone.
+    The shared call keeps running while any caller still waits for it and
+    is cancelled when the last one goes away.
+    """
+
+    def __init__(self):
+        # key -> (shared call, [callers waiting, callers joined])
+        self._inflight: Dict[str, Tuple[asyncio.Task, List[int]]] = {}
+
+    async def search(self, query, call_next):
+        if query.context:
+            return await call_next(query)
+
+        key = query.text.strip()
+        entry = self._inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(call_next(query))
+            entry = self._inflight[key] = (task, [0, 0])
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            metrics.increment("pipeline.coalesced")
+        task, counts = entry
+
+        counts[0] += 1
+        counts[1] += 1
+        try:
+            response = await asyncio.shield(task)
+        finally:
+            counts[0] -= 1
+            if not counts[0] and not task.done():
+                # Forget the dying call at once so a caller arriving meanwhile starts afresh
+                self._forget(key, task)
+                task.cancel()
+        # Callers render and annotate their response; each gets its own copy
+        return dataclasses.replace(response) if counts[1] > 1 else response
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        """Drop the shared call for ``key`` unless a newer one has replaced it."""
+        if self._inflight.get(key, (None,))[0] is task:
+            del self._inflight[key]
+
+
+class RateLimitInterceptor(SearchInterceptorInterface):
+    """
+    Caps backend-bound searches per second.
+
+    Searches over the limit are answered at once with a busy message
+    instead of queueing behind the backend. A single process uses a token
+    bucket; with ``shared_state`` (multi-worker mode) all workers count
+    against one counter per second, so the limit holds for the whole
+    deployment. If the shared state is unreachable the local bucket is
+    used. Disabled while ``PIPELINE_RATE_LIMIT_PER_SECOND`` is 0.
+    """
+
+    def __init__(self, config: PipelineConfig, shared_state: Optional[Any] = None):
+        self.config = config
+        self.shared_state = shared_state
+        self._tokens = float(config.rate_limit_burst)
+        self._updated = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.rate_limit_per_second > 0
+
+    async def search(self, query, call_next):
+        if not await self._admit():
+            metrics.increment("pipeline.rate_limited")
+            return SearchResponse(
+                query=query,
+                answer="",
+                status=ResponseStatus.ERROR,
+                error_message="Layanan sedang sibuk. Silakan coba lagi dalam beberapa saat."
+            )
+        return await call_next(query)
+
+    async def _admit(self) -> bool:
+        """Take one search from the shared per-second counter, else from the local bucket."""
+        if self.shared_state is not None:
+            try:
+                count = await self.shared_state.incr(f"ratelimit.{int(time.time())}", ttl=2.0)
+                return count <= self.config.rate_limit_per_second
+            except OSError:
+                metrics.increment("pipeline.rate_limit.shared_unavailable")
+
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.config.rate_limit_burst),
+            self._tokens + (now - self._updated) * self.config.rate_limit_per_second
+        )
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
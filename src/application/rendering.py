@@ -0,0 +1,159 @@
+"""Application rendering - Single markdown pipeline for chat responses."""
+
+import sys
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from ..core import SessionResourceInterface
+from ..domain import SearchResponse
+from ..infrastructure import RenderConfig
+
+if TYPE_CHECKING:
+    from .services import SourceEnrichmentService
+
+
+_FENCE = "```"
+
+
+def split_answer(text: str, limit: int) -> Tuple[str, str]:
+    """
+    Split an answer into a displayable head and the remainder.
+
+    The cut prefers a paragraph break, then a line or sentence end, then a
+    space in the second half of the window; an open code fence is closed in
+    the head and reopened in the remainder.
+    """
+    if len(text) <= limit:
+        return text, ""
+
+    window = text[:limit]
+    cut = -1
+    for separator in ("\n\n", "\n", ". ", " "):
+        position = window.rfind(separator)
+        if position >= limit // 2:
+            cut = position + len(separator)
+            break
+    if cut < 0:
+        cut = limit
+
+    head, rest = text[:cut].rstrip(), text[cut:].lstrip()
+    if head.count(_FENCE) % 2:
+        opener = head[head.rfind(_FENCE):].split("\n", 1)[0]
+        head += f"\n{_FENCE}"
+        rest = f"{opener}\n{rest}"
+    return head, rest
+
+
+class ContinuationStore(SessionResourceInterface):
+    """The not yet shown remainder of each session's last long answer."""
+
+    def __init__(self):
+        self._pending: Dict[str, str] = {}
+
+    def put(self, session_id: str, text: str) -> None:
+        """Keep the remainder of the latest answer (replacing an older one)."""
+        self._pending[session_id] = text
+
+    def pop(self, session_id: str) -> Optional[str]:
+        """Take the pending remainder, if any."""
+        return self._pending.pop(session_id, None)
+
+    def end_session(self, session_id: str) -> None:
+        self._pending.pop(session_id, None)
+
+    def session_memory(self, session_id: str) -> int:
+        text = self._pending.get(session_id)
+        return sys.getsizeof(text) if text is not None else 0
+
+
+class ResponseRenderer:
+    """
+    Renders search responses into chat markdown.
+
+    Output is produced as a sequence of chunks that is joined once.
+    Answers longer than ``max_answer_chars`` are cut; with a session id
+    the rest is kept and shown by ``/more``.
+    """
+
+    def __init__(
+        self,
+        config: Optional[RenderConfig] = None,
+        enrichment_service: Optional['SourceEnrichmentService'] = None,
+        continuations: Optional[ContinuationStore] = None
+    ):
+        self.config = config or RenderConfig()
+        self.enrichment_service = enrichment_service
+        self.continuations = continuations
+
+    def render(self, response: SearchResponse, session_id: Optional[str] = None, show_debug_info: bool = False) -> str:
+        """Render a complete response."""
+        return "".join(self.iter_chunks(response, session_id, show_debug_info))
+
+    def iter_chunks(
+        self,
+        response: SearchResponse,
+        session_id: Optional[str] = None,
+        show_debug_info: bool = False
+    ) -> Iterator[str]:
+        """Yield the rendered response piece by piece."""
+        if response.error:
+            yield self.error(response.error_message)
+            return
+
+        head, rest = split_answer(response.answer, self.config.max_answer_chars)
+        yield head
+        if rest:
+            yield self._truncation_note(session_id, rest)
+        yield from self._tail(response, show_debug_info)
+
+    def render_continuation(self, session_id: str) -> Optional[str]:
+        """Render the next part of the session's last long answer, if any."""
+        pending = self.continuations.pop(session_id) if self.continuations else None
+        if not pending:
+            return None
+        head, rest = split_answer(pending, self.config.max_answer_chars)
+        return head + (self._truncation_note(session_id, rest) if rest else "")
+
+    def error(self, message: Optional[str]) -> str:
+        """Render an error message."""
+        return f"❌ **Error:** {message}"
+
+    def sources_block(self, source_urls: List[str]) -> str:
+        """Render the sources list (titles when enrichment has them)."""
+        limit = self.config.max_sources
+        urls = source_urls[:limit]
+        if self.enrichment_service:
+            self.enrichment_service.schedule(urls)
+            labels = [self.enrichment_service.format_source(url) for url in urls]
+        else:
+            labels = urls
+
+        lines = ["\n\n**📚 Sumber:**\n"]
+        lines.extend(f"{i}. {label}\n" for i, label in enumerate(labels, 1))
+        if len(source_urls) > limit:
+            lines.append(f"... dan {len(source_urls) - limit} sumber lainnya\n")
+        return "".join(lines)
+
+    def debug_block(self, response: SearchResponse) -> str:
+        """Render debug information."""
+        return "".join((
+            "\n\n**🔧 Debug Info:**\n",
+            f"- Response Time: {response.response_time:.2f}s\n",
+            f"- Search Type: {response.search_type}\n",
+            f"- Cached: {'Yes' if response.cached else 'No'}\n",
+            f"- Source Count: {response.source_count}\n"
+        ))
+
+    def _tail(self, response: SearchResponse, show_debug_info: bool) -> Iterator[str]:
+        """Blocks following the answer."""
+        if response.shows_sources:
+            yield self.sources_block(response.source_urls)
+        if show_debug_info:
+            yield self.debug_block(response)
+
+    def _truncation_note(self, session_id: Optional[str], rest: str) -> str:
+        """Keep the remainder for ``/more`` and tell the user how to get it."""
+        if session_id and self.continuations is not None:
+            self.continuations.put(session_id, rest)
+            return "\n\n_…jawaban dipotong. Ketik `/more` untuk menampilkan selengkapnya._"
+        return "\n\n_…jawaban dipotong._"
+
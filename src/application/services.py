@@ -1,24 +1,75 @@
 """Application services - Business logic orchestration."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import re
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Set
 
-from ..core import SearchServiceInterface
-from ..domain import SearchQuery, SearchResponse, SearchStrategy, BatchRequest, BatchResponse
-from ..infrastructure import RAGApiClient, ApiConfig
+from ..core import BULK, SearchServiceInterface, lane_scope
+from ..domain import SearchQuery, SearchResponse, SearchStrategy, BatchRequest, BatchResponse, ResponseStatus
+from ..infrastructure import (
+    RAGApiClient,
+    MicroBatcher,
+    ApiConfig,
+    SearchConfig,
+    FallbackConfig,
+    SchedulerConfig,
+    FallbackIndex,
+    UrlNormalizer,
+    EnrichmentConfig,
+    PersistentTitleCache,
+    PageTitleFetcher,
+    ConversationStore,
+    QueryLogWriter,
+    log_event
+)
+from .rendering import ResponseRenderer
+from .suggestions import SuggestionIndex
+
+if TYPE_CHECKING:
+    from .faq import FaqService
 
 
 logger = logging.getLogger(__name__)
 
+_MARKDOWN_SPECIAL = re.compile(r"([\\`*_{}\[\]()#+!|<>~])")
+_URL_UNSAFE = {" ": "%20", "(": "%28", ")": "%29", "<": "%3C", ">": "%3E"}
+
+
+def _markdown_link(text: str, url: str) -> str:
+    """Markdown link whose text (e.g. a remote page title) cannot break out of the link."""
+    safe_text = _MARKDOWN_SPECIAL.sub(r"\\\1", text)
+    safe_url = "".join(_URL_UNSAFE.get(char, char) for char in url)
+    return f"[{safe_text}]({safe_url})"
+
 
 class SearchService(SearchServiceInterface):
     """
     Simplified search service using Hybrid Search only.
+
+    When every backend endpoint is ejected, or a search fails on the
+    network, a timeout or a 5xx, the closest stored answer from the local
+    fallback index is returned instead, labeled as such. Follow-ups sent
+    with conversation context never get a stored answer.
     """
     
-    def __init__(self, api_config: Optional[ApiConfig] = None):
+    def __init__(
+        self,
+        api_config: Optional[ApiConfig] = None,
+        search_config: Optional[SearchConfig] = None,
+        fallback_config: Optional[FallbackConfig] = None,
+        suggestions: Optional[SuggestionIndex] = None,
+        scheduler_config: Optional[SchedulerConfig] = None
+    ):
         """Initialize search service with API client."""
-        self.client = RAGApiClient(api_config)
+        self.search_config = search_config or SearchConfig.from_env()
+        self.fallback_config = fallback_config or FallbackConfig.from_env()
+        self.client = RAGApiClient(api_config, UrlNormalizer(self.search_config.url_cache_size), scheduler_config)
+        self.batcher = MicroBatcher(self.client, self.search_config)
+        self.fallback = FallbackIndex(self.fallback_config.path)
+        self.suggestions = suggestions or SuggestionIndex()
 
     async def search(self, query: SearchQuery) -> SearchResponse:
         """
@@ -26,25 +77,80 @@ class SearchService(SearchServiceInterface):
         """
         # Always use hybrid search
         strategy = SearchStrategy.HYBRID
-        logger.info(f"Using search strategy: {strategy.value}")
+        log_event(logger, "search.request", logging.DEBUG, strategy=strategy.value)
+        
+        # Stored answers match the question alone, so follow-ups never get one
+        fallback_allowed = self.fallback_config.enabled and not query.context
+
+        # Circuit open: skip the backend while an answer is available locally
+        if fallback_allowed and self.client.pool.all_ejected:
+            fallback = await self._fallback_search(query, "circuit_open")
+            if fallback:
+                return fallback
         
         # Always use hybrid search
         use_hybrid = True
         
-        response = await self.client.search(query.text, use_hybrid)
+        if self.search_config.micro_batch_enabled and not query.context:
+            # The batch endpoint carries no history, so follow-ups always go alone
+            response = await self.batcher.search(query.text)
+        else:
+            response = await self.client.search(
+                query.text, use_hybrid, query.context, use_cache=self.search_config.enable_caching
+            )
         response.search_type = strategy.value
         
+        # Only an unreachable or failing backend warrants a stored answer, not a rejected question
+        if response.backend_unavailable and fallback_allowed:
+            return await self._fallback_search(query, "backend_error") or response
         return response
 
+    async def _fallback_search(self, query: SearchQuery, reason: str) -> Optional[SearchResponse]:
+        """Closest stored answer for a query, labeled as degraded mode."""
+        start = time.perf_counter()
+        try:
+            hit = await asyncio.to_thread(self.fallback.search, query.text, self.fallback_config.min_coverage)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Fallback index unavailable: {e}")
+            return None
+        if hit is None:
+            log_event(logger, "search.fallback.miss", reason=reason)
+            return None
+
+        log_event(logger, "search.fallback", reason=reason, score=hit.score, coverage=hit.coverage)
+        return SearchResponse(
+            query=query,
+            answer=(
+                "⚠️ _Layanan sedang mengalami gangguan. Berikut jawaban tersimpan "
+                f"untuk pertanyaan serupa: \"{hit.question}\"_\n\n{hit.answer}"
+            ),
+            status=ResponseStatus.SUCCESS,
+            source_urls=list(hit.source_urls),
+            response_time=time.perf_counter() - start,
+            cached=True,
+            cache_type="fallback",
+            search_type="fallback",
+            source_count=len(hit.source_urls)
+        )
+
     async def batch_search(self, batch_request: BatchRequest) -> BatchResponse:
         """
-        Perform batch search operations.
+        Perform batch search operations (in the bulk lane, behind live chat).
         """
-        logger.info(f"Processing batch request with {len(batch_request.questions)} questions")
+        with lane_scope(BULK):
+            return await self._batch_search(batch_request)
+
+    async def _batch_search(self, batch_request: BatchRequest) -> BatchResponse:
+        """Run a batch, chunking large ones."""
+        log_event(logger, "search.batch.start", questions=len(batch_request.questions))
         
         try:
-            response = await self.client.batch_search(batch_request)
-            logger.info(f"Batch search completed in {response.processing_time:.2f}s")
+            chunk_size = self.search_config.batch_chunk_size
+            if len(batch_request.questions) <= chunk_size:
+                response = await self.client.batch_search(batch_request)
+            else:
+                response = await self._chunked_batch_search(batch_request, chunk_size)
+            log_event(logger, "search.batch.done", seconds=round(response.processing_time, 3))
             return response
         
         except Exception as e:
@@ -71,77 +177,236 @@ class SearchService(SearchServiceInterface):
                 processing_time=0.0
             )
 
+    async def _chunked_batch_search(self, batch_request: BatchRequest, chunk_size: int) -> BatchResponse:
+        """Split a large batch into chunks sent with bounded concurrency."""
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(self.search_config.batch_concurrency)
+        questions = batch_request.questions
+        
+        async def run_chunk(offset: int) -> BatchResponse:
+            chunk = BatchRequest(
+                questions=questions[offset:offset + chunk_size],
+                use_cache=batch_request.use_cache,
+                use_hybrid=batch_request.use_hybrid
+            )
+            async with semaphore:
+                return await self.client.batch_search(chunk)
+        
+        chunk_responses = await asyncio.gather(
+            *(run_chunk(offset) for offset in range(0, len(questions), chunk_size))
+        )
+        
+        return BatchResponse(
+            results=[result for response in chunk_responses for result in response.results],
+            total_questions=len(questions),
+            processing_time=time.time() - start_time
+        )
+
     async def health_check(self) -> Dict[str, Any]:
         """Check service health - always reports hybrid search available."""
-        api_healthy = self.client.health_check()
+        api_healthy = await self.client.health_check()
         
         return {
             "service_status": "healthy" if api_healthy else "unhealthy",
             "backend_status": "available" if api_healthy else "unavailable",
-            "available_strategies": ["hybrid"]
+            "available_strategies": ["hybrid"],
+            "scheduler": self.client.scheduler.stats()
         }
 
     async def get_search_suggestions(self, text: str) -> List[str]:
-        """Get simple search suggestions."""
-        # Return basic suggestions for University Gunadarma
-        suggestions = [
-            "Bagaimana cara mendaftar kuliah di Universitas Gunadarma?",
-            "Program studi apa saja yang tersedia?",
-            "Berapa biaya kuliah per semester?",
-            "Dimana alamat kampus Universitas Gunadarma?",
-            "Fasilitas apa saja yang tersedia di kampus?"
+        """Get popular questions starting with the typed text."""
+        return self.suggestions.suggest(text)
+
+    async def aclose(self) -> None:
+        """Finish queued micro-batches, then close the backend pool and the fallback index."""
+        await self.batcher.aclose()
+        await self.client.aclose()
+        self.fallback.close()
+
+
+class SourceEnrichmentService:
+    """
+    Resolves human-readable titles for source URLs in the background.
+    
+    Lookups are synchronous and only consult the title cache, so rendering an
+    answer never waits on a fetch; unknown URLs are queued and show up with a
+    title on later answers. A failed URL is retried after
+    ``TITLE_FAILURE_TTL`` seconds.
+    """
+    
+    def __init__(
+        self,
+        config: Optional[EnrichmentConfig] = None,
+        fetcher: Optional[PageTitleFetcher] = None,
+        cache: Optional[PersistentTitleCache] = None
+    ):
+        self.config = config or EnrichmentConfig.from_env()
+        self.cache = cache or PersistentTitleCache(
+            self.config.cache_path if self.config.enabled else None,
+            max_entries=self.config.max_entries
+        )
+        self.fetcher = fetcher or PageTitleFetcher(
+            timeout=self.config.fetch_timeout,
+            max_concurrency=self.config.max_concurrency
+        )
+        self._pending: Set[str] = set()
+        # url -> monotonic time after which a failed fetch may be retried
+        self._failed: "OrderedDict[str, float]" = OrderedDict()
+        self._tasks: Set[asyncio.Task] = set()
+    
+    def get_title(self, url: str) -> Optional[str]:
+        """Get the cached title for a URL without fetching."""
+        return self.cache.get(url)
+    
+    def format_source(self, url: str) -> str:
+        """Render a source as a markdown link when its title is known."""
+        title = self.cache.get(url)
+        if title:
+            return _markdown_link(title, url)
+        return url
+    
+    def schedule(self, urls: List[str]) -> None:
+        """Queue title resolution for unknown URLs; returns immediately."""
+        if not self.config.enabled:
+            return
+        
+        now = time.monotonic()
+        missing = [
+            url for url in urls
+            if url not in self.cache and url not in self._pending and self._failed.get(url, 0.0) <= now
         ]
-        return suggestions
+        if not missing:
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        
+        self._pending.update(missing)
+        task = loop.create_task(self._resolve(missing))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _resolve(self, urls: List[str]) -> None:
+        """Fetch titles for the given URLs and persist the results."""
+        try:
+            titles = await asyncio.gather(
+                *(self.fetcher.fetch_title(url) for url in urls),
+                return_exceptions=True
+            )
+            for url, title in zip(urls, titles):
+                if isinstance(title, str) and title:
+                    self.cache.set(url, title)
+                    self._failed.pop(url, None)
+                else:
+                    self._remember_failure(url)
+            await asyncio.to_thread(self.cache.save)
+        except Exception as e:
+            logger.warning(f"Source enrichment failed: {e}")
+        finally:
+            self._pending.difference_update(urls)
+    
+    def _remember_failure(self, url: str) -> None:
+        """Hold off retrying a URL, keeping at most ``max_entries`` failures."""
+        self._failed[url] = time.monotonic() + self.config.failure_ttl
+        self._failed.move_to_end(url)
+        while len(self._failed) > self.config.max_entries:
+            self._failed.popitem(last=False)
+
+    async def aclose(self) -> None:
+        """Cancel pending lookups, persist the cache and close the fetcher."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self.cache.save()
+        await self.fetcher.aclose()
 
 
 class ChatbotService:
     """Service for handling chatbot operations."""
     
-    def __init__(self, search_service: SearchServiceInterface):
+    def __init__(
+        self,
+        search_service: SearchServiceInterface,
+        enrichment_service: Optional[SourceEnrichmentService] = None,
+        conversation_store: Optional[ConversationStore] = None,
+        query_log: Optional[QueryLogWriter] = None,
+        renderer: Optional[ResponseRenderer] = None,
+        suggestions: Optional[SuggestionIndex] = None,
+        faq: Optional['FaqService'] = None
+    ):
         self.search_service = search_service
+        self.enrichment_service = enrichment_service
+        self.conversation_store = conversation_store
+        self.query_log = query_log
+        self.renderer = renderer or ResponseRenderer(enrichment_service=enrichment_service)
+        self.suggestions = suggestions
+        self.faq = faq
         self.hybrid_available = True
     
     async def process_message(
         self, 
         message: str, 
         strategy: Optional[SearchStrategy] = None,
-        search_options: Optional[Dict[str, Any]] = None
+        search_options: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None
     ) -> str:
         """Process user message and return formatted response."""
         try:
-            # Enhanced input validation with detailed logging
-            logger.info(f"Processing message: '{message}' (type: {type(message)}, length: {len(message) if message else 0})")
+            # Question text is redacted by the log formatter (LOG_REDACT_QUESTIONS)
+            log_event(logger, "chat.message", question=message, length=lambda: len(message) if message else 0)
             
             # Validate and sanitize input
             if not message or not isinstance(message, str):
-                logger.warning(f"Invalid message type or None: {type(message)}")
+                log_event(logger, "chat.message.invalid", logging.WARNING, type=type(message).__name__)
                 return "❌ **Error:** Pesan tidak valid. Silakan masukkan pertanyaan Anda."
             
             # Strip whitespace and validate again
             message = message.strip()
             if not message:
-                logger.warning("Empty message after stripping whitespace")
+                log_event(logger, "chat.message.empty", logging.WARNING)
                 return "❌ **Error:** Pesan tidak boleh kosong. Silakan masukkan pertanyaan Anda."
             
             # Validate minimum message length
             if len(message) < 2:
-                logger.warning(f"Message too short: '{message}'")
+                log_event(logger, "chat.message.too_short", logging.WARNING, question=message)
                 return "❌ **Error:** Pertanyaan terlalu pendek. Silakan masukkan pertanyaan yang lebih jelas."
             
             # Always use hybrid search
             strategy = SearchStrategy.HYBRID
             
+            # Attach the compact context window of earlier turns, if any
+            context = ()
+            if self.conversation_store and session_id:
+                context = self.conversation_store.get_context(session_id)
+            
             # Create query with validated message and hybrid strategy
-            query = SearchQuery(text=message, strategy=strategy)
-            logger.info(f"Created search query successfully for: '{message[:50]}...'")
+            query = SearchQuery(text=message, strategy=strategy, context=context)
+            log_event(logger, "chat.query", logging.DEBUG, context_turns=len(context))
             
-            response = await self.search_service.search(query)
+            started = time.perf_counter()
+            # Exact matches of frequently asked questions skip the backend entirely
+            response = self.faq.lookup(query) if self.faq else None
+            if response is None:
+                response = await self.search_service.search(query)
+            if self.query_log:
+                self.query_log.record(
+                    session_id, message, response, time.perf_counter() - started, followup=bool(query.context)
+                )
             
             if response.error:
-                return f"❌ **Error:** {response.error_message}"
+                return self.renderer.error(response.error_message)
+            
+            if self.suggestions and not response.is_not_available:
+                self.suggestions.add(message)
+            
+            if self.conversation_store and session_id:
+                self.conversation_store.add_turn(session_id, message, response.answer)
             
             # Always show sources
-            formatted_response = self._format_response(response, {'show_sources': True})
+            formatted_response = self._format_response(response, {'show_sources': True}, session_id)
             return formatted_response
             
         except ValueError as e:
@@ -155,7 +420,7 @@ class ChatbotService:
     async def process_batch_messages(self, batch_request: BatchRequest) -> BatchResponse:
         """Process batch messages and return batch response."""
         try:
-            logger.info(f"Processing batch request with {len(batch_request.questions)} questions")
+            log_event(logger, "chat.batch.start", questions=len(batch_request.questions))
             
             # Validate batch request
             if not batch_request.questions:
@@ -164,7 +429,7 @@ class ChatbotService:
             # Process through search service
             batch_response = await self.search_service.batch_search(batch_request)
             
-            logger.info(f"Batch processing completed in {batch_response.processing_time:.2f}s")
+            log_event(logger, "chat.batch.done", seconds=round(batch_response.processing_time, 3))
             return batch_response
             
         except Exception as e:
@@ -191,19 +456,15 @@ class ChatbotService:
                 processing_time=0.0
             )
     
-    def _format_response(self, response: SearchResponse, search_options: Optional[Dict[str, Any]] = None) -> str:
+    def continue_response(self, session_id: str) -> Optional[str]:
+        """Get the next part of the session's last truncated answer."""
+        return self.renderer.render_continuation(session_id)
+
+    def _format_response(
+        self,
+        response: SearchResponse,
+        search_options: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None
+    ) -> str:
         """Format search response for display - always show sources."""
-        answer = response.answer
-        
-        # Apply response formatting rules:
-        # Only show sources if the answer is not the standard "not available" message
-        standard_message = "Maaf, informasi mengenai hal tersebut tidak tersedia dalam data kami."
-        
-        # Always add sources if available and it's not the standard "not available" message
-        if response.source_urls and answer.strip() != standard_message:
-            sources_section = "\n\n**📚 Sumber:**\n"
-            for i, url in enumerate(response.source_urls[:3], 1):
-                sources_section += f"{i}. {url}\n"
-            answer += sources_section
-        
-        return answer
+        return self.renderer.render(response, session_id)
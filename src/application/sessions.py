@@ -0,0 +1,149 @@
+"""Application session lifecycle - Ownership of per-session resources."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, TypeVar
+
+from ..core import SessionResourceInterface
+from ..infrastructure.metrics import metrics
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class SessionState:
+    """Live resources owned by a single chat session."""
+    session_id: str
+    created_at: float = field(default_factory=time.monotonic)
+    last_active: float = field(default_factory=time.monotonic)
+    tasks: Set[asyncio.Task] = field(default_factory=set)
+    cleanups: List[Callable[[], Any]] = field(default_factory=list)
+
+
+class SessionRegistry:
+    """
+    Registry owning all per-session state.
+
+    Session-scoped stores are registered once and released together when a
+    session closes; in-flight backend calls started through ``run`` are
+    cancelled so a disconnected user does not keep the backend busy.
+    ``drain`` stops admitting new messages during shutdown.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[str, SessionState] = {}
+        self._stores: List[SessionResourceInterface] = []
+        self.accepting = True
+
+    def register_store(self, store: SessionResourceInterface) -> None:
+        """Register a store whose per-session state this registry releases."""
+        self._stores.append(store)
+
+    def open(self, session_id: str) -> SessionState:
+        """Get or create the state for a session."""
+        state = self._sessions.get(session_id)
+        if state is None:
+            state = SessionState(session_id=session_id)
+            self._sessions[session_id] = state
+        state.last_active = time.monotonic()
+        return state
+
+    def add_cleanup(self, session_id: str, callback: Callable[[], Any]) -> None:
+        """Register a callback (sync or async) to run when the session closes."""
+        self.open(session_id).cleanups.append(callback)
+
+    async def run(self, session_id: str, awaitable: Awaitable[T]) -> T:
+        """Run a backend call as a task owned by the session."""
+        state = self.open(session_id)
+        task = asyncio.ensure_future(awaitable)
+        state.tasks.add(task)
+        task.add_done_callback(state.tasks.discard)
+        return await task
+
+    async def cancel_inflight(self, session_id: str) -> int:
+        """Cancel the session's in-flight backend calls, keeping the session open."""
+        state = self._sessions.get(session_id)
+        if state is None:
+            return 0
+
+        pending = [task for task in state.tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            metrics.increment("sessions.requests_cancelled", len(pending))
+            logger.info(f"Cancelled {len(pending)} in-flight request(s)")
+        return len(pending)
+
+    async def close(self, session_id: str) -> None:
+        """Cancel in-flight work and release all state held for a session."""
+        await self.cancel_inflight(session_id)
+        state = self._sessions.pop(session_id, None)
+
+        if state is not None:
+            for callback in state.cleanups:
+                try:
+                    result = callback()
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    logger.warning(f"Session cleanup callback failed: {e}")
+
+        for store in self._stores:
+            try:
+                store.end_session(session_id)
+            except Exception as e:
+                logger.warning(f"Failed to release session state: {e}")
+
+    async def drain(self, timeout: float) -> int:
+        """Stop admitting messages and let in-flight ones finish; returns how many were cut off."""
+        self.accepting = False
+        pending = [task for state in self._sessions.values() for task in state.tasks if not task.done()]
+        if pending:
+            logger.info(f"Draining {len(pending)} in-flight request(s)")
+            _, pending = await asyncio.wait(pending, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            metrics.increment("sessions.requests_cancelled", len(pending))
+        return len(pending)
+
+    async def close_all(self) -> None:
+        """Close every live session."""
+        for session_id in list(self._sessions):
+            await self.close(session_id)
+
+    def session_count(self) -> int:
+        """Number of live sessions."""
+        return len(self._sessions)
+
+    def session_memory(self, session_id: str) -> int:
+        """Approximate bytes held for a session across registered stores."""
+        return sum(store.session_memory(session_id) for store in self._stores)
+
+    def stats(self) -> Dict[str, Any]:
+        """Live session counts and per-session memory."""
+        memory = {
+            session_id: self.session_memory(session_id)
+            for session_id in self._sessions
+        }
+        return {
+            "live_sessions": len(self._sessions),
+            "in_flight_requests": sum(
+                1 for state in self._sessions.values()
+                for task in state.tasks if not task.done()
+            ),
+            "total_memory_bytes": sum(memory.values()),
+            "max_session_memory_bytes": max(memory.values(), default=0),
+            "session_memory_bytes": memory
+        }
+
+    def get(self, session_id: str) -> Optional[SessionState]:
+        """Get the state of a live session."""
+        return self._sessions.get(session_id)
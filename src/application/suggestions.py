@@ -0,0 +1,105 @@
+"""Application suggestions - Type-ahead prefix index over popular questions."""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ..infrastructure import SuggestionConfig, normalize_question, redact_text
+
+
+class _Node:
+    """Trie node holding the most frequent completions below it."""
+
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.top: List[Tuple[int, str]] = []
+
+
+class SuggestionIndex:
+    """
+    Prefix trie over starter questions and popular asked questions.
+
+    Every node keeps its ``limit`` most frequent completions, so a lookup
+    is one walk down the prefix. Counts only grow, which lets ``add``
+    update the top lists along a single path. A question is only suggested
+    once it was asked ``min_count`` times and contains nothing ``mask``
+    redaction would hide, so one user's typing never leaks to another.
+    """
+
+    def __init__(self, config: Optional[SuggestionConfig] = None, seeds: Iterable[str] = ()):
+        self.config = config or SuggestionConfig()
+        self._root = _Node()
+        self._counts: Dict[str, int] = {}
+        self._display: Dict[str, str] = {}
+        for text in seeds:
+            self.add(text, self.config.min_count)
+
+    def __len__(self) -> int:
+        """Number of suggestable questions."""
+        return sum(1 for count in self._counts.values() if count >= self.config.min_count)
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Most frequent questions starting with ``prefix``."""
+        node = self._root
+        for char in normalize_question(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [self._display[key] for _, key in node.top[:limit or self.config.limit]]
+
+    def add(self, text: str, count: int = 1) -> None:
+        """Count a question (``count`` times)."""
+        key = normalize_question(text)
+        if not key or len(key) > self.config.max_chars or redact_text(key, "mask") != key:
+            return
+
+        total = self._counts.get(key, 0) + count
+        self._counts[key] = total
+        self._display.setdefault(key, " ".join(text.split()))
+        if total >= self.config.min_count:
+            self._promote(key, total)
+        elif len(self._counts) > self.config.max_tracked:
+            self._prune()
+
+    def add_counts(self, counts: Mapping[str, int]) -> None:
+        """Count many questions at once."""
+        for text, count in counts.items():
+            self.add(text, count)
+
+    def replace(self, other: 'SuggestionIndex') -> None:
+        """Take over the contents of an index built elsewhere (e.g. in a thread)."""
+        self._root, self._counts, self._display = other._root, other._counts, other._display
+
+    def _promote(self, key: str, count: int) -> None:
+        """Update the top lists on the path of ``key``."""
+        limit = self.config.limit
+        node = self._root
+        self._offer(node, key, count, limit)
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+            self._offer(node, key, count, limit)
+
+    @staticmethod
+    def _offer(node: _Node, key: str, count: int, limit: int) -> None:
+        """Insert or raise ``key`` in a node's top list."""
+        top = node.top
+        for i, (_, existing) in enumerate(top):
+            if existing == key:
+                del top[i]
+                break
+        else:
+            if len(top) >= limit and count <= top[-1][0]:
+                return
+        # Ties keep the earlier entry first
+        position = len(top)
+        while position and top[position - 1][0] < count:
+            position -= 1
+        top.insert(position, (count, key))
+        del top[limit:]
+
+    def _prune(self) -> None:
+        """Forget rarely asked questions that are not suggested yet."""
+        min_count = self.config.min_count
+        for key in [key for key, count in self._counts.items() if count < min_count]:
+            del self._counts[key]
+            self._display.pop(key, None)
@@ -17,6 +17,10 @@ class SearchUseCase:
         search_query = SearchQuery(text=query, strategy=strategy)
         return await self.search_service.search(search_query)
 
+    async def suggest(self, text: str) -> List[str]:
+        """Get type-ahead suggestions for partially typed text."""
+        return await self.search_service.get_search_suggestions(text)
+
 
 class BatchSearchUseCase:
     """Use case for batch search operations."""
@@ -39,10 +43,17 @@ class ChatUseCase:
         self, 
         message: str, 
         strategy: Optional[SearchStrategy] = None,
-        search_options: Optional[Dict[str, Any]] = None
+        search_options: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None
     ) -> str:
         """Process user message through chatbot service."""
-        return await self.chatbot_service.process_message(message, strategy, search_options)
+        return await self.chatbot_service.process_message(
+            message, strategy, search_options, session_id=session_id
+        )
+
+    def continue_response(self, session_id: str) -> Optional[str]:
+        """Get the next part of the session's last truncated answer."""
+        return self.chatbot_service.continue_response(session_id)
 
     async def process_batch_messages(self, batch_request: BatchRequest) -> BatchResponse:
         """Process batch messages through chatbot service."""
@@ -52,9 +63,17 @@ class ChatUseCase:
 class HealthCheckUseCase:
     """Use case for health check operations."""
     
-    def __init__(self, search_service: SearchServiceInterface):
+    def __init__(self, search_service: SearchServiceInterface, shared_state: Any = None):
         self.search_service = search_service
+        self.shared_state = shared_state
     
     async def execute(self) -> Dict[str, Any]:
         """Execute health check use case."""
-        return await self.search_service.health_check()
+        health = await self.search_service.health_check()
+        if self.shared_state is not None:
+            try:
+                # Workers heartbeat under workers.<id> while they are alive
+                health["cluster"] = {"live_workers": len(await self.shared_state.scan("workers."))}
+            except OSError as e:
+                health["cluster"] = {"error": str(e)}
+        return health
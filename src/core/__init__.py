@@ -2,11 +2,17 @@
 
 from .interfaces import (
     SearchServiceInterface,
+    SearchInterceptorInterface,
     ApiClientInterface, 
+    ClientCapabilities,
     CacheInterface,
+    SessionResourceInterface,
     ConfigInterface,
     FormatterInterface
 )
+from .deadline import Deadline, current_deadline, deadline_scope
+from .correlation import correlation_scope, current_correlation, new_request_id
+from .priority import INTERACTIVE, BULK, LANES, current_lane, lane_scope
 from .exceptions import (
     ChatbotException,
     SearchException,
@@ -16,10 +22,24 @@ from .exceptions import (
 
 __all__ = [
     'SearchServiceInterface',
+    'SearchInterceptorInterface',
     'ApiClientInterface', 
+    'ClientCapabilities',
     'CacheInterface',
+    'SessionResourceInterface',
     'ConfigInterface',
     'FormatterInterface',
+    'Deadline',
+    'current_deadline',
+    'deadline_scope',
+    'correlation_scope',
+    'current_correlation',
+    'new_request_id',
+    'INTERACTIVE',
+    'BULK',
+    'LANES',
+    'current_lane',
+    'lane_scope',
     'ChatbotException',
     'SearchException',
     'ConfigurationException',
@@ -0,0 +1,41 @@
+"""Core correlation ids - Tie log lines and backend calls to a session and request."""
+
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple
+
+
+_session_id: ContextVar[Optional[str]] = ContextVar("session_id", default=None)
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def new_request_id() -> str:
+    """Generate a short random request id."""
+    return uuid.uuid4().hex[:16]
+
+
+def current_correlation() -> Tuple[Optional[str], Optional[str]]:
+    """Get the (session_id, request_id) of the request being handled."""
+    return _session_id.get(), _request_id.get()
+
+
+@contextmanager
+def correlation_scope(
+    session_id: Optional[str] = None,
+    request_id: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Run a block under a session and request id.
+
+    The session id is inherited from an enclosing scope when not given; a
+    fresh request id is generated unless one is passed in.
+    """
+    request_id = request_id or new_request_id()
+    session_token = _session_id.set(session_id or _session_id.get())
+    request_token = _request_id.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _request_id.reset(request_token)
+        _session_id.reset(session_token)
@@ -1,8 +1,13 @@
 """Core interfaces - Abstract base classes and protocols."""
 
+import re
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Protocol
-from ..domain import SearchQuery, SearchResponse, StarterQuestion, BatchRequest, BatchResponse
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Protocol, AsyncIterator, Awaitable, Callable, Sequence, Tuple
+from ..domain import SearchQuery, SearchResponse, StarterQuestion, BatchRequest, BatchResponse, BatchResult, ConversationTurn, ResponseStatus
+from .exceptions import ApiException
+
+_TOKEN = re.compile(r"\s*\S+")
 
 
 class SearchServiceInterface(ABC):
@@ -29,11 +34,59 @@ class SearchServiceInterface(ABC):
         pass
 
 
+class SearchInterceptorInterface(ABC):
+    """
+    Interface for a stage of the search pipeline.
+
+    Each method receives the request and the next stage to call. Stages
+    that leave a method as the pass-through default, or report
+    ``enabled`` False, are left out of the chain entirely.
+    """
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the stage currently takes part in the pipeline."""
+        return True
+
+    async def search(
+        self, query: SearchQuery, call_next: Callable[[SearchQuery], Awaitable[SearchResponse]]
+    ) -> SearchResponse:
+        """Intercept a single search."""
+        return await call_next(query)
+
+    async def batch_search(
+        self, batch_request: BatchRequest, call_next: Callable[[BatchRequest], Awaitable[BatchResponse]]
+    ) -> BatchResponse:
+        """Intercept a batch search."""
+        return await call_next(batch_request)
+
+
+@dataclass(frozen=True)
+class ClientCapabilities:
+    """What an API client does natively rather than by emulation."""
+    streaming: bool = False
+    batch_streaming: bool = False
+    conversation_context: bool = False
+
+
 class ApiClientInterface(ABC):
-    """Interface for API clients."""
+    """
+    Interface for API clients.
+
+    ``stream_search`` and ``stream_batch`` have emulated defaults built on
+    ``search`` and ``batch_search``; ``capabilities`` tells callers and
+    decorators which ones a client implements natively.
+    """
+
+    capabilities = ClientCapabilities()
     
     @abstractmethod
-    async def search(self, query: str) -> SearchResponse:
+    async def search(
+        self,
+        query: str,
+        use_hybrid: bool = True,
+        context: Sequence[ConversationTurn] = ()
+    ) -> SearchResponse:
         """Perform search via API."""
         pass
     
@@ -43,10 +96,33 @@ class ApiClientInterface(ABC):
         pass
     
     @abstractmethod
-    def health_check(self) -> bool:
+    async def health_check(self) -> bool:
         """Check API health."""
         pass
 
+    async def stream_search(
+        self,
+        query: str,
+        use_hybrid: bool = True,
+        context: Sequence[ConversationTurn] = ()
+    ) -> AsyncIterator[str]:
+        """Yield the answer token by token; a failed search raises ApiException."""
+        response = await self.search(query, use_hybrid, context)
+        if response.status == ResponseStatus.ERROR:
+            raise ApiException(response.error_message or "Pencarian gagal.")
+        for match in _TOKEN.finditer(response.answer):
+            yield match.group()
+
+    async def stream_batch(
+        self,
+        batch_request: BatchRequest,
+        chunk_size: Optional[int] = None
+    ) -> AsyncIterator[Tuple[int, BatchResult]]:
+        """Yield ``(question index, result)`` pairs as results become available."""
+        response = await self.batch_search(batch_request)
+        for index, result in enumerate(response.results):
+            yield index, result
+
 
 class CacheInterface(ABC):
     """Interface for caching implementations."""
@@ -67,6 +143,20 @@ class CacheInterface(ABC):
         pass
 
 
+class SessionResourceInterface(ABC):
+    """Interface for stores holding per-session state."""
+    
+    @abstractmethod
+    def end_session(self, session_id: str) -> bool:
+        """Release all state held for a session."""
+        pass
+    
+    @abstractmethod
+    def session_memory(self, session_id: str) -> int:
+        """Approximate bytes held for a session."""
+        pass
+
+
 class ConfigInterface(Protocol):
     """Interface for configuration objects."""
     
@@ -0,0 +1,29 @@
+"""Core priority lanes - Tell the backend scheduler what kind of work a call is."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+LANES = (INTERACTIVE, BULK)
+
+_lane: ContextVar[str] = ContextVar("lane", default=INTERACTIVE)
+
+
+def current_lane() -> str:
+    """Get the lane of the work being done (interactive unless marked otherwise)."""
+    return _lane.get()
+
+
+@contextmanager
+def lane_scope(lane: str) -> Iterator[str]:
+    """Run a block, and every backend call it makes, in the given lane."""
+    if lane not in LANES:
+        raise ValueError(f"Unknown lane: {lane!r}")
+    token = _lane.set(lane)
+    try:
+        yield lane
+    finally:
+        _lane.reset(token)
@@ -1,7 +1,7 @@
 """Domain layer - Business entities and value objects."""
 
-from .entities import SearchResponse, ChatProfile
-from .value_objects import SearchQuery, SearchResult, StarterQuestion, BatchRequest, BatchResult, BatchResponse
+from .entities import SearchResponse, ChatProfile, NOT_AVAILABLE_MESSAGE
+from .value_objects import SearchQuery, SearchResult, StarterQuestion, BatchRequest, BatchResult, BatchResponse, ConversationTurn
 from .enums import SearchStrategy, MessageType, ResponseStatus
 
 __all__ = [
@@ -13,7 +13,9 @@ __all__ = [
     'BatchRequest',
     'BatchResult', 
     'BatchResponse',
+    'ConversationTurn',
     'SearchStrategy',
     'MessageType',
-    'ResponseStatus'
+    'ResponseStatus',
+    'NOT_AVAILABLE_MESSAGE'
 ]
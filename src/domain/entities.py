@@ -7,10 +7,14 @@ from .value_objects import SearchResult, SearchQuery
 from .enums import ResponseStatus, SearchStrategy
 
 
+# Standard answer when the knowledge base has nothing on a question
+NOT_AVAILABLE_MESSAGE = "Maaf, informasi mengenai hal tersebut tidak tersedia dalam data kami."
+
+
 @dataclass
 class SearchResponse:
     """Entity representing a complete search response."""
-    query: SearchQuery
+    query: Optional[SearchQuery]
     answer: str
     results: List[SearchResult] = field(default_factory=list)
     status: ResponseStatus = ResponseStatus.SUCCESS
@@ -22,12 +26,24 @@ class SearchResponse:
     search_type: Optional[str] = None
     source_count: int = 0
     created_at: datetime = field(default_factory=datetime.now)
+    # Error came from the backend being unreachable, slow or failing (network, timeout, 5xx)
+    backend_unavailable: bool = False
     
     @property
     def error(self) -> bool:
         """Check if response has error."""
         return self.status == ResponseStatus.ERROR
     
+    @property
+    def is_not_available(self) -> bool:
+        """Check if the answer is the standard "not available" message."""
+        return self.answer.strip() == NOT_AVAILABLE_MESSAGE
+    
+    @property
+    def shows_sources(self) -> bool:
+        """Sources are shown unless the answer says nothing was found."""
+        return bool(self.source_urls) and not self.is_not_available
+    
     def add_result(self, result: SearchResult):
         """Add a search result."""
         self.results.append(result)
@@ -1,16 +1,24 @@
 """Domain value objects - Immutable value containers."""
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from .enums import SearchStrategy, ResponseStatus
 
 
+@dataclass(frozen=True)
+class ConversationTurn:
+    """Value object representing one question/answer exchange."""
+    question: str
+    answer: str
+
+
 @dataclass(frozen=True)
 class SearchQuery:
     """Value object representing a search query."""
     text: str
     strategy: Optional[SearchStrategy] = None
     max_results: int = 10
+    context: Tuple[ConversationTurn, ...] = ()
     
     def __post_init__(self):
         # Robust validation for text input
@@ -34,6 +42,8 @@ class StarterQuestion:
     content: str
     icon: str
     category: str
+    label: str = ""
+    weight: float = 1.0
 
 
 @dataclass(frozen=True)
@@ -61,6 +71,7 @@ class BatchResult:
     cached: bool
     cache_type: Optional[str]
     search_type: Optional[str]
+    backend_unavailable: bool = False
 
 
 @dataclass(frozen=True)
@@ -1,12 +1,67 @@
 """Infrastructure layer - External dependencies and implementations."""
 
 from .api import RAGApiClient
+from .batching import MicroBatcher
 from .cache import SimpleCache
-from .config import ApiConfig, SearchConfig
+from .config import ApiConfig, SearchConfig, EnrichmentConfig, ConversationConfig, LoggingConfig, QueryLogConfig, RenderConfig, StarterConfig, FallbackConfig, SuggestionConfig, FaqConfig, SchedulerConfig, PipelineConfig, WorkerConfig
+from .conversation import ConversationStore
+from .endpoints import Endpoint, EndpointPool
+from .faq import FaqEntry, FaqStore
+from .fallback import FallbackIndex, FallbackHit, build_index
+from .logs import configure_logging, shutdown_logging, log_event, redact_text
+from .metrics import MetricsRegistry, LatencyWindow, metrics
+from .querylog import QueryLogWriter, read_query_log, count_questions, normalize_question
+from .scheduling import LaneScheduler
+from .shared import LocalState, SharedStateServer, SharedStateClient
+from .settings import Settings, SettingsManager
+from .titles import PersistentTitleCache, PageTitleFetcher
+from .urls import UrlNormalizer, normalize_url
 
 __all__ = [
     'ApiConfig',
     'RAGApiClient', 
+    'MicroBatcher',
     'SimpleCache',
-    'SearchConfig'
+    'SearchConfig',
+    'EnrichmentConfig',
+    'ConversationConfig',
+    'LoggingConfig',
+    'QueryLogConfig',
+    'RenderConfig',
+    'StarterConfig',
+    'FallbackConfig',
+    'SuggestionConfig',
+    'FaqConfig',
+    'SchedulerConfig',
+    'LaneScheduler',
+    'PipelineConfig',
+    'WorkerConfig',
+    'LocalState',
+    'SharedStateServer',
+    'SharedStateClient',
+    'FaqEntry',
+    'FaqStore',
+    'FallbackIndex',
+    'FallbackHit',
+    'build_index',
+    'QueryLogWriter',
+    'read_query_log',
+    'count_questions',
+    'normalize_question',
+    'ConversationStore',
+    'Settings',
+    'SettingsManager',
+    'PersistentTitleCache',
+    'PageTitleFetcher',
+    'Endpoint',
+    'EndpointPool',
+    'MetricsRegistry',
+    'LatencyWindow',
+    'metrics',
+    'configure_logging',
+    'shutdown_logging',
+    'log_event',
+    'redact_text',
+    'UrlNormalizer',
+    'normalize_url'
 ]
@@ -2,19 +2,42 @@
 
 import os
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Set, Callable, Awaitable, AsyncIterator, Tuple
 import asyncio
 import time
 import httpx
-from urllib.parse import urlparse
 
-from ..core import ApiClientInterface, ApiException
-from ..domain import SearchResponse, SearchQuery, SearchResult, ResponseStatus, BatchRequest, BatchResponse, BatchResult
-from .config import ApiConfig
+from ..core import ApiClientInterface, ApiException, ClientCapabilities, Deadline, current_correlation, current_deadline
+from ..domain import NOT_AVAILABLE_MESSAGE, SearchResponse, SearchQuery, SearchResult, ResponseStatus, BatchRequest, BatchResponse, BatchResult, ConversationTurn
+from .compression import RequestBody, accept_encoding, resolve_encoding
+from .config import ApiConfig, SchedulerConfig
+from .endpoints import EndpointPool
+from .metrics import metrics
+from .scheduling import LaneScheduler
+from .urls import UrlNormalizer, url_normalizer
 
 
 logger = logging.getLogger(__name__)
 
+# Error bodies of backends that could not decode a compressed request (e.g. FastAPI's
+# "JSON decode error", Starlette's "error parsing the body")
+_UNDECODABLE_BODY = ("decode", "decompress", "content-encoding", "json_invalid", "parsing the body")
+
+
+def _unavailable(error: ApiException) -> bool:
+    """Check if a request failed on the network, a timeout or a 5xx (not the request's fault)."""
+    return error.status_code is None or error.status_code >= 500
+
+
+def _rejects_encoding(response: httpx.Response) -> bool:
+    """Check if a response says the compressed request body could not be read."""
+    if response.status_code == 415:
+        return True
+    if response.status_code not in (400, 422):
+        return False
+    text = response.text.lower()
+    return any(marker in text for marker in _UNDECODABLE_BODY)
+
 
 class RAGApiClient(ApiClientInterface):
     """
@@ -24,17 +47,42 @@ class RAGApiClient(ApiClientInterface):
     configurable parameters, and robust error handling.
     """
 
-    def __init__(self, config: Optional[ApiConfig] = None):
+    # The backend answers in one piece; stream_search is emulated
+    capabilities = ClientCapabilities(streaming=False, batch_streaming=True, conversation_context=True)
+
+    def __init__(
+        self,
+        config: Optional[ApiConfig] = None,
+        normalizer: Optional[UrlNormalizer] = None,
+        scheduler_config: Optional[SchedulerConfig] = None
+    ):
         """Initialize the enhanced API client."""
         if config is None:
             config = ApiConfig.from_env()
 
         self.config = config
-        self._ask_endpoint = f"{self.config.base_url}/api/v1/ask"
-        self._batch_endpoint = f"{self.config.base_url}/api/v1/batch"
-        self._health_endpoint = f"{self.config.base_url}/api/v1/health"
-
-    async def search(self, query: str, use_hybrid: bool = True) -> SearchResponse:
+        self._url_normalizer = normalizer or url_normalizer
+        self.pool = EndpointPool(
+            self.config.endpoints,
+            failure_threshold=self.config.endpoint_failure_threshold,
+            ejection_time=self.config.endpoint_ejection_time
+        )
+        self._ask_path = "/api/v1/ask"
+        self._batch_path = "/api/v1/batch"
+        self._health_path = "/api/v1/health"
+        self._hedge_tokens = 0.0
+        self._client: Optional[httpx.AsyncClient] = None
+        # Endpoints that rejected a compressed request body
+        self._plain_endpoints: Set[str] = set()
+        self.scheduler = LaneScheduler(self.config.max_concurrent_requests, scheduler_config)
+
+    async def search(
+        self,
+        query: str,
+        use_hybrid: bool = True,
+        context: Sequence[ConversationTurn] = (),
+        use_cache: bool = True
+    ) -> SearchResponse:
         """Perform search via API using backend format."""
         # Sanitize input
         sanitized_query = self._sanitize_input(query)
@@ -44,62 +92,84 @@ class RAGApiClient(ApiClientInterface):
         # Create search query object
         search_query = SearchQuery(text=sanitized_query)
 
+        # Retries share the end-to-end deadline of the user message
+        deadline = current_deadline()
+        start = time.monotonic()
+
         # Attempt request with retries
-        for attempt in range(self.config.max_retries):
-            try:
-                response_data = await self._make_search_request(sanitized_query, use_hybrid)
-                return self._create_success_response(search_query, response_data)
-
-            except ApiException as e:
-                if attempt == self.config.max_retries - 1:
-                    return self._create_error_response(e.args[0])
-                await asyncio.sleep(self.config.retry_delay * (attempt + 1))
-
-            except Exception as e:
-                if attempt == self.config.max_retries - 1:
-                    return self._create_error_response(
-                        f"Terjadi kesalahan yang tidak terduga: {str(e)}"
+        try:
+            for attempt in range(self.config.max_retries):
+                try:
+                    response_data = await self._hedged(
+                        lambda: self._make_search_request(sanitized_query, use_hybrid, context, deadline, use_cache)
                     )
-                await asyncio.sleep(self.config.retry_delay * (attempt + 1))
+                    metrics.observe("api.search", time.monotonic() - start)
+                    return self._create_success_response(search_query, response_data)
 
-        return self._create_error_response(
-            "Gagal terhubung setelah beberapa percobaan."
-        )
+                except ApiException as e:
+                    if not self._can_retry(attempt, deadline):
+                        return self._create_error_response(e.args[0], search_query, _unavailable(e))
+                    await asyncio.sleep(self._backoff(attempt))
+
+                except Exception as e:
+                    if not self._can_retry(attempt, deadline):
+                        return self._create_error_response(
+                            f"Terjadi kesalahan yang tidak terduga: {str(e)}",
+                            search_query
+                        )
+                    await asyncio.sleep(self._backoff(attempt))
+
+            return self._create_error_response(
+                "Gagal terhubung setelah beberapa percobaan.",
+                search_query,
+                unavailable=True
+            )
+
+        except asyncio.CancelledError:
+            # Caller went away (stop/disconnect); the HTTP call is aborted with it
+            metrics.increment("api.search.cancelled")
+            raise
 
     async def batch_search(self, batch_request: BatchRequest) -> BatchResponse:
         """Perform batch search via API."""
         start_time = time.time()
+        deadline = current_deadline()
         
         try:
             # Make batch request with retries
             for attempt in range(self.config.max_retries):
                 try:
-                    response_data = await self._make_batch_request(batch_request)
+                    response_data = await self._make_batch_request(batch_request, deadline)
                     processing_time = time.time() - start_time
                     return self._create_batch_response(response_data, processing_time)
                 
                 except ApiException as e:
-                    if attempt == self.config.max_retries - 1:
+                    if not self._can_retry(attempt, deadline):
                         return self._create_batch_error_response(
-                            batch_request, e.args[0], time.time() - start_time
+                            batch_request, e.args[0], time.time() - start_time, _unavailable(e)
                         )
-                    await asyncio.sleep(self.config.retry_delay * (attempt + 1))
+                    await asyncio.sleep(self._backoff(attempt))
                 
                 except Exception as e:
-                    if attempt == self.config.max_retries - 1:
+                    if not self._can_retry(attempt, deadline):
                         return self._create_batch_error_response(
                             batch_request, 
                             f"Terjadi kesalahan yang tidak terduga: {str(e)}", 
                             time.time() - start_time
                         )
-                    await asyncio.sleep(self.config.retry_delay * (attempt + 1))
+                    await asyncio.sleep(self._backoff(attempt))
             
             return self._create_batch_error_response(
                 batch_request, 
                 "Gagal terhubung setelah beberapa percobaan.", 
-                time.time() - start_time
+                time.time() - start_time,
+                unavailable=True
             )
         
+        except asyncio.CancelledError:
+            metrics.increment("api.batch.cancelled")
+            raise
+
         except Exception as e:
             processing_time = time.time() - start_time
             return self._create_batch_error_response(
@@ -108,45 +178,79 @@ class RAGApiClient(ApiClientInterface):
                 processing_time
             )
 
-    def health_check(self) -> bool:
-        """Check API health."""
-        try:
-            import requests
-            response = requests.get(
-                self._health_endpoint, 
-                timeout=5
+    async def stream_batch(
+        self,
+        batch_request: BatchRequest,
+        chunk_size: Optional[int] = None
+    ) -> AsyncIterator[Tuple[int, BatchResult]]:
+        """
+        Yield ``(question index, result)`` pairs as each chunk of the batch completes.
+
+        Chunks are sent concurrently (bounded by the scheduler), so the
+        first results arrive after one chunk rather than the whole batch.
+        Closing the iterator early cancels the chunks still running.
+        """
+        questions = batch_request.questions
+        size = chunk_size or len(questions)
+
+        async def run_chunk(offset: int) -> Tuple[int, BatchResponse]:
+            chunk = BatchRequest(
+                questions=questions[offset:offset + size],
+                use_cache=batch_request.use_cache,
+                use_hybrid=batch_request.use_hybrid
             )
-            return response.status_code == 200
-        except:
-            return False
+            return offset, await self.batch_search(chunk)
 
-    async def _make_search_request(self, question: str, use_hybrid: bool = True) -> Dict[str, Any]:
+        tasks = [asyncio.ensure_future(run_chunk(offset)) for offset in range(0, len(questions), size)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                offset, response = await next_done
+                for index, result in enumerate(response.results):
+                    yield offset + index, result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def health_check(self) -> bool:
+        """Check API health of every endpoint; healthy if any replica is up."""
+        client = self._get_client()
+
+        async def probe(endpoint) -> bool:
+            try:
+                response = await client.get(f"{endpoint.base_url}{self._health_path}", timeout=5.0)
+                healthy = response.status_code == 200
+            except httpx.HTTPError:
+                healthy = False
+            self.pool.mark_health(endpoint, healthy)
+            return healthy
+
+        return any(await asyncio.gather(*(probe(endpoint) for endpoint in self.pool.endpoints)))
+
+    async def _make_search_request(
+        self,
+        question: str,
+        use_hybrid: bool = True,
+        context: Sequence[ConversationTurn] = (),
+        deadline: Optional[Deadline] = None,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
         """Make HTTP request to search API using backend format."""
         payload = {
             "question": question,
-            "use_cache": True,
+            "use_cache": use_cache,
             "use_hybrid": use_hybrid
         }
+        if context:
+            # Compact context window of earlier turns for follow-up questions
+            payload["history"] = [
+                {"question": turn.question, "answer": turn.answer}
+                for turn in context
+            ]
 
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            try:
-                response = await client.post(
-                    self._ask_endpoint,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                )
-                response.raise_for_status()
-                return response.json()
-
-            except httpx.HTTPStatusError as e:
-                raise ApiException(
-                    f"HTTP error {e.response.status_code}: {e.response.text}",
-                    e.response.status_code
-                )
-            except httpx.RequestError as e:
-                raise ApiException(f"Network error: {str(e)}")
+        return await self._post(self._ask_path, payload, "api.ask", self.config.timeout, deadline)
 
-    async def _make_batch_request(self, batch_request: BatchRequest) -> Dict[str, Any]:
+    async def _make_batch_request(self, batch_request: BatchRequest, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Make HTTP request to batch API."""
         payload = {
             "questions": batch_request.questions,
@@ -154,23 +258,208 @@ class RAGApiClient(ApiClientInterface):
             "use_hybrid": batch_request.use_hybrid
         }
 
-        async with httpx.AsyncClient(timeout=self.config.timeout * 2) as client:  # Extended timeout for batch
-            try:
+        # Extended timeout ceiling for batch
+        return await self._post(self._batch_path, payload, "api.batch", self.config.timeout * 2, deadline)
+
+    async def _post(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        metric: str,
+        max_timeout: float,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """POST a JSON payload within the adaptive timeout and remaining deadline."""
+        if deadline is not None and deadline.expired:
+            metrics.increment(f"{metric}.deadline_exceeded")
+            raise ApiException("Batas waktu permintaan terlampaui.")
+
+        headers = {
+            "Content-Type": "application/json",
+            "Accept-Encoding": accept_encoding() if self.config.response_compression else "identity"
+        }
+        _, request_id = current_correlation()
+        if request_id:
+            headers["X-Request-ID"] = request_id
+        if deadline is not None:
+            # Let the backend drop work the frontend will no longer wait for
+            headers["X-Request-Deadline-Ms"] = str(int(deadline.remaining() * 1000))
+
+        timeout = self._request_timeout(metric, max_timeout, deadline)
+        client = self._get_client()
+        body = RequestBody(
+            payload, resolve_encoding(self.config.request_compression), self.config.compression_min_bytes
+        )
+
+        try:
+            async with asyncio.timeout(deadline.remaining() if deadline else None):
+                async with self.scheduler.slot():
+                    return await self._send(client, path, body, headers, timeout, metric)
+        except TimeoutError:
+            metrics.increment(f"{metric}.deadline_exceeded")
+            raise ApiException("Batas waktu permintaan terlampaui.")
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        body: RequestBody,
+        headers: Dict[str, str],
+        timeout: httpx.Timeout,
+        metric: str
+    ) -> Dict[str, Any]:
+        """Send one request to the best endpoint and record its outcome."""
+        endpoint = self.pool.acquire()
+        failed = True
+        start = time.monotonic()
+        url = f"{endpoint.base_url}{path}"
+
+        try:
+            content, encoding = body.encoded()
+            if encoding and endpoint.base_url not in self._plain_endpoints:
                 response = await client.post(
-                    self._batch_endpoint,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
+                    url, content=content, headers={**headers, "Content-Encoding": encoding}, timeout=timeout
                 )
-                response.raise_for_status()
-                return response.json()
-
-            except httpx.HTTPStatusError as e:
-                raise ApiException(
-                    f"HTTP error {e.response.status_code}: {e.response.text}",
-                    e.response.status_code
+                if _rejects_encoding(response):
+                    # The backend cannot decode compressed bodies; learn it once per endpoint
+                    self._plain_endpoints.add(endpoint.base_url)
+                    logger.warning(f"{endpoint.base_url} rejects compressed requests; sending them uncompressed")
+                    response = await client.post(url, content=body.raw, headers=headers, timeout=timeout)
+                    content = body.raw
+            else:
+                content = body.raw
+                response = await client.post(url, content=content, headers=headers, timeout=timeout)
+
+            metrics.increment(f"{metric}.bytes_sent", len(content))
+            metrics.increment(f"{metric}.bytes_received", response.num_bytes_downloaded)
+            # Client errors are the request's fault, not the replica's
+            failed = response.status_code >= 500
+            response.raise_for_status()
+            metrics.observe(metric, time.monotonic() - start)
+            return response.json()
+
+        except httpx.HTTPStatusError as e:
+            raise ApiException(
+                f"HTTP error {e.response.status_code}: {e.response.text}",
+                e.response.status_code
+            )
+        except httpx.TimeoutException as e:
+            metrics.increment(f"{metric}.timeout")
+            raise ApiException(f"Timeout error: {type(e).__name__}")
+        except httpx.RequestError as e:
+            raise ApiException(f"Network error: {str(e)}")
+        except asyncio.CancelledError:
+            # Cancelled (hedge loser, deadline or caller gone) says nothing about the replica
+            failed = False
+            raise
+        finally:
+            self.pool.release(endpoint, time.monotonic() - start, failed=failed)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the pooled HTTP client shared by all requests."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections
                 )
-            except httpx.RequestError as e:
-                raise ApiException(f"Network error: {str(e)}")
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _hedged(self, make_request: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Run a request, firing one identical backup if it is slow.
+        
+        The backup is sent once the primary has been outstanding longer than
+        the configured percentile of recent latency. The first successful
+        reply wins and the other request is cancelled. Backups are limited
+        to ``hedge_budget`` of the request volume.
+        """
+        hedge_delay = self._hedge_delay()
+        if hedge_delay is None:
+            return await make_request()
+
+        self._hedge_tokens = min(10.0, self._hedge_tokens + self.config.hedge_budget)
+        primary = asyncio.ensure_future(make_request())
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+            if done or self._hedge_tokens < 1.0:
+                return await primary
+
+            self._hedge_tokens -= 1.0
+            metrics.increment("api.ask.hedged")
+            hedge = asyncio.ensure_future(make_request())
+
+            pending = {primary, hedge}
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Both may finish in the same wake-up; any success wins over a failure
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    if winner is hedge:
+                        metrics.increment("api.ask.hedge_won")
+                    return winner.result()
+                # A failed request only loses if the other one can still succeed
+                if not pending:
+                    return done.pop().result()
+
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Delay before hedging, or None when hedging is off or not warmed up."""
+        if not self.config.hedge_enabled:
+            return None
+        window = metrics.latency("api.ask")
+        if len(window) < self.config.timeout_min_samples:
+            return None
+        return window.percentile(self.config.hedge_percentile)
+
+    def _request_timeout(self, metric: str, max_timeout: float, deadline: Optional[Deadline]) -> httpx.Timeout:
+        """
+        Build per-phase timeouts for one attempt.
+        
+        The read timeout follows the observed p99 latency of the endpoint once
+        enough samples exist, bounded by ``max_timeout`` and the deadline.
+        """
+        read_timeout = max_timeout
+        window = metrics.latency(metric)
+        if len(window) >= self.config.timeout_min_samples:
+            p99 = window.percentile(99)
+            read_timeout = min(
+                max_timeout,
+                max(self.config.min_timeout, p99 * self.config.timeout_p99_multiplier)
+            )
+        if deadline is not None:
+            read_timeout = min(read_timeout, deadline.remaining())
+
+        return httpx.Timeout(
+            connect=min(self.config.connect_timeout, read_timeout),
+            read=read_timeout,
+            write=min(self.config.connect_timeout, read_timeout),
+            pool=self.config.pool_timeout
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        """Delay before the next retry."""
+        return self.config.retry_delay * (attempt + 1)
+
+    def _can_retry(self, attempt: int, deadline: Optional[Deadline]) -> bool:
+        """Check if another attempt fits in the retry and deadline budget."""
+        if attempt >= self.config.max_retries - 1:
+            return False
+        if deadline is None:
+            return True
+        return deadline.remaining() - self._backoff(attempt) >= self.config.min_timeout
 
     def _sanitize_input(self, text: str) -> str:
         """Sanitize user input."""
@@ -178,14 +467,19 @@ class RAGApiClient(ApiClientInterface):
             return ""
         return text.strip()
 
-    def _create_error_response(self, error_message: str) -> SearchResponse:
+    def _create_error_response(
+        self,
+        error_message: str,
+        query: Optional[SearchQuery] = None,
+        unavailable: bool = False
+    ) -> SearchResponse:
         """Create error response."""
-        dummy_query = SearchQuery(text="")
         return SearchResponse(
-            query=dummy_query,
+            query=query,
             answer="",
             status=ResponseStatus.ERROR,
-            error_message=error_message
+            error_message=error_message,
+            backend_unavailable=unavailable
         )
 
     def _create_batch_response(self, data: Dict[str, Any], processing_time: float) -> BatchResponse:
@@ -215,7 +509,13 @@ class RAGApiClient(ApiClientInterface):
             processing_time=processing_time
         )
 
-    def _create_batch_error_response(self, batch_request: BatchRequest, error_message: str, processing_time: float) -> BatchResponse:
+    def _create_batch_error_response(
+        self,
+        batch_request: BatchRequest,
+        error_message: str,
+        processing_time: float,
+        unavailable: bool = False
+    ) -> BatchResponse:
         """Create error batch response."""
         error_results = []
         
@@ -228,7 +528,8 @@ class RAGApiClient(ApiClientInterface):
                 response_time=0.0,
                 cached=False,
                 cache_type=None,
-                search_type=None
+                search_type=None,
+                backend_unavailable=unavailable
             )
             error_results.append(error_result)
         
@@ -238,6 +539,25 @@ class RAGApiClient(ApiClientInterface):
             processing_time=processing_time
         )
 
+    def response_from_batch_result(self, question: str, result: BatchResult) -> SearchResponse:
+        """Convert one batch result into the response /ask would have given."""
+        query = SearchQuery(text=question)
+        if result.status == "error":
+            return self._create_error_response(result.answer.removeprefix("Error: "), query, result.backend_unavailable)
+
+        answer, source_urls = self._apply_response_rules(result.answer, result.source_urls)
+        return SearchResponse(
+            query=query,
+            answer=answer,
+            status=ResponseStatus.SUCCESS,
+            source_urls=source_urls,
+            response_time=result.response_time,
+            cached=result.cached,
+            cache_type=result.cache_type,
+            search_type=result.search_type,
+            source_count=len(source_urls) if answer == NOT_AVAILABLE_MESSAGE else result.source_count
+        )
+
     def _apply_response_rules(self, answer: str, source_urls: List[str]) -> tuple[str, List[str]]:
         """
         Apply response handling rules as specified:
@@ -247,12 +567,11 @@ class RAGApiClient(ApiClientInterface):
         """
         # Check if answer is empty or only whitespace
         if not answer or answer.strip() == "":
-            return "Maaf, informasi mengenai hal tersebut tidak tersedia dalam data kami.", []
+            return NOT_AVAILABLE_MESSAGE, []
         
         # Check if answer is already the standard "not available" message
-        standard_message = "Maaf, informasi mengenai hal tersebut tidak tersedia dalam data kami."
-        if answer.strip() == standard_message:
-            return standard_message, []
+        if answer.strip() == NOT_AVAILABLE_MESSAGE:
+            return NOT_AVAILABLE_MESSAGE, []
         
         # For all other responses, normalize and deduplicate URLs
         normalized_urls = self._normalize_and_deduplicate_urls(source_urls)
@@ -296,91 +615,8 @@ class RAGApiClient(ApiClientInterface):
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL by removing www and trailing slash."""
-        if not url or not isinstance(url, str):
-            return url
-            
-        # Clean up the URL first
-        url = url.strip()
-        
-        try:
-            # Add scheme if missing
-            if not url.startswith(('http://', 'https://')):
-                if url.startswith('www.'):
-                    url = 'https://' + url
-                elif '.' in url:
-                    url = 'https://' + url
-                else:
-                    return url  # Return as-is if it doesn't look like a URL
-            
-            # Parse the URL
-            parsed = urlparse(url)
-            
-            # Get hostname and remove www
-            hostname = parsed.hostname
-            if not hostname:
-                return url  # Return original if hostname is invalid
-                
-            if hostname.startswith('www.'):
-                hostname = hostname[4:]
-            
-            # Build normalized URL
-            normalized_url = f"{parsed.scheme}://{hostname}"
-            
-            # Add port if it exists and is not default
-            if parsed.port and parsed.port not in [80, 443]:
-                normalized_url += f":{parsed.port}"
-            
-            # Add path if it exists and is not just '/'
-            if parsed.path and parsed.path != '/':
-                # Remove trailing slash from path
-                path = parsed.path.rstrip('/')
-                if path:  # Only add if path is not empty after stripping
-                    normalized_url += path
-            
-            # Add query and fragment if they exist
-            if parsed.query:
-                normalized_url += f"?{parsed.query}"
-            if parsed.fragment:
-                normalized_url += f"#{parsed.fragment}"
-                
-            return normalized_url
-            
-        except Exception:
-            # If URL parsing fails, return original URL with basic cleanup
-            clean_url = url
-            
-            # Remove www
-            if 'www.' in clean_url:
-                clean_url = clean_url.replace('://www.', '://').replace('www.', '')
-            
-            # Handle trailing slash carefully
-            if clean_url.endswith('/') and '?' not in clean_url and '#' not in clean_url:
-                # Only remove trailing slash if there are no query params or fragments
-                # and if it's not just the root path
-                if clean_url.count('/') > 2:  # More than just protocol://domain/
-                    clean_url = clean_url.rstrip('/')
-            
-            return clean_url
+        return self._url_normalizer.normalize(url)
 
     def _normalize_and_deduplicate_urls(self, urls: List[str]) -> List[str]:
         """Normalize and remove duplicate URLs."""
-        if not urls:
-            return []
-            
-        seen = set()
-        unique_urls = []
-        
-        for url in urls:
-            if not url or not isinstance(url, str):
-                continue
-                
-            normalized = self._normalize_url(url)
-            
-            # Convert to lowercase for comparison to catch case differences
-            normalized_lower = normalized.lower()
-            
-            if normalized_lower not in seen:
-                seen.add(normalized_lower)
-                unique_urls.append(normalized)  # Keep original case for display
-        
-        return unique_urls
+        return self._url_normalizer.normalize_many(urls)
@@ -0,0 +1,182 @@
+"""Infrastructure micro-batching - Coalesce concurrent single questions into batch calls."""
+
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import logging
+import time
+from typing import Dict, List, Optional, Set
+
+from ..core import Deadline, current_deadline, deadline_scope
+from ..domain import SearchQuery, SearchResponse, ResponseStatus, BatchRequest
+from .api import RAGApiClient
+from .config import SearchConfig
+from .metrics import metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Window:
+    """Questions collected for one batch call and the callers waiting on them."""
+
+    __slots__ = ("waiters", "deadlines", "task")
+
+    def __init__(self):
+        self.waiters: Dict[str, List[asyncio.Future]] = {}
+        self.deadlines: Dict[asyncio.Future, Optional[Deadline]] = {}
+        self.task: Optional[asyncio.Task] = None
+
+
+class MicroBatcher:
+    """
+    Sends concurrent single questions as one ``/api/v1/batch`` request.
+
+    A question arriving more than ``micro_batch_max_wait`` seconds after
+    the previous one means traffic is low, so it goes straight to
+    ``/api/v1/ask`` with no added delay. Under load a question opens a
+    window instead; the window is flushed after
+    ``micro_batch_max_wait`` seconds or at ``micro_batch_max_size``
+    distinct questions, and every result is handed back to its waiter.
+    Identical questions in one window are asked once.
+
+    The batch call runs under the tightest deadline among its waiters, so
+    one impatient caller can cut it short for the others in the window.
+    A caller leaving before the flush withdraws its question; when the
+    last caller of a sent window leaves, the call is cancelled.
+    """
+
+    def __init__(self, client: RAGApiClient, config: SearchConfig):
+        self.client = client
+        self.config = config
+        self._window: Optional[_Window] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._last_arrival = float("-inf")
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def search(self, question: str) -> SearchResponse:
+        """Answer one question, batched with concurrent ones when busy."""
+        question = question.strip()
+        if not self._batching(time.monotonic()):
+            metrics.increment("microbatch.direct")
+            return await self.client.search(question, use_cache=self.config.enable_caching)
+
+        loop = asyncio.get_running_loop()
+        window = self._window = self._window or _Window()
+        future = loop.create_future()
+        deadline = current_deadline()
+        window.waiters.setdefault(question, []).append(future)
+        window.deadlines[future] = deadline
+        if len(window.waiters) >= self.config.micro_batch_max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.config.micro_batch_max_wait, self._flush)
+
+        # Each waiter still honours its own deadline while the batch runs
+        try:
+            async with asyncio.timeout(deadline.remaining() if deadline else None):
+                return await future
+        except TimeoutError:
+            metrics.increment("api.search.deadline_exceeded")
+            return SearchResponse(
+                query=SearchQuery(text=question),
+                answer="",
+                status=ResponseStatus.ERROR,
+                error_message="Batas waktu permintaan terlampaui.",
+                backend_unavailable=True
+            )
+        finally:
+            self._leave(window, question, future)
+
+    def _batching(self, now: float) -> bool:
+        """Record an arrival and decide whether it should wait for a batch."""
+        previous, self._last_arrival = self._last_arrival, now
+        return self._window is not None or now - previous < self.config.micro_batch_max_wait
+
+    def _leave(self, window: _Window, question: str, future: asyncio.Future) -> None:
+        """Drop a finished or departed waiter; abandon work nobody waits for."""
+        window.deadlines.pop(future, None)
+        if window.task is None:
+            # Not sent yet: withdraw the question if this was its last waiter
+            waiters = window.waiters.get(question, [])
+            if future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del window.waiters[question]
+            if not window.waiters and window is self._window:
+                self._window = None
+                if self._flush_handle is not None:
+                    self._flush_handle.cancel()
+                    self._flush_handle = None
+        elif not window.deadlines and not window.task.done():
+            metrics.increment("microbatch.cancelled")
+            window.task.cancel()
+
+    def _flush(self) -> None:
+        """Send the pending window."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        window, self._window = self._window, None
+        if window is None or not window.waiters:
+            return
+
+        remaining = [deadline.remaining() for deadline in window.deadlines.values() if deadline is not None]
+        budget = min(remaining) if remaining else None
+        # Run without the first waiter's correlation ids, under the tightest deadline
+        window.task = asyncio.get_running_loop().create_task(
+            self._dispatch(window.waiters, budget), context=contextvars.Context()
+        )
+        self._tasks.add(window.task)
+        window.task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, pending: Dict[str, List[asyncio.Future]], budget: Optional[float]) -> None:
+        """Ask the backend within ``budget`` seconds and resolve every waiter."""
+        questions = list(pending)
+        metrics.increment("microbatch.batches")
+        metrics.increment("microbatch.questions", sum(len(waiters) for waiters in pending.values()))
+        try:
+            with deadline_scope(budget) if budget is not None else contextlib.nullcontext():
+                responses = await self._ask(questions)
+        except asyncio.CancelledError:
+            for waiters in pending.values():
+                for future in waiters:
+                    future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Micro-batch failed: {e}")
+            responses = [
+                SearchResponse(
+                    query=SearchQuery(text=question),
+                    answer="",
+                    status=ResponseStatus.ERROR,
+                    error_message=f"Terjadi kesalahan yang tidak terduga: {str(e)}"
+                )
+                for question in questions
+            ]
+
+        for question, response in zip(questions, responses):
+            for index, future in enumerate(pending[question]):
+                if not future.done():
+                    # Waiters asking the same question each get their own copy
+                    future.set_result(response if index == 0 else dataclasses.replace(response))
+
+    async def _ask(self, questions: List[str]) -> List[SearchResponse]:
+        """One backend call for the window: a plain ask for a single question, else a batch."""
+        if len(questions) == 1:
+            return [await self.client.search(questions[0], use_cache=self.config.enable_caching)]
+
+        batch = await self.client.batch_search(BatchRequest(questions=questions, use_cache=self.config.enable_caching))
+        if len(batch.results) != len(questions):
+            raise ValueError(f"batch returned {len(batch.results)} results for {len(questions)} questions")
+        return [
+            self.client.response_from_batch_result(question, result)
+            for question, result in zip(questions, batch.results)
+        ]
+
+    async def aclose(self) -> None:
+        """Send the pending window and wait for every batch in flight."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,103 @@
+"""Infrastructure compression - Content codings for backend request and response bodies."""
+
+import gzip
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+
+logger = logging.getLogger(__name__)
+
+# Preferred first; levels favour speed since bodies are compressed per request
+ENCODINGS = ("zstd", "br", "gzip")
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Encodings usable in this environment, most preferred first."""
+    return tuple(
+        encoding for encoding in ENCODINGS
+        if encoding == "gzip"
+        or (encoding == "br" and brotli is not None)
+        or (encoding == "zstd" and zstandard is not None)
+    )
+
+
+def accept_encoding() -> str:
+    """Accept-Encoding header value for the encodings httpx can decode here."""
+    return ", ".join(available_encodings())
+
+
+def resolve_encoding(setting: str) -> Optional[str]:
+    """Map a configured request compression (auto/off/name) to an available encoding."""
+    if setting == "off":
+        return None
+    available = available_encodings()
+    if setting == "auto":
+        return available[0]
+    if setting not in available:
+        logger.warning(f"Request compression {setting!r} is not installed, using gzip")
+        return "gzip"
+    return setting
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress a body with the given content coding."""
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL)
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """Decompress a body with the given content coding."""
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "br":
+        return brotli.decompress(data)
+    if encoding == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class RequestBody:
+    """
+    A JSON request body, serialized once and compressed on first need.
+
+    Bodies under ``min_bytes`` are always sent as is, as are bodies that
+    do not get smaller.
+    """
+
+    __slots__ = ("raw", "encoding", "_compressed")
+
+    def __init__(self, payload: Dict[str, Any], encoding: Optional[str], min_bytes: int):
+        self.raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.encoding = encoding if encoding and len(self.raw) >= min_bytes else None
+        self._compressed: Optional[bytes] = None
+
+    def encoded(self) -> Tuple[bytes, Optional[str]]:
+        """The body to send and its content coding (None when sent as is)."""
+        if self.encoding is None:
+            return self.raw, None
+        if self._compressed is None:
+            self._compressed = compress(self.raw, self.encoding)
+            if len(self._compressed) >= len(self.raw):
+                # Incompressible; never worth the header
+                self.encoding = None
+                return self.raw, None
+        return self._compressed, self.encoding
@@ -1,8 +1,54 @@
 """Infrastructure configuration implementations."""
 
 import os
-from dataclasses import dataclass
-from ..core import ConfigInterface
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, FrozenSet, List, Tuple
+from ..core import ConfigInterface, ConfigurationException
+
+
+def _env_str(name: str, default: str, *aliases: str) -> str:
+    """Read a string setting, trying alias names after the primary one."""
+    for key in (name, *aliases):
+        value = os.getenv(key)
+        if value is not None and value.strip():
+            return value.strip()
+    return default
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ConfigurationException(f"{name} must be an integer, got {value!r}")
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ConfigurationException(f"{name} must be a number, got {value!r}")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _require(condition: bool, message: str) -> None:
+    """Raise a ConfigurationException unless the condition holds."""
+    if not condition:
+        raise ConfigurationException(message)
 
 
 @dataclass
@@ -13,28 +59,564 @@ class ApiConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     default_search_preset: str = "balanced"
+    request_deadline: float = 60.0
+    connect_timeout: float = 5.0
+    pool_timeout: float = 5.0
+    min_timeout: float = 5.0
+    timeout_p99_multiplier: float = 1.5
+    timeout_min_samples: int = 20
+    hedge_enabled: bool = False
+    hedge_percentile: float = 95.0
+    hedge_budget: float = 0.1
+    backend_urls: List[str] = field(default_factory=list)
+    endpoint_failure_threshold: int = 3
+    endpoint_ejection_time: float = 10.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    max_concurrent_requests: int = 64
+    request_compression: str = "off"
+    compression_min_bytes: int = 1024
+    response_compression: bool = True
+
+    COMPRESSION_MODES: ClassVar[Tuple[str, ...]] = ("auto", "off", "gzip", "br", "zstd")
+
+    # Fields read on every request; safe to swap while running
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({
+        "timeout", "max_retries", "retry_delay", "request_deadline",
+        "connect_timeout", "pool_timeout", "min_timeout", "timeout_p99_multiplier",
+        "timeout_min_samples", "hedge_enabled", "hedge_percentile", "hedge_budget",
+        "request_compression", "compression_min_bytes", "response_compression"
+    })
 
     @classmethod
     def from_env(cls) -> 'ApiConfig':
         """Create ApiConfig from environment variables."""
-        base_url = os.getenv("BACKEND_URL", "http://localhost:8000")
-        return cls(base_url=base_url)
+        base_url = _env_str("BACKEND_URL", "http://localhost:8000", "FASTAPI_BACKEND_URL")
+        backend_urls = [
+            url.strip() for url in os.getenv("BACKEND_URLS", "").split(",") if url.strip()
+        ]
+        config = cls(
+            base_url=backend_urls[0] if backend_urls else base_url,
+            timeout=_env_float("API_TIMEOUT", 60.0),
+            max_retries=_env_int("MAX_RETRIES", 3),
+            retry_delay=_env_float("RETRY_DELAY", 1.0),
+            backend_urls=backend_urls,
+            endpoint_failure_threshold=_env_int("ENDPOINT_FAILURE_THRESHOLD", 3),
+            endpoint_ejection_time=_env_float("ENDPOINT_EJECTION_TIME", 10.0),
+            request_deadline=_env_float("REQUEST_DEADLINE", 60.0),
+            connect_timeout=_env_float("API_CONNECT_TIMEOUT", 5.0),
+            pool_timeout=_env_float("API_POOL_TIMEOUT", 5.0),
+            min_timeout=_env_float("API_MIN_TIMEOUT", 5.0),
+            timeout_p99_multiplier=_env_float("API_TIMEOUT_P99_MULTIPLIER", 1.5),
+            timeout_min_samples=_env_int("API_TIMEOUT_MIN_SAMPLES", 20),
+            hedge_enabled=_env_bool("HEDGE_ENABLED", False),
+            hedge_percentile=_env_float("HEDGE_PERCENTILE", 95.0),
+            hedge_budget=_env_float("HEDGE_BUDGET", 0.1),
+            max_connections=_env_int("API_MAX_CONNECTIONS", 100),
+            max_keepalive_connections=_env_int("API_MAX_KEEPALIVE_CONNECTIONS", 20),
+            max_concurrent_requests=_env_int("API_MAX_CONCURRENT_REQUESTS", 64),
+            request_compression=_env_str("API_REQUEST_COMPRESSION", "off").lower(),
+            compression_min_bytes=_env_int("API_COMPRESSION_MIN_BYTES", 1024),
+            response_compression=_env_bool("API_RESPONSE_COMPRESSION", True)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        for url in self.endpoints:
+            _require(url.startswith(("http://", "https://")), f"Backend URL must be http(s): {url!r}")
+        _require(self.timeout > 0, "API_TIMEOUT must be positive")
+        _require(self.max_retries >= 1, "MAX_RETRIES must be at least 1")
+        _require(self.retry_delay >= 0, "RETRY_DELAY must not be negative")
+        _require(self.request_deadline > 0, "REQUEST_DEADLINE must be positive")
+        _require(self.connect_timeout > 0, "API_CONNECT_TIMEOUT must be positive")
+        _require(self.pool_timeout > 0, "API_POOL_TIMEOUT must be positive")
+        _require(0 < self.min_timeout <= self.timeout, "API_MIN_TIMEOUT must be in (0, API_TIMEOUT]")
+        _require(self.timeout_p99_multiplier >= 1, "API_TIMEOUT_P99_MULTIPLIER must be at least 1")
+        _require(self.timeout_min_samples >= 1, "API_TIMEOUT_MIN_SAMPLES must be at least 1")
+        _require(0 < self.hedge_percentile < 100, "HEDGE_PERCENTILE must be in (0, 100)")
+        _require(0 <= self.hedge_budget <= 1, "HEDGE_BUDGET must be in [0, 1]")
+        _require(self.endpoint_failure_threshold >= 1, "ENDPOINT_FAILURE_THRESHOLD must be at least 1")
+        _require(self.endpoint_ejection_time > 0, "ENDPOINT_EJECTION_TIME must be positive")
+        _require(self.max_connections >= 1, "API_MAX_CONNECTIONS must be at least 1")
+        _require(
+            0 <= self.max_keepalive_connections <= self.max_connections,
+            "API_MAX_KEEPALIVE_CONNECTIONS must be in [0, API_MAX_CONNECTIONS]"
+        )
+        _require(self.max_concurrent_requests >= 1, "API_MAX_CONCURRENT_REQUESTS must be at least 1")
+        _require(
+            self.request_compression in self.COMPRESSION_MODES,
+            f"API_REQUEST_COMPRESSION must be one of {', '.join(self.COMPRESSION_MODES)}"
+        )
+        _require(self.compression_min_bytes >= 0, "API_COMPRESSION_MIN_BYTES must not be negative")
+
+    @property
+    def endpoints(self) -> List[str]:
+        """All backend replicas, falling back to the single base URL."""
+        return self.backend_urls or [self.base_url]
 
 
 @dataclass
 class SearchConfig:
     """Configuration for search operations."""
-    max_results: int = 10
-    cache_ttl: int = 300
     enable_caching: bool = True
-    default_strategy: str = "hybrid"
+    batch_chunk_size: int = 20
+    batch_concurrency: int = 4
+    url_cache_size: int = 2048
+    micro_batch_enabled: bool = False
+    micro_batch_max_size: int = 16
+    micro_batch_max_wait: float = 0.01
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({
+        "enable_caching", "batch_chunk_size", "batch_concurrency",
+        "micro_batch_enabled", "micro_batch_max_size", "micro_batch_max_wait"
+    })
 
     @classmethod
     def from_env(cls) -> 'SearchConfig':
         """Create SearchConfig from environment variables."""
-        return cls(
-            max_results=int(os.getenv("SEARCH_MAX_RESULTS", "10")),
-            cache_ttl=int(os.getenv("CACHE_TTL", "300")),
-            enable_caching=os.getenv("ENABLE_CACHING", "true").lower() == "true",
-            default_strategy=os.getenv("DEFAULT_SEARCH_STRATEGY", "hybrid")
+        config = cls(
+            enable_caching=_env_bool("ENABLE_CACHING", True),
+            batch_chunk_size=_env_int("BATCH_CHUNK_SIZE", 20),
+            batch_concurrency=_env_int("BATCH_CONCURRENCY", 4),
+            url_cache_size=_env_int("URL_CACHE_SIZE", 2048),
+            micro_batch_enabled=_env_bool("MICRO_BATCH_ENABLED", False),
+            micro_batch_max_size=_env_int("MICRO_BATCH_MAX_SIZE", 16),
+            micro_batch_max_wait=_env_float("MICRO_BATCH_MAX_WAIT", 0.01)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(self.batch_chunk_size >= 1, "BATCH_CHUNK_SIZE must be at least 1")
+        _require(self.batch_concurrency >= 1, "BATCH_CONCURRENCY must be at least 1")
+        _require(self.url_cache_size >= 0, "URL_CACHE_SIZE must not be negative")
+        _require(self.micro_batch_max_size >= 2, "MICRO_BATCH_MAX_SIZE must be at least 2")
+        _require(0 < self.micro_batch_max_wait <= 1, "MICRO_BATCH_MAX_WAIT must be in (0, 1] seconds")
+
+
+@dataclass
+class EnrichmentConfig:
+    """Configuration for source title enrichment."""
+    enabled: bool = True
+    cache_path: str = ".cache/page_titles.json"
+    max_entries: int = 5000
+    max_concurrency: int = 4
+    fetch_timeout: float = 5.0
+    failure_ttl: float = 600.0
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"enabled", "failure_ttl"})
+
+    @classmethod
+    def from_env(cls) -> 'EnrichmentConfig':
+        """Create EnrichmentConfig from environment variables."""
+        config = cls(
+            enabled=_env_bool("ENABLE_SOURCE_TITLES", True),
+            cache_path=_env_str("TITLE_CACHE_PATH", ".cache/page_titles.json"),
+            max_entries=_env_int("TITLE_CACHE_MAX_SIZE", 5000),
+            max_concurrency=_env_int("TITLE_FETCH_CONCURRENCY", 4),
+            fetch_timeout=_env_float("TITLE_FETCH_TIMEOUT", 5.0),
+            failure_ttl=_env_float("TITLE_FAILURE_TTL", 600.0)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(self.max_entries >= 1, "TITLE_CACHE_MAX_SIZE must be at least 1")
+        _require(self.max_concurrency >= 1, "TITLE_FETCH_CONCURRENCY must be at least 1")
+        _require(self.fetch_timeout > 0, "TITLE_FETCH_TIMEOUT must be positive")
+        _require(self.failure_ttl >= 0, "TITLE_FAILURE_TTL must not be negative")
+
+
+@dataclass
+class ConversationConfig:
+    """Configuration for per-session conversation memory."""
+    max_turns: int = 6
+    max_context_tokens: int = 400
+    max_answer_chars: int = 600
+    idle_timeout: float = 1800.0
+    max_sessions: int = 10000
+
+    # max_turns only applies to sessions started after a reload
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({
+        "max_turns", "max_context_tokens", "max_answer_chars", "idle_timeout", "max_sessions"
+    })
+
+    @classmethod
+    def from_env(cls) -> 'ConversationConfig':
+        """Create ConversationConfig from environment variables."""
+        config = cls(
+            max_turns=_env_int("CONVERSATION_MAX_TURNS", 6),
+            max_context_tokens=_env_int("CONVERSATION_MAX_CONTEXT_TOKENS", 400),
+            max_answer_chars=_env_int("CONVERSATION_MAX_ANSWER_CHARS", 600),
+            idle_timeout=_env_float("CONVERSATION_IDLE_TIMEOUT", 1800.0),
+            max_sessions=_env_int("CONVERSATION_MAX_SESSIONS", 10000)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(self.max_turns >= 0, "CONVERSATION_MAX_TURNS must not be negative")
+        _require(self.max_context_tokens >= 0, "CONVERSATION_MAX_CONTEXT_TOKENS must not be negative")
+        _require(self.max_answer_chars >= 0, "CONVERSATION_MAX_ANSWER_CHARS must not be negative")
+        _require(self.idle_timeout > 0, "CONVERSATION_IDLE_TIMEOUT must be positive")
+        _require(self.max_sessions >= 1, "CONVERSATION_MAX_SESSIONS must be at least 1")
+
+
+def _parse_rates(name: str, value: str) -> Dict[str, float]:
+    """Parse ``event=rate,event=rate`` pairs."""
+    rates: Dict[str, float] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        event, sep, rate = item.partition("=")
+        if not sep:
+            raise ConfigurationException(f"{name} entries must look like event=rate, got {item!r}")
+        try:
+            rates[event.strip()] = float(rate)
+        except ValueError:
+            raise ConfigurationException(f"{name} rate for {event.strip()!r} must be a number")
+    return rates
+
+
+@dataclass
+class LoggingConfig:
+    """Configuration for structured logging."""
+    format: str = "text"
+    question_redaction: str = "full"
+    sample_rates: Dict[str, float] = field(default_factory=dict)
+    queue_size: int = 10000
+
+    FORMATS: ClassVar[Tuple[str, ...]] = ("text", "json")
+    REDACTION_MODES: ClassVar[Tuple[str, ...]] = ("full", "mask", "off")
+
+    # The handler and formatter are installed once; redaction and sampling are read per record
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"question_redaction", "sample_rates"})
+
+    @classmethod
+    def from_env(cls) -> 'LoggingConfig':
+        """Create LoggingConfig from environment variables."""
+        config = cls(
+            format=_env_str("LOG_FORMAT", "text").lower(),
+            question_redaction=_env_str("LOG_REDACT_QUESTIONS", "full").lower(),
+            sample_rates=_parse_rates("LOG_SAMPLE_RATES", os.getenv("LOG_SAMPLE_RATES", "")),
+            queue_size=_env_int("LOG_QUEUE_SIZE", 10000)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(self.format in self.FORMATS, f"LOG_FORMAT must be one of {', '.join(self.FORMATS)}")
+        _require(
+            self.question_redaction in self.REDACTION_MODES,
+            f"LOG_REDACT_QUESTIONS must be one of {', '.join(self.REDACTION_MODES)}"
+        )
+        for event, rate in self.sample_rates.items():
+            _require(0 <= rate <= 1, f"LOG_SAMPLE_RATES rate for {event!r} must be in [0, 1]")
+        _require(self.queue_size >= 1, "LOG_QUEUE_SIZE must be at least 1")
+
+
+@dataclass
+class QueryLogConfig:
+    """Configuration for the replayable query log."""
+    enabled: bool = False
+    path: str = ".cache/query_log.jsonl"
+    max_bytes: int = 50 * 1024 * 1024
+    backup_count: int = 5
+    buffer_bytes: int = 64 * 1024
+    flush_interval: float = 2.0
+    question_redaction: str = "mask"
+    session_salt: str = ""
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"enabled", "question_redaction"})
+
+    @classmethod
+    def from_env(cls) -> 'QueryLogConfig':
+        """Create QueryLogConfig from environment variables."""
+        config = cls(
+            enabled=_env_bool("QUERY_LOG_ENABLED", False),
+            path=_env_str("QUERY_LOG_PATH", ".cache/query_log.jsonl"),
+            max_bytes=_env_int("QUERY_LOG_MAX_BYTES", 50 * 1024 * 1024),
+            backup_count=_env_int("QUERY_LOG_BACKUP_COUNT", 5),
+            buffer_bytes=_env_int("QUERY_LOG_BUFFER_BYTES", 64 * 1024),
+            flush_interval=_env_float("QUERY_LOG_FLUSH_INTERVAL", 2.0),
+            question_redaction=_env_str("QUERY_LOG_REDACT_QUESTIONS", "mask").lower(),
+            session_salt=os.getenv("QUERY_LOG_SESSION_SALT", "")
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(self.max_bytes >= 1024, "QUERY_LOG_MAX_BYTES must be at least 1024")
+        _require(self.backup_count >= 0, "QUERY_LOG_BACKUP_COUNT must not be negative")
+        _require(self.buffer_bytes >= 0, "QUERY_LOG_BUFFER_BYTES must not be negative")
+        _require(self.flush_interval > 0, "QUERY_LOG_FLUSH_INTERVAL must be positive")
+        _require(
+            self.question_redaction in LoggingConfig.REDACTION_MODES,
+            f"QUERY_LOG_REDACT_QUESTIONS must be one of {', '.join(LoggingConfig.REDACTION_MODES)}"
+        )
+
+
+@dataclass
+class RenderConfig:
+    """Configuration for chat response rendering."""
+    max_answer_chars: int = 4000
+    max_sources: int = 3
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"max_answer_chars", "max_sources"})
+
+    @classmethod
+    def from_env(cls) -> 'RenderConfig':
+        """Create RenderConfig from environment variables."""
+        config = cls(
+            max_answer_chars=_env_int("RESPONSE_MAX_ANSWER_CHARS", 4000),
+            max_sources=_env_int("RESPONSE_MAX_SOURCES", 3)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(self.max_answer_chars >= 200, "RESPONSE_MAX_ANSWER_CHARS must be at least 200")
+        _require(self.max_sources >= 1, "RESPONSE_MAX_SOURCES must be at least 1")
+
+
+@dataclass
+class StarterConfig:
+    """Configuration for chat profile starter questions."""
+    path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "presentation", "starters.json")
+    variants: int = 16
+    refresh_interval: float = 600.0
+    popularity_weight: float = 1.0
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"refresh_interval", "popularity_weight"})
+
+    @classmethod
+    def from_env(cls) -> 'StarterConfig':
+        """Create StarterConfig from environment variables."""
+        config = cls(
+            path=_env_str("STARTERS_PATH", cls.path),
+            variants=_env_int("STARTERS_VARIANTS", 16),
+            refresh_interval=_env_float("STARTERS_REFRESH_INTERVAL", 600.0),
+            popularity_weight=_env_float("STARTERS_POPULARITY_WEIGHT", 1.0)
         )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(os.path.isfile(self.path), f"STARTERS_PATH does not exist: {self.path}")
+        _require(self.variants >= 1, "STARTERS_VARIANTS must be at least 1")
+        _require(self.refresh_interval > 0, "STARTERS_REFRESH_INTERVAL must be positive")
+        _require(self.popularity_weight >= 0, "STARTERS_POPULARITY_WEIGHT must not be negative")
+
+
+@dataclass
+class FallbackConfig:
+    """Configuration for the local degraded-mode answer index."""
+    enabled: bool = True
+    path: str = ".cache/fallback.idx"
+    min_coverage: float = 0.5
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"enabled", "min_coverage"})
+
+    @classmethod
+    def from_env(cls) -> 'FallbackConfig':
+        """Create FallbackConfig from environment variables."""
+        config = cls(
+            enabled=_env_bool("FALLBACK_ENABLED", True),
+            path=_env_str("FALLBACK_INDEX_PATH", ".cache/fallback.idx"),
+            min_coverage=_env_float("FALLBACK_MIN_COVERAGE", 0.5)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(0 < self.min_coverage <= 1, "FALLBACK_MIN_COVERAGE must be in (0, 1]")
+
+
+@dataclass
+class SuggestionConfig:
+    """Configuration for type-ahead question suggestions."""
+    limit: int = 5
+    min_count: int = 3
+    max_tracked: int = 50000
+    max_chars: int = 200
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+
+    @classmethod
+    def from_env(cls) -> 'SuggestionConfig':
+        """Create SuggestionConfig from environment variables."""
+        config = cls(
+            limit=_env_int("SUGGEST_LIMIT", 5),
+            min_count=_env_int("SUGGEST_MIN_COUNT", 3),
+            max_tracked=_env_int("SUGGEST_MAX_TRACKED", 50000),
+            max_chars=_env_int("SUGGEST_MAX_CHARS", 200)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(1 <= self.limit <= 20, "SUGGEST_LIMIT must be between 1 and 20")
+        _require(self.min_count >= 1, "SUGGEST_MIN_COUNT must be at least 1")
+        _require(self.max_tracked >= 100, "SUGGEST_MAX_TRACKED must be at least 100")
+        _require(self.max_chars >= 10, "SUGGEST_MAX_CHARS must be at least 10")
+
+
+@dataclass
+class FaqConfig:
+    """Configuration for the precomputed FAQ answer store."""
+    enabled: bool = True
+    path: str = ".cache/faq.json"
+    ttl: float = 6 * 3600.0
+    refresh_interval: float = 3600.0
+    promote_top: int = 20
+    promote_min_count: int = 5
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({
+        "enabled", "ttl", "refresh_interval", "promote_top", "promote_min_count"
+    })
+
+    @classmethod
+    def from_env(cls) -> 'FaqConfig':
+        """Create FaqConfig from environment variables."""
+        config = cls(
+            enabled=_env_bool("FAQ_ENABLED", True),
+            path=_env_str("FAQ_PATH", ".cache/faq.json"),
+            ttl=_env_float("FAQ_TTL", 6 * 3600.0),
+            refresh_interval=_env_float("FAQ_REFRESH_INTERVAL", 3600.0),
+            promote_top=_env_int("FAQ_PROMOTE_TOP", 20),
+            promote_min_count=_env_int("FAQ_PROMOTE_MIN_COUNT", 5)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(self.refresh_interval >= 60, "FAQ_REFRESH_INTERVAL must be at least 60 seconds")
+        _require(self.ttl > self.refresh_interval, "FAQ_TTL must be longer than FAQ_REFRESH_INTERVAL")
+        _require(self.promote_top >= 0, "FAQ_PROMOTE_TOP must not be negative")
+        _require(self.promote_min_count >= 1, "FAQ_PROMOTE_MIN_COUNT must be at least 1")
+
+
+@dataclass
+class SchedulerConfig:
+    """Configuration for prioritising interactive over bulk backend calls."""
+    policy: str = "weighted"
+    interactive_weight: int = 4
+    interactive_max_concurrent: int = 0
+    bulk_max_concurrent: int = 8
+
+    POLICIES: ClassVar[Tuple[str, ...]] = ("strict", "weighted")
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({
+        "policy", "interactive_weight", "interactive_max_concurrent", "bulk_max_concurrent"
+    })
+
+    @classmethod
+    def from_env(cls) -> 'SchedulerConfig':
+        """Create SchedulerConfig from environment variables."""
+        config = cls(
+            policy=_env_str("SCHEDULER_POLICY", "weighted").lower(),
+            interactive_weight=_env_int("SCHEDULER_INTERACTIVE_WEIGHT", 4),
+            interactive_max_concurrent=_env_int("SCHEDULER_INTERACTIVE_MAX_CONCURRENT", 0),
+            bulk_max_concurrent=_env_int("SCHEDULER_BULK_MAX_CONCURRENT", 8)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(self.policy in self.POLICIES, f"SCHEDULER_POLICY must be one of {', '.join(self.POLICIES)}")
+        _require(self.interactive_weight >= 1, "SCHEDULER_INTERACTIVE_WEIGHT must be at least 1")
+        _require(self.interactive_max_concurrent >= 0, "SCHEDULER_INTERACTIVE_MAX_CONCURRENT must not be negative")
+        _require(self.bulk_max_concurrent >= 0, "SCHEDULER_BULK_MAX_CONCURRENT must not be negative")
+
+
+@dataclass
+class PipelineConfig:
+    """Configuration of the interceptor stages wrapped around the search service."""
+    interceptors: Tuple[str, ...] = ()
+    rate_limit_per_second: float = 0.0
+    rate_limit_burst: int = 20
+
+    STAGES: ClassVar[Tuple[str, ...]] = ("metrics", "coalesce", "rate_limit")
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({
+        "interceptors", "rate_limit_per_second", "rate_limit_burst"
+    })
+
+    @classmethod
+    def from_env(cls) -> 'PipelineConfig':
+        """Create PipelineConfig from environment variables."""
+        config = cls(
+            interceptors=tuple(
+                name.strip().lower() for name in os.getenv("PIPELINE_INTERCEPTORS", "").split(",") if name.strip()
+            ),
+            rate_limit_per_second=_env_float("PIPELINE_RATE_LIMIT_PER_SECOND", 0.0),
+            rate_limit_burst=_env_int("PIPELINE_RATE_LIMIT_BURST", 20)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        unknown = [name for name in self.interceptors if name not in self.STAGES]
+        _require(not unknown, f"PIPELINE_INTERCEPTORS has unknown stages {unknown}; choose from {', '.join(self.STAGES)}")
+        _require(len(set(self.interceptors)) == len(self.interceptors), "PIPELINE_INTERCEPTORS lists a stage twice")
+        _require(self.rate_limit_per_second >= 0, "PIPELINE_RATE_LIMIT_PER_SECOND must not be negative")
+        _require(self.rate_limit_burst >= 1, "PIPELINE_RATE_LIMIT_BURST must be at least 1")
+
+
+@dataclass
+class WorkerConfig:
+    """Configuration of multi-worker mode and process shutdown (read by the supervisor and by each worker)."""
+    workers: int = 1
+    host: str = "0.0.0.0"
+    port: int = 8080
+    base_port: int = 9100
+    drain_timeout: float = 30.0
+    shutdown_timeout: float = 25.0
+    trust_forwarded: bool = False
+    worker_id: int = 0
+    shared_state_socket: str = ""
+    metrics_publish_interval: float = 10.0
+
+    HOT_RELOAD_FIELDS: ClassVar[FrozenSet[str]] = frozenset({"metrics_publish_interval", "shutdown_timeout"})
+
+    @classmethod
+    def from_env(cls) -> 'WorkerConfig':
+        """Create WorkerConfig from environment variables."""
+        config = cls(
+            workers=_env_int("WEB_CONCURRENCY", os.cpu_count() or 1),
+            host=_env_str("HOST", "0.0.0.0"),
+            port=_env_int("PORT", 8080),
+            base_port=_env_int("WORKER_BASE_PORT", 9100),
+            drain_timeout=_env_float("WORKER_DRAIN_TIMEOUT", 30.0),
+            shutdown_timeout=_env_float("SHUTDOWN_DRAIN_TIMEOUT", 25.0),
+            trust_forwarded=_env_bool("WORKER_TRUST_FORWARDED", False),
+            worker_id=_env_int("WORKER_ID", 0),
+            shared_state_socket=_env_str("SHARED_STATE_SOCKET", ""),
+            metrics_publish_interval=_env_float("METRICS_PUBLISH_INTERVAL", 10.0)
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Check that all values are within sane bounds."""
+        _require(self.workers >= 1, "WEB_CONCURRENCY must be at least 1")
+        _require(0 < self.port < 65536, "PORT must be a valid port")
+        _require(0 < self.base_port and self.base_port + self.workers < 65536, "WORKER_BASE_PORT must leave room for every worker")
+        _require(self.drain_timeout >= 0, "WORKER_DRAIN_TIMEOUT must not be negative")
+        _require(self.shutdown_timeout >= 0, "SHUTDOWN_DRAIN_TIMEOUT must not be negative")
+        _require(self.worker_id >= 0, "WORKER_ID must not be negative")
+        _require(self.metrics_publish_interval > 0, "METRICS_PUBLISH_INTERVAL must be positive")
@@ -0,0 +1,141 @@
+"""Infrastructure conversation memory - Bounded per-session chat history."""
+
+import sys
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Optional, Tuple
+
+from ..core import SessionResourceInterface
+from ..domain import ConversationTurn
+from .config import ConversationConfig
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+class ConversationHistory:
+    """Ring buffer of the most recent turns of a single session."""
+
+    __slots__ = ("turns", "last_active")
+
+    def __init__(self, max_turns: int):
+        self.turns: Deque[ConversationTurn] = deque(maxlen=max_turns)
+        self.last_active = time.monotonic()
+
+
+class ConversationStore(SessionResourceInterface):
+    """
+    In-memory conversation memory keyed by session id.
+    
+    Each session keeps at most ``max_turns`` turns with answers clipped to
+    ``max_answer_chars``, the number of sessions is capped, and sessions idle
+    longer than ``idle_timeout`` are evicted.
+    """
+
+    def __init__(self, config: Optional[ConversationConfig] = None):
+        self.config = config or ConversationConfig.from_env()
+        self._sessions: "OrderedDict[str, ConversationHistory]" = OrderedDict()
+        self._last_sweep = time.monotonic()
+
+    def add_turn(self, session_id: str, question: str, answer: str) -> None:
+        """Record a completed exchange for a session."""
+        history = self._sessions.get(session_id)
+        if history is None:
+            history = ConversationHistory(self.config.max_turns)
+            self._sessions[session_id] = history
+            while len(self._sessions) > self.config.max_sessions:
+                self._sessions.popitem(last=False)
+
+        history.turns.append(ConversationTurn(
+            question=question,
+            answer=self._clip(answer)
+        ))
+        self._touch(session_id, history)
+        self._maybe_evict_idle()
+
+    def get_context(self, session_id: Optional[str]) -> Tuple[ConversationTurn, ...]:
+        """
+        Get the compact context window for a session.
+        
+        Returns the newest turns that fit in ``max_context_tokens``, oldest
+        first. A turn whose answer does not fit is sent with its question only.
+        """
+        self._maybe_evict_idle()
+        if not session_id:
+            return ()
+
+        history = self._sessions.get(session_id)
+        if history is None:
+            return ()
+        self._touch(session_id, history)
+
+        budget = self.config.max_context_tokens
+        window = []
+        for turn in reversed(history.turns):
+            question_cost = estimate_tokens(turn.question)
+            if question_cost > budget:
+                break
+
+            answer_cost = estimate_tokens(turn.answer) if turn.answer else 0
+            if question_cost + answer_cost <= budget:
+                window.append(turn)
+                budget -= question_cost + answer_cost
+            else:
+                window.append(ConversationTurn(question=turn.question, answer=""))
+                budget -= question_cost
+
+        window.reverse()
+        return tuple(window)
+
+    def end_session(self, session_id: str) -> bool:
+        """Drop all memory for a session."""
+        return self._sessions.pop(session_id, None) is not None
+
+    def session_memory(self, session_id: str) -> int:
+        """Approximate bytes of history held for a session."""
+        history = self._sessions.get(session_id)
+        if history is None:
+            return 0
+        return sys.getsizeof(history.turns) + sum(
+            sys.getsizeof(turn) + sys.getsizeof(turn.question) + sys.getsizeof(turn.answer)
+            for turn in history.turns
+        )
+
+    def evict_idle(self) -> int:
+        """Evict sessions idle longer than the configured timeout."""
+        cutoff = time.monotonic() - self.config.idle_timeout
+        evicted = 0
+        # Sessions are kept in least-recently-active order
+        while self._sessions:
+            session_id, history = next(iter(self._sessions.items()))
+            if history.last_active > cutoff:
+                break
+            del self._sessions[session_id]
+            evicted += 1
+        return evicted
+
+    def session_count(self) -> int:
+        """Number of sessions with stored history."""
+        return len(self._sessions)
+
+    def _touch(self, session_id: str, history: ConversationHistory) -> None:
+        """Mark a session as recently active."""
+        history.last_active = time.monotonic()
+        self._sessions.move_to_end(session_id)
+
+    def _maybe_evict_idle(self) -> None:
+        """Sweep idle sessions at most once a minute."""
+        now = time.monotonic()
+        if now - self._last_sweep >= 60:
+            self._last_sweep = now
+            self.evict_idle()
+
+    def _clip(self, answer: str) -> str:
+        """Clip a stored answer to the per-turn character cap."""
+        limit = self.config.max_answer_chars
+        answer = answer.strip()
+        if len(answer) <= limit:
+            return answer
+        return answer[:limit].rsplit(" ", 1)[0] + " …"
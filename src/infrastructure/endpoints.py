@@ -0,0 +1,131 @@
+"""Infrastructure endpoint pool - Load balancing across backend replicas."""
+
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+
+class Endpoint:
+    """Live statistics of a single backend replica."""
+
+    __slots__ = ("base_url", "outstanding", "ewma_latency", "consecutive_failures",
+                 "ejected_until", "ejections", "requests", "failures")
+
+    def __init__(self, base_url: str, initial_latency: float = 1.0):
+        self.base_url = base_url.rstrip("/")
+        self.outstanding = 0
+        self.ewma_latency = initial_latency
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.ejections = 0
+        self.requests = 0
+        self.failures = 0
+
+    @property
+    def ejected(self) -> bool:
+        """Check if the endpoint is currently ejected."""
+        return time.monotonic() < self.ejected_until
+
+    def score(self) -> float:
+        """Expected wait: latency weighted by in-flight requests and recent failures."""
+        return self.ewma_latency * (self.outstanding + 1) * (self.consecutive_failures + 1)
+
+
+class EndpointPool:
+    """
+    Pool of backend endpoints with power-of-two-choices balancing.
+
+    Two random healthy endpoints are sampled and the one with the lower
+    EWMA-latency × outstanding-requests score wins; recent failures inflate
+    the score so retries naturally fail over to another replica. Endpoints failing
+    ``failure_threshold`` times in a row are ejected for a backoff period
+    that doubles on every consecutive ejection; if every endpoint is ejected
+    the least recently ejected one is still used so traffic never stops.
+    """
+
+    def __init__(
+        self,
+        base_urls: List[str],
+        failure_threshold: int = 3,
+        ejection_time: float = 10.0,
+        max_ejection_time: float = 120.0,
+        ewma_alpha: float = 0.3
+    ):
+        if not base_urls:
+            raise ValueError("At least one backend endpoint is required")
+        self.endpoints = [Endpoint(url) for url in base_urls]
+        self._failure_threshold = failure_threshold
+        self._ejection_time = ejection_time
+        self._max_ejection_time = max_ejection_time
+        self._alpha = ewma_alpha
+
+    @property
+    def all_ejected(self) -> bool:
+        """Check if every endpoint is currently ejected (the circuit is open)."""
+        return all(ep.ejected for ep in self.endpoints)
+
+    def select(self) -> Endpoint:
+        """Pick an endpoint for the next request."""
+        if len(self.endpoints) == 1:
+            return self.endpoints[0]
+
+        candidates = [ep for ep in self.endpoints if not ep.ejected] or [
+            min(self.endpoints, key=lambda ep: ep.ejected_until)
+        ]
+        if len(candidates) == 1:
+            return candidates[0]
+
+        first, second = random.sample(candidates, 2)
+        return first if first.score() <= second.score() else second
+
+    def acquire(self) -> Endpoint:
+        """Select an endpoint and count the request as outstanding."""
+        endpoint = self.select()
+        endpoint.outstanding += 1
+        endpoint.requests += 1
+        return endpoint
+
+    def release(self, endpoint: Endpoint, latency: Optional[float] = None, failed: bool = False) -> None:
+        """Record the outcome of a request started with ``acquire``."""
+        endpoint.outstanding = max(0, endpoint.outstanding - 1)
+
+        if failed:
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self._failure_threshold:
+                self._eject(endpoint)
+            return
+
+        endpoint.consecutive_failures = 0
+        endpoint.ejections = 0
+        if latency is not None:
+            endpoint.ewma_latency += self._alpha * (latency - endpoint.ewma_latency)
+
+    def mark_health(self, endpoint: Endpoint, healthy: bool) -> None:
+        """Apply the result of an active health check."""
+        if healthy:
+            endpoint.consecutive_failures = 0
+            endpoint.ejected_until = 0.0
+        else:
+            self._eject(endpoint)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-endpoint health and load statistics."""
+        return [
+            {
+                "url": ep.base_url,
+                "outstanding": ep.outstanding,
+                "ewma_latency": round(ep.ewma_latency, 4),
+                "requests": ep.requests,
+                "failures": ep.failures,
+                "ejected": ep.ejected
+            }
+            for ep in self.endpoints
+        ]
+
+    def _eject(self, endpoint: Endpoint) -> None:
+        """Take an endpoint out of rotation with exponential backoff."""
+        duration = min(self._max_ejection_time, self._ejection_time * (2 ** endpoint.ejections))
+        endpoint.ejected_until = time.monotonic() + duration
+        endpoint.ejections += 1
+        endpoint.consecutive_failures = 0
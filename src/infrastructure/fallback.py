@@ -0,0 +1,264 @@
+"""Infrastructure fallback index - Local BM25 answers for degraded mode.
+
+The index is built offline from question → answer records (for example the
+output of ``benchmarks.evaluate``) into one binary file that is memory-mapped
+on first use:
+
+    magic | header length | JSON header | postings | doc lengths | doc table | docs
+
+Postings are (doc id, term frequency) uint32 pairs per term; documents are
+JSON blobs located through the (offset, length) uint32 doc table.
+
+Build with: python -m src.infrastructure.fallback results.jsonl --output .cache/fallback.idx
+"""
+
+import argparse
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..domain import NOT_AVAILABLE_MESSAGE
+
+
+MAGIC = b"RAGBM25\x01"
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Frequent Indonesian function words that carry no meaning for matching
+STOPWORDS = frozenset({
+    "apa", "apakah", "bagaimana", "berapa", "dan", "dari", "di", "dengan", "ini", "itu",
+    "ke", "mana", "saja", "seperti", "untuk", "yang", "ada", "cara", "adalah", "atau"
+})
+
+# Question terms count more than answer terms
+QUESTION_WEIGHT = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords."""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+@dataclass(frozen=True)
+class FallbackHit:
+    """A stored answer matching a query."""
+    question: str
+    answer: str
+    source_urls: List[str]
+    score: float
+    coverage: float
+
+
+def build_index(records: Iterable[Dict[str, Any]], path: str, k1: float = 1.2, b: float = 0.75) -> int:
+    """Write an index for question/answer records; returns the document count."""
+    docs: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        question = (record.get("question") or "").strip()
+        answer = (record.get("answer") or "").strip()
+        if not question or not answer or record.get("status") == "error" or answer == NOT_AVAILABLE_MESSAGE:
+            continue
+        # The latest answer for a question wins
+        docs[" ".join(tokenize(question))] = {
+            "question": question, "answer": answer, "source_urls": record.get("source_urls") or []
+        }
+
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    lengths = array("I")
+    for doc_id, doc in enumerate(docs.values()):
+        terms = Counter(tokenize(doc["question"]) * QUESTION_WEIGHT + tokenize(doc["answer"]))
+        lengths.append(sum(terms.values()))
+        for term, tf in terms.items():
+            postings.setdefault(term, []).append((doc_id, tf))
+
+    blobs = [json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8") for doc in docs.values()]
+
+    terms: Dict[str, List[int]] = {}
+    posting_bytes = bytearray()
+    for term, entries in postings.items():
+        terms[term] = [len(posting_bytes), len(entries)]
+        flat = array("I", (value for entry in entries for value in entry))
+        posting_bytes += flat.tobytes()
+
+    doc_table = array("I")
+    offset = 0
+    for blob in blobs:
+        doc_table.extend((offset, len(blob)))
+        offset += len(blob)
+
+    header = {
+        "version": 1,
+        "built_at": time.time(),
+        "docs": len(blobs),
+        "avgdl": (sum(lengths) / len(lengths)) if lengths else 0.0,
+        "k1": k1,
+        "b": b,
+        "terms": terms,
+        "postings_size": len(posting_bytes)
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # Pad so the uint32 regions stay 4-byte aligned
+    header_bytes += b" " * (-(len(MAGIC) + 4 + len(header_bytes)) % 4)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(MAGIC)
+        file.write(struct.pack("<I", len(header_bytes)))
+        file.write(header_bytes)
+        file.write(posting_bytes)
+        file.write(lengths.tobytes())
+        file.write(doc_table.tobytes())
+        for blob in blobs:
+            file.write(blob)
+    os.replace(tmp_path, path)
+    return len(blobs)
+
+
+class FallbackIndex:
+    """
+    Read-only BM25 index over stored answers, memory-mapped lazily.
+
+    A hit is only returned when the matched query terms carry at least
+    ``min_coverage`` of the query's total IDF weight, so unrelated
+    questions get no answer rather than a misleading one.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._mmap: Optional[mmap.mmap] = None
+        self._header: Dict[str, Any] = {}
+
+    @property
+    def available(self) -> bool:
+        """Check if an index file exists (and loads)."""
+        return self._load()
+
+    def search(self, text: str, min_coverage: float = 0.5) -> Optional[FallbackHit]:
+        """Best stored answer for a question, or None."""
+        if not self._load():
+            return None
+
+        header = self._header
+        terms = header["terms"]
+        query = list(dict.fromkeys(tokenize(text)))
+        if not query or not header["docs"]:
+            return None
+
+        count, avgdl, k1, b = header["docs"], header["avgdl"] or 1.0, header["k1"], header["b"]
+        scores: Dict[int, float] = {}
+        matched: Dict[int, float] = {}
+        total_idf = 0.0
+        for term in query:
+            entry = terms.get(term)
+            df = entry[1] if entry else 0
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            total_idf += idf
+            if not entry:
+                continue
+            start = self._postings_start + entry[0]
+            postings = self._view[start:start + entry[1] * 8].cast("I")
+            for i in range(0, len(postings), 2):
+                doc_id, tf = postings[i], postings[i + 1]
+                norm = tf + k1 * (1 - b + b * self._lengths[doc_id] / avgdl)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / norm
+                matched[doc_id] = matched.get(doc_id, 0.0) + idf
+
+        if not scores:
+            return None
+        best = max(scores, key=scores.__getitem__)
+        coverage = matched[best] / total_idf if total_idf else 0.0
+        if coverage < min_coverage:
+            return None
+
+        offset, length = self._doc_table[best * 2], self._doc_table[best * 2 + 1]
+        start = self._docs_start + offset
+        doc = json.loads(bytes(self._view[start:start + length]).decode("utf-8"))
+        return FallbackHit(doc["question"], doc["answer"], doc["source_urls"], round(scores[best], 4), round(coverage, 4))
+
+    def close(self) -> None:
+        """Release the memory map."""
+        with self._lock:
+            if self._mmap is not None:
+                for view in (self._lengths, self._doc_table, self._view):
+                    view.release()
+                self._mmap.close()
+                self._mmap = None
+            self._loaded = False
+
+    def _load(self) -> bool:
+        """Map the index file on first use."""
+        if self._loaded:
+            return self._mmap is not None
+        with self._lock:
+            if self._loaded:
+                return self._mmap is not None
+            self._loaded = True
+            if not os.path.exists(self.path):
+                return False
+            try:
+                with open(self.path, "rb") as file:
+                    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                # An empty file cannot be mapped
+                raise ValueError(f"Corrupt fallback index {self.path}: {e}") from e
+            try:
+                if mapped[:len(MAGIC)] != MAGIC:
+                    raise ValueError("not a fallback index")
+
+                (header_length,) = struct.unpack_from("<I", mapped, len(MAGIC))
+                header_start = len(MAGIC) + 4
+                header = json.loads(mapped[header_start:header_start + header_length])
+                docs = header["docs"]
+                postings_start = header_start + header_length
+                lengths_start = postings_start + header["postings_size"]
+                table_start = lengths_start + docs * 4
+                docs_start = table_start + docs * 8
+                if docs_start > len(mapped):
+                    raise ValueError("file is truncated")
+            except (ValueError, KeyError, TypeError, struct.error) as e:
+                mapped.close()
+                raise ValueError(f"Corrupt fallback index {self.path}: {e}") from e
+
+            self._header = header
+            self._view = memoryview(mapped)
+            self._postings_start = postings_start
+            self._docs_start = docs_start
+            self._lengths = self._view[lengths_start:table_start].cast("I")
+            self._doc_table = self._view[table_start:docs_start].cast("I")
+            self._mmap = mapped
+            return True
+
+
+def _read_jsonl(path: str) -> Iterable[Dict[str, Any]]:
+    """Records of a JSONL file."""
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the degraded-mode fallback index.")
+    parser.add_argument("records", nargs="+", help="JSONL files with question, answer and source_urls")
+    parser.add_argument("--output", default=".cache/fallback.idx")
+    args = parser.parse_args()
+
+    count = build_index((record for path in args.records for record in _read_jsonl(path)), args.output)
+    print(f"Indexed {count} answers into {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Infrastructure FAQ store - Versioned, expiring precomputed answers."""
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from .querylog import normalize_question
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FaqEntry:
+    """A precomputed answer for one frequently asked question."""
+    question: str
+    answer: str
+    source_urls: List[str] = field(default_factory=list)
+    version: int = 0
+    fetched_at: float = 0.0
+    expires_at: float = 0.0
+
+    @property
+    def expired(self) -> bool:
+        """Check if the entry is past its expiry time."""
+        return time.time() >= self.expires_at
+
+
+class FaqStore:
+    """
+    Normalized question → FaqEntry map persisted as a JSON file.
+
+    Every ``publish`` bumps the store version; entries keep the version of
+    the refresh that fetched them, so an answer that failed to refresh
+    stays servable until it expires.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self._path = path
+        self._entries: Dict[str, FaqEntry] = {}
+        self.version = 0
+        self.refreshed_at = 0.0
+        self._load()
+
+    def get(self, question: str) -> Optional[FaqEntry]:
+        """Get the live entry for a question, if any."""
+        entry = self._entries.get(normalize_question(question))
+        if entry is None or entry.expired:
+            return None
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def publish(self, entries: Iterable[FaqEntry]) -> None:
+        """Add the entries of a refresh, drop expired ones and persist."""
+        fresh = {normalize_question(entry.question): entry for entry in entries}
+        self._entries = {
+            key: entry for key, entry in {**self._entries, **fresh}.items() if not entry.expired
+        }
+        self.version += 1
+        self.refreshed_at = time.time()
+        self.save()
+
+    def reload(self) -> bool:
+        """Pick up a newer store written by another worker; returns whether it changed."""
+        version = self.version
+        self._load()
+        return self.version != version
+
+    def save(self) -> None:
+        """Write the store to disk."""
+        if not self._path:
+            return
+
+        try:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # Write atomically so a crash never leaves a truncated file
+            tmp_path = f"{self._path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": self.version,
+                    "refreshed_at": self.refreshed_at,
+                    "entries": [asdict(entry) for entry in self._entries.values()]
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.warning(f"Failed to persist FAQ store: {e}")
+
+    def _load(self) -> None:
+        """Load entries from disk, ignoring a missing or corrupt file."""
+        if not self._path or not os.path.exists(self._path):
+            return
+
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            entries = [FaqEntry(**item) for item in data.get("entries", [])]
+            self._entries = {normalize_question(entry.question): entry for entry in entries if not entry.expired}
+            self.version = int(data.get("version", 0))
+            self.refreshed_at = float(data.get("refreshed_at", 0.0))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Failed to load FAQ store: {e}")
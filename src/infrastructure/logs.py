@@ -0,0 +1,204 @@
+"""Infrastructure logging - Structured, sampled and non-blocking log output."""
+
+import atexit
+import hashlib
+import json
+import logging
+import queue
+import random
+import re
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+from ..core import current_correlation
+from .config import LoggingConfig
+from .metrics import metrics
+
+
+# Event fields that may carry user-typed text
+PII_FIELDS = frozenset({"question", "message", "query"})
+
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_NUMBER = re.compile(r"(?<!\w)\+?\d[\d .-]{5,}\d(?!\w)")
+
+
+def redact_text(text: Any, mode: str) -> Any:
+    """Redact user text: ``full`` keeps only length and a hash, ``mask`` hides emails and numbers."""
+    if mode == "off" or not isinstance(text, str) or not text:
+        return text
+    if mode == "mask":
+        return _NUMBER.sub("<number>", _EMAIL.sub("<email>", text))
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+    return f"<redacted len={len(text)} sha={digest}>"
+
+
+class EventSampler:
+    """
+    Per-event sampling rates.
+
+    Rates are looked up by event name and then by each dotted prefix, so
+    ``api=0.1`` samples every ``api.*`` event. Warnings and errors are
+    never sampled.
+    """
+
+    def __init__(self, config: LoggingConfig):
+        self.config = config
+
+    def rate(self, event: str, level: int) -> float:
+        """Get the sampling rate for an event."""
+        rates = self.config.sample_rates
+        if level >= logging.WARNING or not rates:
+            return 1.0
+        name = event
+        while True:
+            if name in rates:
+                return rates[name]
+            name, sep, _ = name.rpartition(".")
+            if not sep:
+                return 1.0
+
+
+class _LogState:
+    """Process-wide logging state installed by ``configure_logging``."""
+
+    def __init__(self):
+        self.config = LoggingConfig()
+        self.sampler = EventSampler(self.config)
+        self.handler: Optional['NonBlockingQueueHandler'] = None
+        self.listener: Optional[QueueListener] = None
+
+
+_state = _LogState()
+
+
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **fields: Any) -> None:
+    """
+    Log a structured event.
+
+    Nothing is formatted on the calling coroutine: disabled levels and
+    sampled-out events return immediately, and fields (callables are
+    evaluated late) are rendered by the listener thread.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    rate = _state.sampler.rate(event, level)
+    if rate < 1.0:
+        if random.random() >= rate:
+            return
+        fields["sample_rate"] = rate
+    logger.log(level, event, extra={"event": event, "fields": fields}, stacklevel=2)
+
+
+class CorrelationFilter(logging.Filter):
+    """Stamp records with the session and request id of the current context."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.session_id, record.request_id = current_correlation()
+        return True
+
+
+class StructuredFormatter(logging.Formatter):
+    """Render records as JSON lines or ``key=value`` text, redacting question text."""
+
+    def __init__(self, config: LoggingConfig):
+        super().__init__()
+        self.config = config
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        for key in ("session_id", "request_id"):
+            value = getattr(record, key, None)
+            if value:
+                data[key] = value
+
+        redaction = self.config.question_redaction
+        for key, value in getattr(record, "fields", {}).items():
+            if callable(value):
+                try:
+                    value = value()
+                except Exception as e:
+                    value = f"<error: {e}>"
+            data[key] = redact_text(value, redaction) if key in PII_FIELDS else value
+
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+
+        if self.config.format == "json":
+            return json.dumps(data, ensure_ascii=False, default=str)
+
+        head = f"{data.pop('ts')} {data.pop('level'):<7} {data.pop('logger')}: {data.pop('msg')}"
+        exc = data.pop("exc", None)
+        tail = " ".join(f"{key}={value!r}" if isinstance(value, str) else f"{key}={value}" for key, value in data.items())
+        text = f"{head} {tail}" if tail else head
+        return f"{text}\n{exc}" if exc else text
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the event loop.
+
+    Records are handed over unformatted (formatting happens on the listener
+    thread) and dropped, with a counter, when the bounded queue is full.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(queue.Queue(maxsize))
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            metrics.increment("logging.dropped")
+
+
+def configure_logging(config: LoggingConfig, level: str = "INFO") -> None:
+    """Route the root logger through the structured queue handler (idempotent)."""
+    root = logging.getLogger()
+    root.setLevel(level)
+    if _state.handler is not None:
+        return
+
+    _state.config = config
+    _state.sampler = EventSampler(config)
+
+    output = logging.StreamHandler()
+    output.setFormatter(StructuredFormatter(config))
+
+    handler = NonBlockingQueueHandler(config.queue_size)
+    handler.addFilter(CorrelationFilter())
+
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+
+    _state.handler = handler
+    _state.listener = QueueListener(handler.queue, output)
+    _state.listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and log synchronously from now on."""
+    if _state.listener is None:
+        return
+
+    root = logging.getLogger()
+    output = _state.listener.handlers[0]
+    _state.listener.stop()
+    root.removeHandler(_state.handler)
+    output.addFilter(CorrelationFilter())
+    root.addHandler(output)
+
+    _state.handler = None
+    _state.listener = None
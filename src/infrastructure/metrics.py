@@ -0,0 +1,80 @@
+"""Infrastructure metrics - In-process counters and latency windows."""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class LatencyWindow:
+    """Rolling window of the most recent latency samples."""
+
+    def __init__(self, size: int = 500):
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def observe(self, value: float) -> None:
+        """Record a latency sample in seconds."""
+        self._samples.append(value)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Get the given percentile (0-100), or None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class MetricsRegistry:
+    """Thread-safe registry of named counters and latency windows."""
+
+    def __init__(self, window_size: int = 500):
+        self._window_size = window_size
+        self._counters: Dict[str, int] = {}
+        self._latencies: Dict[str, LatencyWindow] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a latency sample."""
+        self.latency(name).observe(seconds)
+
+    def latency(self, name: str) -> LatencyWindow:
+        """Get (or create) the latency window for a name."""
+        window = self._latencies.get(name)
+        if window is None:
+            with self._lock:
+                window = self._latencies.setdefault(name, LatencyWindow(self._window_size))
+        return window
+
+    def counter(self, name: str) -> int:
+        """Get the current value of a counter."""
+        return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get all counters plus p50/p99 of every latency window."""
+        with self._lock:
+            data: Dict[str, float] = dict(self._counters)
+            windows = list(self._latencies.items())
+        for name, window in windows:
+            for pct in (50, 99):
+                value = window.percentile(pct)
+                if value is not None:
+                    data[f"{name}.p{pct}"] = value
+        return data
+
+    def reset(self) -> None:
+        """Clear all counters and latency windows."""
+        with self._lock:
+            self._counters.clear()
+            self._latencies.clear()
+
+
+# Global metrics instance
+metrics = MetricsRegistry()
@@ -0,0 +1,247 @@
+"""Infrastructure query log - Compact, rotating record of asked questions for replay."""
+
+import asyncio
+import atexit
+import glob
+import hashlib
+import heapq
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from ..domain import SearchResponse
+from .config import QueryLogConfig
+from .logs import redact_text
+
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(text: str) -> str:
+    """Collapse whitespace and lowercase a question."""
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def worker_log_path(path: str, worker_id: int) -> str:
+    """Per-worker log file in multi-worker mode (``query_log.w2.jsonl``)."""
+    root, ext = os.path.splitext(path)
+    return f"{root}.w{worker_id}{ext}"
+
+
+class QueryLogWriter:
+    """
+    Append-only JSON-lines log of asked questions.
+
+    ``record`` only enqueues; a daemon thread builds the entries, writes
+    them through a large file buffer, flushes every ``flush_interval``
+    seconds and rotates the file at ``max_bytes`` (``path.1`` is the most
+    recent backup). In multi-worker mode every worker writes its own
+    ``worker_log_path`` file. Entries use short keys to stay compact:
+
+        t   unix time             s   salted session hash
+        q   normalized question   l   frontend latency (s)
+        bl  backend latency (s)   ok  1 if answered without error
+        c   1 if served from cache, with ct the cache type
+        n   source count          f   1 if a follow-up sent with conversation context
+    """
+
+    _STOP = object()
+
+    def __init__(self, config: QueryLogConfig, worker_id: Optional[int] = None):
+        self.config = config
+        self.path = config.path if worker_id is None else worker_log_path(config.path, worker_id)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # Set when the file cannot be opened or rotated; questions are then dropped
+        self._disabled = False
+
+    def record(
+        self, session_id: Optional[str], question: str, response: SearchResponse, latency: float,
+        followup: bool = False
+    ) -> None:
+        """Queue a question and the outcome of answering it."""
+        if not self.config.enabled or self._disabled:
+            return
+        if self._thread is None:
+            self._start()
+        self._queue.put((
+            time.time(), session_id, question, latency, response.response_time,
+            response.error, response.cached, response.cache_type, response.source_count, followup
+        ))
+
+    def session_hash(self, session_id: Optional[str]) -> Optional[str]:
+        """Stable, salted hash identifying a session without storing its id."""
+        if not session_id:
+            return None
+        return hashlib.sha256(f"{self.config.session_salt}{session_id}".encode("utf-8")).hexdigest()[:12]
+
+    def close(self) -> None:
+        """Flush pending entries and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(self._STOP)
+            thread.join()
+
+    async def aclose(self) -> None:
+        """Close without blocking the event loop."""
+        await asyncio.to_thread(self.close)
+
+    def _start(self) -> None:
+        """Start the writer thread on first use."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="query-log", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _entry(
+        self, timestamp: float, session_id: Optional[str], question: str, latency: float,
+        backend_latency: float, error: bool, cached: bool, cache_type: Optional[str], source_count: int,
+        followup: bool
+    ) -> bytes:
+        """Encode one log line."""
+        entry: Dict[str, Any] = {
+            "t": round(timestamp, 3),
+            "s": self.session_hash(session_id),
+            "q": redact_text(normalize_question(question), self.config.question_redaction),
+            "l": round(latency, 4),
+            "bl": round(backend_latency, 4),
+            "ok": 0 if error else 1,
+            "c": 1 if cached else 0,
+            "n": source_count,
+            "f": 1 if followup else 0
+        }
+        if cache_type:
+            entry["ct"] = cache_type
+        return (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+    def _open(self):
+        """Open the log file for appending through the configured buffer."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return open(self.path, "ab", buffering=self.config.buffer_bytes or -1)
+
+    def _rotate(self, file):
+        """Shift backups (path.1 → path.2 …) and start a fresh file."""
+        file.close()
+        path, count = self.path, self.config.backup_count
+        if count > 0:
+            for index in range(count - 1, 0, -1):
+                if os.path.exists(f"{path}.{index}"):
+                    os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+            os.replace(path, f"{path}.1")
+        else:
+            os.remove(path)
+        return self._open()
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue into the file."""
+        try:
+            file = self._open()
+        except OSError as e:
+            self._disable(f"cannot open {self.path}: {e}")
+            return
+
+        size = file.tell()
+        last_flush = time.monotonic()
+        while True:
+            wait = max(0.0, self.config.flush_interval - (time.monotonic() - last_flush))
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                item = None
+            if item is self._STOP:
+                break
+
+            try:
+                if item is not None:
+                    line = self._entry(*item)
+                    if size and size + len(line) > self.config.max_bytes:
+                        file = self._rotate(file)
+                        size = 0
+                    file.write(line)
+                    size += len(line)
+                if time.monotonic() - last_flush >= self.config.flush_interval:
+                    file.flush()
+                    last_flush = time.monotonic()
+            except (OSError, ValueError) as e:
+                if file.closed:
+                    # Rotation closed the file but could not reopen it
+                    self._disable(f"cannot rotate {self.path}: {e}")
+                    return
+                logger.warning(f"Failed to write query log: {e}")
+
+        file.close()
+
+    def _disable(self, reason: str) -> None:
+        """Stop accepting questions and drop the ones already queued."""
+        self._disabled = True
+        logger.warning(f"Query log disabled, {reason}")
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+
+def query_log_files(path: str) -> List[str]:
+    """Existing log files for a single log path, oldest backup first."""
+    backups = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        backups.append(f"{path}.{index}")
+        index += 1
+    files = list(reversed(backups))
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def _read_files(files: List[str]) -> Iterator[Dict[str, Any]]:
+    """Yield entries from log files in order."""
+    for file_path in files:
+        with open(file_path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A crash can leave a truncated last line
+                    continue
+
+
+def read_query_log(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield entries from a query log, its backups and any worker logs in chronological order."""
+    root, ext = os.path.splitext(path)
+    worker_paths = sorted(glob.glob(f"{glob.escape(root)}.w*{glob.escape(ext)}"))
+    streams = [_read_files(query_log_files(log_path)) for log_path in [path, *worker_paths]]
+    if len(streams) == 1:
+        return streams[0]
+    return heapq.merge(*streams, key=lambda entry: entry.get("t", 0))
+
+
+def count_questions(path: str, wanted: Optional[Set[str]] = None, standalone_only: bool = False) -> Counter:
+    """
+    Count logged questions, restricted to ``wanted`` (normalized) when given.
+
+    With ``standalone_only`` only questions logged as asked without
+    conversation context count (entries older than the ``f`` flag do not).
+    """
+    counts: Counter = Counter()
+    for entry in read_query_log(path):
+        question = entry.get("q")
+        if standalone_only and entry.get("f") != 0:
+            continue
+        if question and (wanted is None or question in wanted):
+            counts[question] += 1
+    return counts
@@ -0,0 +1,108 @@
+"""Infrastructure scheduling - Priority lanes in front of the backend."""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional
+
+from ..core import INTERACTIVE, BULK, LANES, current_lane
+from .config import SchedulerConfig
+from .metrics import metrics
+
+
+class LaneScheduler:
+    """
+    Admits backend calls from the interactive and bulk lanes.
+
+    At most ``limit`` calls run at once, and each lane has its own cap so
+    bulk work can never occupy every slot. When a slot frees up and both
+    lanes are waiting, ``strict`` policy always picks interactive work;
+    ``weighted`` hands bulk one slot for every ``interactive_weight``
+    interactive grants so it still progresses. Bulk callers yield between
+    calls (e.g. between batch chunks) rather than being preempted mid-call.
+    """
+
+    def __init__(self, limit: int, config: Optional[SchedulerConfig] = None):
+        self.limit = limit
+        self.config = config or SchedulerConfig()
+        self._active: Dict[str, int] = {lane: 0 for lane in LANES}
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {lane: deque() for lane in LANES}
+        self._interactive_streak = 0
+
+    @asynccontextmanager
+    async def slot(self, lane: Optional[str] = None) -> AsyncIterator[None]:
+        """Hold a backend slot for the current (or given) lane."""
+        lane = lane or current_lane()
+        await self._acquire(lane)
+        try:
+            yield
+        finally:
+            self._release(lane)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Running and queued calls per lane."""
+        return {
+            lane: {"active": self._active[lane], "queued": len(self._waiters[lane]), "cap": self._cap(lane)}
+            for lane in LANES
+        }
+
+    def _cap(self, lane: str) -> int:
+        """Concurrency cap of a lane."""
+        cap = self.config.bulk_max_concurrent if lane == BULK else self.config.interactive_max_concurrent
+        return min(cap, self.limit) if cap else self.limit
+
+    def _has_room(self, lane: str) -> bool:
+        """Check if a call in ``lane`` could start now."""
+        return sum(self._active.values()) < self.limit and self._active[lane] < self._cap(lane)
+
+    async def _acquire(self, lane: str) -> None:
+        """Wait for a slot."""
+        # Bulk work never jumps ahead of queued interactive work
+        if not self._waiters[lane] and self._has_room(lane) and not (lane == BULK and self._waiters[INTERACTIVE]):
+            self._grant(lane)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(future)
+        metrics.increment(f"scheduler.{lane}.queued")
+        started = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as the caller gave up; pass the slot on
+                self._release(lane)
+            elif future in self._waiters[lane]:
+                self._waiters[lane].remove(future)
+            raise
+        metrics.observe(f"scheduler.{lane}.wait", time.monotonic() - started)
+
+    def _grant(self, lane: str) -> None:
+        """Count a call as running."""
+        self._active[lane] += 1
+        if lane == INTERACTIVE:
+            self._interactive_streak += 1
+        else:
+            self._interactive_streak = 0
+
+    def _release(self, lane: str) -> None:
+        """Free a slot and hand it to the next waiter."""
+        self._active[lane] -= 1
+        while True:
+            lane = self._next_lane()
+            if lane is None:
+                return
+            future = self._waiters[lane].popleft()
+            if not future.done():
+                self._grant(lane)
+                future.set_result(None)
+
+    def _next_lane(self) -> Optional[str]:
+        """Lane whose oldest waiter should get the next free slot."""
+        ready = [lane for lane in LANES if self._waiters[lane] and self._has_room(lane)]
+        if len(ready) < 2:
+            return ready[0] if ready else None
+        if self.config.policy == "weighted" and self._interactive_streak >= self.config.interactive_weight:
+            return BULK
+        return INTERACTIVE
@@ -0,0 +1,172 @@
+"""Infrastructure settings - Unified, validated and hot-reloadable configuration."""
+
+import asyncio
+import logging
+import os
+import signal
+from dataclasses import dataclass, fields
+from typing import Callable, List, Optional
+
+from ..core import ConfigurationException
+from .config import ApiConfig, SearchConfig, EnrichmentConfig, ConversationConfig, LoggingConfig, QueryLogConfig, RenderConfig, StarterConfig, FallbackConfig, SuggestionConfig, FaqConfig, SchedulerConfig, PipelineConfig, WorkerConfig
+
+
+logger = logging.getLogger(__name__)
+
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+@dataclass
+class Settings:
+    """All tunable settings of the frontend."""
+    api: ApiConfig
+    search: SearchConfig
+    enrichment: EnrichmentConfig
+    conversation: ConversationConfig
+    logging: LoggingConfig
+    query_log: QueryLogConfig
+    render: RenderConfig
+    starters: StarterConfig
+    fallback: FallbackConfig
+    suggestions: SuggestionConfig
+    faq: FaqConfig
+    scheduler: SchedulerConfig
+    workers: WorkerConfig
+    pipeline: PipelineConfig
+    log_level: str = "INFO"
+
+    SECTIONS = ("api", "search", "enrichment", "conversation", "logging", "query_log", "render", "starters", "fallback", "suggestions", "faq", "scheduler", "workers", "pipeline")
+
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """Create and validate Settings from environment variables."""
+        settings = cls(
+            api=ApiConfig.from_env(),
+            search=SearchConfig.from_env(),
+            enrichment=EnrichmentConfig.from_env(),
+            conversation=ConversationConfig.from_env(),
+            logging=LoggingConfig.from_env(),
+            query_log=QueryLogConfig.from_env(),
+            render=RenderConfig.from_env(),
+            starters=StarterConfig.from_env(),
+            fallback=FallbackConfig.from_env(),
+            suggestions=SuggestionConfig.from_env(),
+            faq=FaqConfig.from_env(),
+            scheduler=SchedulerConfig.from_env(),
+            workers=WorkerConfig.from_env(),
+            pipeline=PipelineConfig.from_env(),
+            log_level=os.getenv("LOG_LEVEL", "INFO").strip().upper()
+        )
+        if settings.log_level not in _LOG_LEVELS:
+            raise ConfigurationException(f"LOG_LEVEL must be one of {', '.join(_LOG_LEVELS)}")
+        return settings
+
+
+class SettingsManager:
+    """
+    Owns the live Settings and applies reloads.
+
+    On reload the environment file is re-read and validated as a whole; an
+    invalid file leaves the running settings untouched. Fields listed in a
+    section's ``HOT_RELOAD_FIELDS`` are updated in place on the live config
+    objects (which the components hold by reference), anything else is
+    reported as needing a restart.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None, env_file: Optional[str] = ".env"):
+        self.env_file = env_file
+        self.settings = settings or Settings.from_env()
+        self._listeners: List[Callable[[Settings], None]] = []
+        self._watch_task: Optional[asyncio.Task] = None
+        self._env_mtime = self._mtime()
+        self._apply_log_level()
+
+    def on_reload(self, callback: Callable[[Settings], None]) -> None:
+        """Register a callback run after every successful reload."""
+        self._listeners.append(callback)
+
+    def reload(self) -> List[str]:
+        """Re-read settings and hot-swap what is safe; returns changed field names."""
+        try:
+            if self.env_file and os.path.exists(self.env_file):
+                from dotenv import load_dotenv
+                load_dotenv(self.env_file, override=True)
+            fresh = Settings.from_env()
+        except ConfigurationException as e:
+            logger.error(f"Settings reload rejected, keeping current settings: {e}")
+            return []
+
+        changed = []
+        for section in Settings.SECTIONS:
+            live = getattr(self.settings, section)
+            new = getattr(fresh, section)
+            for f in fields(live):
+                old_value, new_value = getattr(live, f.name), getattr(new, f.name)
+                if old_value == new_value:
+                    continue
+                name = f"{section}.{f.name}"
+                if f.name in live.HOT_RELOAD_FIELDS:
+                    setattr(live, f.name, new_value)
+                    changed.append(name)
+                else:
+                    logger.warning(f"Setting {name} changed but requires a restart to apply")
+
+        if fresh.log_level != self.settings.log_level:
+            self.settings.log_level = fresh.log_level
+            self._apply_log_level()
+            changed.append("log_level")
+
+        for callback in self._listeners:
+            try:
+                callback(self.settings)
+            except Exception as e:
+                logger.warning(f"Settings reload listener failed: {e}")
+
+        if changed:
+            logger.info(f"Settings reloaded: {', '.join(changed)}")
+        return changed
+
+    def start(self, poll_interval: float = 5.0) -> None:
+        """Reload on SIGHUP and on env file changes (idempotent, needs a running loop)."""
+        if self._watch_task is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGHUP, self.reload)
+        except (NotImplementedError, AttributeError, RuntimeError):
+            # No SIGHUP on this platform (or not the main thread); file polling still works
+            pass
+
+        self._watch_task = loop.create_task(self._watch(poll_interval))
+
+    async def stop(self) -> None:
+        """Stop watching for changes."""
+        try:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+        except (NotImplementedError, AttributeError, RuntimeError):
+            pass
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            await asyncio.gather(self._watch_task, return_exceptions=True)
+            self._watch_task = None
+
+    async def _watch(self, poll_interval: float) -> None:
+        """Poll the env file modification time."""
+        while True:
+            await asyncio.sleep(poll_interval)
+            mtime = self._mtime()
+            if mtime != self._env_mtime:
+                self._env_mtime = mtime
+                self.reload()
+
+    def _mtime(self) -> Optional[float]:
+        """Modification time of the env file, if it exists."""
+        try:
+            return os.path.getmtime(self.env_file) if self.env_file else None
+        except OSError:
+            return None
+
+    def _apply_log_level(self) -> None:
+        """Apply the configured root log level."""
+        logging.getLogger().setLevel(self.settings.log_level)
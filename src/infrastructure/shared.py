@@ -0,0 +1,176 @@
+"""Infrastructure shared state - Counters, locks and values shared by worker processes."""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocalState:
+    """
+    In-process key/value store with expiry.
+
+    Used directly in single-process mode, and as the storage of the
+    ``SharedStateServer`` that workers reach over a Unix socket; both
+    expose the same async API so callers do not care which they have.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}
+
+    async def get(self, key: str) -> Any:
+        """Get a value, or None when missing or expired."""
+        return self._get(key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None, nx: bool = False) -> bool:
+        """Set a value; with ``nx`` only if the key is absent (a lock). Returns whether it was set."""
+        if nx and self._get(key) is not None:
+            return False
+        self._data[key] = (value, time.time() + ttl if ttl else None)
+        return True
+
+    async def incr(self, key: str, amount: float = 1, ttl: Optional[float] = None) -> float:
+        """Add to a numeric value and return the new total; ``ttl`` applies when the key is created."""
+        current = self._get(key)
+        expires_at = time.time() + ttl if ttl and current is None else self._data.get(key, (None, None))[1]
+        value = (current or 0) + amount
+        self._data[key] = (value, expires_at)
+        return value
+
+    async def delete(self, key: str) -> None:
+        """Remove a key."""
+        self._data.pop(key, None)
+
+    async def scan(self, prefix: str) -> Dict[str, Any]:
+        """All live values whose key starts with ``prefix``."""
+        return {
+            key: value for key in list(self._data)
+            if key.startswith(prefix) and (value := self._get(key)) is not None
+        }
+
+    def _get(self, key: str) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and time.time() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    async def aclose(self) -> None:
+        """Nothing to release."""
+
+
+class SharedStateServer:
+    """
+    Serves a ``LocalState`` over a Unix socket, one JSON request per line.
+
+    Runs inside the worker supervisor so every worker process sees the
+    same counters, locks and values.
+    """
+
+    OPS = ("get", "set", "incr", "delete", "scan")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.state = LocalState()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Listen on the socket path."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._server = await asyncio.start_unix_server(self._serve, path=self.path)
+
+    async def aclose(self) -> None:
+        """Stop listening and remove the socket."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer requests from one worker connection."""
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    op = request.pop("op")
+                    if op not in self.OPS:
+                        raise ValueError(f"unknown op {op!r}")
+                    reply = {"value": await getattr(self.state, op)(**request)}
+                except (ValueError, TypeError, KeyError) as e:
+                    reply = {"error": str(e)}
+                writer.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class SharedStateClient:
+    """
+    Worker-side connection to a ``SharedStateServer``.
+
+    Requests are serialised over one connection that is reopened on
+    failure; an unreachable server raises ``OSError`` so callers can fall
+    back to local behaviour.
+    """
+
+    def __init__(self, path: str, timeout: float = 1.0):
+        self.path = path
+        self.timeout = timeout
+        self._lock = asyncio.Lock()
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def get(self, key: str) -> Any:
+        return await self._call("get", key=key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None, nx: bool = False) -> bool:
+        return await self._call("set", key=key, value=value, ttl=ttl, nx=nx)
+
+    async def incr(self, key: str, amount: float = 1, ttl: Optional[float] = None) -> float:
+        return await self._call("incr", key=key, amount=amount, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._call("delete", key=key)
+
+    async def scan(self, prefix: str) -> Dict[str, Any]:
+        return await self._call("scan", prefix=prefix)
+
+    async def aclose(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            self._reader = self._writer = None
+
+    async def _call(self, op: str, **fields: Any) -> Any:
+        """Send one request and wait for its reply."""
+        async with self._lock:
+            try:
+                async with asyncio.timeout(self.timeout):
+                    if self._writer is None:
+                        self._reader, self._writer = await asyncio.open_unix_connection(self.path)
+                    self._writer.write(json.dumps({"op": op, **fields}, ensure_ascii=False).encode("utf-8") + b"\n")
+                    await self._writer.drain()
+                    line = await self._reader.readline()
+                if not line:
+                    raise ConnectionError("shared state server closed the connection")
+            except (OSError, TimeoutError) as e:
+                await self.aclose()
+                raise OSError(f"Shared state unavailable: {e}") from e
+
+        reply = json.loads(line)
+        if "error" in reply:
+            raise ValueError(reply["error"])
+        return reply["value"]
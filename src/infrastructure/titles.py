@@ -0,0 +1,141 @@
+"""Infrastructure page title lookup - Fetching and persisting source titles."""
+
+import asyncio
+import html
+import json
+import logging
+import os
+import re
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+_TITLE_PATTERN = re.compile(rb"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+class PersistentTitleCache:
+    """Bounded URL → page title map persisted as a JSON file."""
+
+    def __init__(self, path: Optional[str], max_entries: int = 5000):
+        self._path = path
+        self._max_entries = max_entries
+        self._titles: "OrderedDict[str, str]" = OrderedDict()
+        self._dirty = False
+        self._load()
+
+    def get(self, url: str) -> Optional[str]:
+        """Get cached title for a URL."""
+        return self._titles.get(url)
+
+    def set(self, url: str, title: str) -> None:
+        """Store a title, evicting the oldest entry when full."""
+        self._titles[url] = title
+        self._titles.move_to_end(url)
+        while len(self._titles) > self._max_entries:
+            self._titles.popitem(last=False)
+        self._dirty = True
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._titles
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed since the last save."""
+        if not self._path or not self._dirty:
+            return
+
+        try:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # Write atomically so a crash never leaves a truncated file
+            tmp_path = f"{self._path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._titles, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to persist title cache: {e}")
+
+    def _load(self) -> None:
+        """Load titles from disk, ignoring a missing or corrupt file."""
+        if not self._path or not os.path.exists(self._path):
+            return
+
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data: Dict[str, str] = json.load(f)
+            for url, title in list(data.items())[-self._max_entries:]:
+                if isinstance(url, str) and isinstance(title, str):
+                    self._titles[url] = title
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load title cache: {e}")
+
+
+class PageTitleFetcher:
+    """Fetches HTML page titles with bounded concurrency."""
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        max_concurrency: int = 4,
+        max_bytes: int = 65536,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self._timeout = timeout
+        self._max_bytes = max_bytes
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def fetch_title(self, url: str) -> Optional[str]:
+        """Fetch the <title> of a page, or None if it cannot be resolved."""
+        async with self._semaphore:
+            try:
+                client = self._get_client()
+                async with client.stream("GET", url) as response:
+                    if response.status_code != 200:
+                        return None
+
+                    # Titles live in <head>; stop reading once we have enough
+                    body = b""
+                    async for chunk in response.aiter_bytes():
+                        body += chunk
+                        if len(body) >= self._max_bytes or b"</title>" in body.lower():
+                            break
+
+                return self._extract_title(body[:self._max_bytes])
+
+            except httpx.HTTPError as e:
+                logger.debug(f"Title fetch failed for {url}: {e}")
+                return None
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the shared HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self._timeout, follow_redirects=True, transport=self._transport)
+        return self._client
+
+    @staticmethod
+    def _extract_title(body: bytes) -> Optional[str]:
+        """Extract and clean the title text from an HTML fragment."""
+        match = _TITLE_PATTERN.search(body)
+        if not match:
+            return None
+
+        title = html.unescape(match.group(1).decode("utf-8", errors="ignore"))
+        title = " ".join(title.split())
+        return title or None
@@ -0,0 +1,127 @@
+"""Infrastructure URL helpers - Source URL normalization."""
+
+from functools import lru_cache
+from typing import Any, Iterable, List
+from urllib.parse import urlparse
+
+
+def normalize_url(url: str) -> str:
+    """Normalize URL by removing www and trailing slash."""
+    if not url or not isinstance(url, str):
+        return url
+
+    # Clean up the URL first
+    url = url.strip()
+
+    try:
+        # Add scheme if missing
+        if not url.startswith(('http://', 'https://')):
+            if url.startswith('www.'):
+                url = 'https://' + url
+            elif '.' in url:
+                url = 'https://' + url
+            else:
+                return url  # Return as-is if it doesn't look like a URL
+
+        # Parse the URL
+        parsed = urlparse(url)
+
+        # Get hostname and remove www
+        hostname = parsed.hostname
+        if not hostname:
+            return url  # Return original if hostname is invalid
+
+        if hostname.startswith('www.'):
+            hostname = hostname[4:]
+
+        # Build normalized URL
+        normalized_url = f"{parsed.scheme}://{hostname}"
+
+        # Add port if it exists and is not default
+        if parsed.port and parsed.port not in [80, 443]:
+            normalized_url += f":{parsed.port}"
+
+        # Add path if it exists and is not just '/'
+        if parsed.path and parsed.path != '/':
+            # Remove trailing slash from path
+            path = parsed.path.rstrip('/')
+            if path:  # Only add if path is not empty after stripping
+                normalized_url += path
+
+        # Add query and fragment if they exist
+        if parsed.query:
+            normalized_url += f"?{parsed.query}"
+        if parsed.fragment:
+            normalized_url += f"#{parsed.fragment}"
+
+        return normalized_url
+
+    except Exception:
+        # If URL parsing fails, return original URL with basic cleanup
+        clean_url = url
+
+        # Remove www
+        if 'www.' in clean_url:
+            clean_url = clean_url.replace('://www.', '://').replace('www.', '')
+
+        # Handle trailing slash carefully
+        if clean_url.endswith('/') and '?' not in clean_url and '#' not in clean_url:
+            # Only remove trailing slash if there are no query params or fragments
+            # and if it's not just the root path
+            if clean_url.count('/') > 2:  # More than just protocol://domain/
+                clean_url = clean_url.rstrip('/')
+
+        return clean_url
+
+
+class UrlNormalizer:
+    """
+    Memoized URL normalizer.
+
+    The backend returns the same small set of source URLs over and over, so
+    normalized results are kept in a bounded LRU keyed by the raw URL.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self._normalize = lru_cache(maxsize=maxsize)(normalize_url)
+
+    def normalize(self, url: Any) -> Any:
+        """Normalize a single URL, returning non-string input unchanged."""
+        if not url or not isinstance(url, str):
+            return url
+        return self._normalize(url)
+
+    def normalize_many(self, urls: Iterable[Any]) -> List[str]:
+        """Normalize and deduplicate a list of URLs in a single pass."""
+        if not urls:
+            return []
+
+        normalize = self._normalize
+        seen = set()
+        unique_urls = []
+
+        for url in urls:
+            if not url or not isinstance(url, str):
+                continue
+
+            normalized = normalize(url)
+
+            # Compare case-insensitively but keep original case for display
+            key = normalized.lower()
+            if key not in seen:
+                seen.add(key)
+                unique_urls.append(normalized)
+
+        return unique_urls
+
+    def cache_info(self):
+        """Return hit/miss statistics of the memo cache."""
+        return self._normalize.cache_info()
+
+    def clear(self) -> None:
+        """Drop all memoized URLs."""
+        self._normalize.cache_clear()
+
+
+# Shared normalizer instance
+url_normalizer = UrlNormalizer()
@@ -0,0 +1,194 @@
+"""Infrastructure workers - Multi-process production mode behind a sticky proxy.
+
+The supervisor starts ``WEB_CONCURRENCY`` Chainlit workers on loopback
+ports (watch mode off), serves shared state to them over a Unix socket and
+accepts the public traffic itself. Each connection is routed by the client
+address (``X-Forwarded-For`` when trusted), so a browser's websocket and
+its HTTP calls always reach the worker holding its session.
+
+On SIGTERM/SIGINT the listener closes, workers get SIGTERM to finish their
+in-flight answers, and anything still running after ``WORKER_DRAIN_TIMEOUT``
+is killed.
+
+Run with: python -m src.infrastructure.workers [--workers 4] [--port 8080]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+import tempfile
+import zlib
+from typing import Callable, List, Optional, Sequence, Set
+
+from .config import WorkerConfig
+from .shared import SharedStateServer
+
+
+logger = logging.getLogger(__name__)
+
+_HEADER_LIMIT = 64 * 1024
+
+
+def chainlit_command(port: int) -> List[str]:
+    """Command running one Chainlit worker."""
+    return [sys.executable, "-m", "chainlit", "run", "app.py", "--headless", "--host", "127.0.0.1", "--port", str(port)]
+
+
+class StickyProxy:
+    """TCP proxy pinning each client address to one worker port."""
+
+    def __init__(self, ports: Sequence[int], trust_forwarded: bool = False):
+        self.ports = list(ports)
+        self.trust_forwarded = trust_forwarded
+        self._connections: Set[asyncio.Task] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str, port: int) -> None:
+        """Start accepting connections."""
+        self._server = await asyncio.start_server(self._handle, host, port, limit=_HEADER_LIMIT)
+
+    async def stop_accepting(self) -> None:
+        """Close the listener; open connections keep running."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+    async def drain(self, timeout: float) -> None:
+        """Wait for open connections to finish, then cut the rest."""
+        if self._connections:
+            await asyncio.wait(set(self._connections), timeout=timeout)
+        for task in list(self._connections):
+            task.cancel()
+
+    def route(self, head: bytes, peer: Optional[str]) -> int:
+        """Worker port for a request head and peer address."""
+        key = peer or ""
+        if self.trust_forwarded:
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() in (b"x-forwarded-for", b"x-real-ip") and value.strip():
+                    key = value.split(b",")[0].strip().decode("latin-1")
+                    break
+        return self.ports[zlib.crc32(key.encode("utf-8")) % len(self.ports)]
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        upstream_writer = None
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            peer = writer.get_extra_info("peername")
+            port = self.route(head, peer[0] if peer else None)
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", port)
+            upstream_writer.write(head)
+            await asyncio.gather(self._pipe(reader, upstream_writer), self._pipe(upstream_reader, writer))
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, OSError):
+            pass
+        finally:
+            for stream in (upstream_writer, writer):
+                if stream is not None:
+                    stream.close()
+            self._connections.discard(task)
+
+    @staticmethod
+    async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Copy bytes one way until EOF."""
+        try:
+            while data := await reader.read(65536):
+                writer.write(data)
+                await writer.drain()
+        finally:
+            if writer.can_write_eof():
+                try:
+                    writer.write_eof()
+                except OSError:
+                    pass
+
+
+class Supervisor:
+    """Runs the worker processes, the shared state server and the proxy."""
+
+    def __init__(self, config: WorkerConfig, command: Callable[[int], List[str]] = chainlit_command):
+        self.config = config
+        self.command = command
+        self.ports = [config.base_port + i for i in range(config.workers)]
+        self.socket_path = config.shared_state_socket or os.path.join(
+            tempfile.gettempdir(), f"chatbot-ug-{os.getpid()}.sock"
+        )
+        self.shared = SharedStateServer(self.socket_path)
+        self.proxy = StickyProxy(self.ports, config.trust_forwarded)
+        self._processes: List[Optional[asyncio.subprocess.Process]] = [None] * config.workers
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        """Serve until SIGTERM/SIGINT, then drain."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._stopping.set)
+
+        await self.shared.start()
+        watchers = [asyncio.create_task(self._keep_alive(index)) for index in range(self.config.workers)]
+        await self.proxy.start(self.config.host, self.config.port)
+        logger.info(f"Serving {self.config.workers} workers on {self.config.host}:{self.config.port}")
+
+        await self._stopping.wait()
+        logger.info("Shutting down: draining workers")
+        await self.proxy.stop_accepting()
+        for process in self._processes:
+            if process is not None and process.returncode is None:
+                process.send_signal(signal.SIGTERM)
+
+        # Workers finish in-flight answers while their connections stay piped
+        await asyncio.wait(watchers, timeout=self.config.drain_timeout)
+        for process in self._processes:
+            if process is not None and process.returncode is None:
+                process.kill()
+        await asyncio.gather(*watchers, return_exceptions=True)
+        await self.proxy.drain(0)
+        await self.shared.aclose()
+
+    async def _keep_alive(self, index: int) -> None:
+        """Run one worker, restarting it if it dies while serving."""
+        backoff = 1.0
+        while not self._stopping.is_set():
+            env = {
+                **os.environ,
+                "WORKER_ID": str(index),
+                "WEB_CONCURRENCY": str(self.config.workers),
+                "SHARED_STATE_SOCKET": self.socket_path
+            }
+            started = asyncio.get_running_loop().time()
+            process = await asyncio.create_subprocess_exec(*self.command(self.ports[index]), env=env)
+            self._processes[index] = process
+            code = await process.wait()
+            if self._stopping.is_set():
+                return
+            if asyncio.get_running_loop().time() - started > 60:
+                backoff = 1.0
+            logger.warning(f"Worker {index} exited with {code}; restarting in {backoff:.0f}s")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=backoff)
+            except TimeoutError:
+                pass
+            backoff = min(backoff * 2, 30.0)
+
+
+def main() -> None:
+    config = WorkerConfig.from_env()
+    parser = argparse.ArgumentParser(description="Run the chatbot with several worker processes.")
+    parser.add_argument("--workers", type=int, default=config.workers)
+    parser.add_argument("--host", default=config.host)
+    parser.add_argument("--port", type=int, default=config.port)
+    args = parser.parse_args()
+
+    config.workers, config.host, config.port = args.workers, args.host, args.port
+    config.validate()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(Supervisor(config).run())
+
+
+if __name__ == "__main__":
+    main()
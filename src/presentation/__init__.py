@@ -3,10 +3,14 @@
 from .controllers import ChatController, BatchController
 from .formatters import ResponseFormatter
 from .config import ChatProfileConfig
+from .starters import StarterCatalog, StarterCategory, ProfileVariant
 
 __all__ = [
     'ChatController',
     'BatchController',
     'ResponseFormatter', 
-    'ChatProfileConfig'
+    'ChatProfileConfig',
+    'StarterCatalog',
+    'StarterCategory',
+    'ProfileVariant'
 ]
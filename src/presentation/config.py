@@ -1,140 +1,80 @@
 """Presentation configuration - UI configuration."""
 
 import random
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+from ..infrastructure import StarterConfig
+from .starters import ProfileVariant, StarterCatalog
 
 
 class ChatProfileConfig:
-    """Simplified configuration for chat profiles."""
-    
-    @staticmethod
-    def get_all_questions() -> Dict[str, List[Dict[str, str]]]:
-        """Get all categorized questions by icon."""
-        return {
-            "write.svg": [
-                {
-                    'label': "Cara mendaftar kuliah",
-                    'message': "Bagaimana cara mendaftar kuliah di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Syarat pendaftaran",
-                    'message': "Apa saja syarat pendaftaran mahasiswa baru di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Prosedur registrasi ulang",
-                    'message': "Bagaimana prosedur registrasi ulang mahasiswa di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Cara mengurus KTM",
-                    'message': "Bagaimana cara mengurus Kartu Tanda Mahasiswa (KTM) di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Prosedur mengambil cuti",
-                    'message': "Bagaimana prosedur mengajukan cuti akademik di Universitas Gunadarma?",
-                }
-            ],
-            "learn.svg": [
-                {
-                    'label': "Program studi yang tersedia",
-                    'message': "Program studi apa saja yang tersedia di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Sistem pembelajaran",
-                    'message': "Bagaimana sistem pembelajaran yang diterapkan di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Kurikulum dan mata kuliah",
-                    'message': "Seperti apa kurikulum dan mata kuliah di program studi Universitas Gunadarma?",
-                },
-                {
-                    'label': "Jadwal perkuliahan",
-                    'message': "Bagaimana sistem penjadwalan perkuliahan di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Program magang/PKL",
-                    'message': "Apakah ada program magang atau Praktek Kerja Lapangan (PKL) di Universitas Gunadarma?",
-                }
-            ],
-            "question.svg": [
-                {
-                    'label': "Fasilitas kampus",
-                    'message': "Fasilitas apa saja yang tersedia di kampus Universitas Gunadarma?",
-                },
-                {
-                    'label': "Perpustakaan dan laboratorium",
-                    'message': "Bagaimana fasilitas perpustakaan dan laboratorium di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Layanan mahasiswa",
-                    'message': "Layanan apa saja yang tersedia untuk mendukung mahasiswa di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Fasilitas olahraga",
-                    'message': "Fasilitas olahraga dan ekstrakurikuler apa saja yang tersedia di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Kantin dan parkir",
-                    'message': "Bagaimana fasilitas kantin dan area parkir di Universitas Gunadarma?",
-                }
-            ],
-            "idea.svg": [
-                {
-                    'label': "Kontak dan alamat",
-                    'message': "Dimana alamat dan bagaimana cara menghubungi Universitas Gunadarma?",
-                },
-                {
-                    'label': "Biaya kuliah",
-                    'message': "Berapa biaya kuliah dan cara pembayaran di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Beasiswa tersedia",
-                    'message': "Program beasiswa apa saja yang tersedia di Universitas Gunadarma?",
-                },
-                {
-                    'label': "Prospek karir lulusan",
-                    'message': "Bagaimana prospek karir dan peluang kerja lulusan Universitas Gunadarma?",
-                },
-                {
-                    'label': "Akreditasi program studi",
-                    'message': "Bagaimana status akreditasi program studi di Universitas Gunadarma?",
-                }
-            ]
-        }
-    
-    @staticmethod
-    def get_random_starters() -> List[Dict[str, str]]:
-        """Get one random question from each icon category."""
-        all_questions = ChatProfileConfig.get_all_questions()
-        starters = []
-        
-        for icon, questions in all_questions.items():
-            # Pick one random question from each category
-            selected_question = random.choice(questions)
-            starters.append({
-                'label': selected_question['label'],
-                'message': selected_question['message'],
-                'icon': f"/public/{icon}"
-            })
-        
-        # Shuffle the order of starters to randomize which icon appears first
-        random.shuffle(starters)
-        return starters
-    
-    @staticmethod
-    def create_chat_profile(hybrid_available: bool = True) -> Dict[str, Any]:
-        """Create chat profile with basic configuration."""
-        # Get randomized starter questions
-        starters = ChatProfileConfig.get_random_starters()
-        
-        description = """
+    """
+    Chat profile configuration backed by the starter catalog.
+
+    A pool of profile variants, each with one weighted pick per starter
+    category, is built once (and again when popularity changes), so a new
+    session only picks a ready-made variant.
+    """
+
+    NAME = "Chatbot UG"
+    ICON = "/public/favicon.png"
+    DESCRIPTION = """
 ## **Chatbot Universitas Gunadarma**
 
 Siap membantu menjawab pertanyaan seputar informasi Universitas Gunadarma.
 """
-        
+
+    def __init__(self, catalog: Optional[StarterCatalog] = None, variants: int = 16):
+        self.base_catalog = catalog or StarterCatalog.load(StarterConfig().path)
+        self.catalog = self.base_catalog
+        self.variant_count = variants
+        self._rng = random.Random()
+        self._variants = self._build_variants()
+
+    def get_all_questions(self) -> Dict[str, List[Dict[str, str]]]:
+        """Get all categorized questions by icon."""
         return {
-            'name': "Chatbot UG",
-            'description': description,
-            'icon': "/public/favicon.png",
-            'starters': starters,
+            category.icon: [{'label': q.label, 'message': q.content} for q in category.questions]
+            for category in self.catalog.categories
         }
+
+    def get_random_starters(self) -> List[Dict[str, str]]:
+        """Get one weighted random question from each icon category."""
+        return [
+            {'label': q.label, 'message': q.content, 'icon': q.icon}
+            for q in self.choose_variant().starters
+        ]
+
+    def choose_variant(self) -> ProfileVariant:
+        """Pick one of the precomputed profile variants."""
+        return self._rng.choice(self._variants)
+
+    def create_chat_profile(self, hybrid_available: bool = True) -> Dict[str, Any]:
+        """Create chat profile with basic configuration."""
+        variant = self.choose_variant()
+        return {
+            'name': variant.name,
+            'description': variant.description,
+            'icon': variant.icon,
+            'starters': [
+                {'label': q.label, 'message': q.content, 'icon': q.icon}
+                for q in variant.starters
+            ],
+        }
+
+    def update_popularity(self, popularity: Mapping[str, int], strength: float = 1.0) -> None:
+        """Re-rank starters by how often they were asked and rebuild the variants."""
+        self.catalog = self.base_catalog.reweighted(popularity, strength)
+        self._variants = self._build_variants()
+
+    def _build_variants(self) -> Tuple[ProfileVariant, ...]:
+        """Pre-render the pool of profile variants."""
+        return tuple(
+            ProfileVariant(
+                name=self.NAME,
+                description=self.DESCRIPTION,
+                icon=self.ICON,
+                starters=tuple(self.catalog.sample(self._rng))
+            )
+            for _ in range(self.variant_count)
+        )
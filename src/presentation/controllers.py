@@ -3,7 +3,8 @@
 import logging
 from typing import Optional, Dict, Any
 
-from ..application import ChatUseCase, HealthCheckUseCase, SearchUseCase, BatchSearchUseCase
+from ..application import ChatUseCase, HealthCheckUseCase, SearchUseCase, BatchSearchUseCase, SessionRegistry
+from ..core import correlation_scope, deadline_scope
 from ..domain import SearchStrategy, BatchRequest, BatchResponse
 from .formatters import ResponseFormatter
 
@@ -19,24 +20,29 @@ class ChatController:
         chat_use_case: ChatUseCase,
         search_use_case: SearchUseCase,
         health_check_use_case: HealthCheckUseCase,
-        formatter: ResponseFormatter
+        formatter: ResponseFormatter,
+        session_registry: Optional[SessionRegistry] = None,
+        request_deadline: float = 60.0
     ):
         self.chat_use_case = chat_use_case
         self.search_use_case = search_use_case
         self.health_check_use_case = health_check_use_case
         self.formatter = formatter
+        self.session_registry = session_registry
+        self.request_deadline = request_deadline
         self.hybrid_available = True
     
     async def process_message(
         self, 
         message_content: str,
         search_strategy: str = None,
-        show_sources: bool = True
+        show_sources: bool = True,
+        session_id: Optional[str] = None
     ) -> str:
         """Process user message and return response."""
         try:
             if message_content.startswith("/"):
-                return await self.handle_special_commands(message_content)
+                return await self.handle_special_commands(message_content, session_id)
             
             # Always use hybrid search - no fallback
             search_options = {                
@@ -44,17 +50,21 @@ class ChatController:
                 'show_sources': True
             }
             
-            response_text = await self.chat_use_case.process_user_message(
-                message_content, 
-                search_options=search_options
-            )
+            # End-to-end budget for this message, shared by all retries below;
+            # log lines and backend calls carry the session and request id
+            with correlation_scope(session_id=session_id), deadline_scope(self.request_deadline):
+                response_text = await self.chat_use_case.process_user_message(
+                    message_content, 
+                    search_options=search_options,
+                    session_id=session_id
+                )
             return response_text
             
         except Exception as e:
             logger.error(f"Error in message handling: {e}")
             return f"❌ **Error:** Terjadi kesalahan yang tidak terduga: {str(e)}"
     
-    async def handle_special_commands(self, command: str) -> str:
+    async def handle_special_commands(self, command: str, session_id: Optional[str] = None) -> str:
         """Handle special commands for advanced features."""
         command = command.lower()
         
@@ -62,6 +72,9 @@ class ChatController:
             return self._get_help_text()
         elif command.startswith("/health"):
             return await self._get_health_status()
+        elif command.startswith("/more"):
+            continuation = self.chat_use_case.continue_response(session_id) if session_id else None
+            return continuation or "ℹ️ Tidak ada lanjutan jawaban untuk ditampilkan."
         else:
             return "❌ Perintah tidak dikenali. Ketik `/help` untuk melihat perintah yang tersedia."
     
@@ -72,6 +85,7 @@ class ChatController:
 
 - `/help` - Tampilkan bantuan ini
 - `/health` - Cek status sistem
+- `/more` - Tampilkan lanjutan jawaban yang dipotong
 
 **💡 Tips:**
 - Gunakan pertanyaan yang spesifik untuk hasil yang lebih baik
@@ -82,13 +96,30 @@ class ChatController:
         """Get health status."""
         try:
             health_info = await self.health_check_use_case.execute()
+            session_line = ""
+            if self.session_registry:
+                stats = self.session_registry.stats()
+                session_line = (
+                    f"**Sesi Aktif:** {stats['live_sessions']} "
+                    f"({stats['total_memory_bytes'] / 1024:.1f} KB)\n"
+                )
+            lanes = health_info.get('scheduler')
+            if lanes:
+                session_line += (
+                    f"**Antrian Backend:** interaktif {lanes['interactive']['active']} berjalan / "
+                    f"{lanes['interactive']['queued']} menunggu, batch {lanes['bulk']['active']} berjalan / "
+                    f"{lanes['bulk']['queued']} menunggu\n"
+                )
+            cluster = health_info.get('cluster')
+            if cluster and 'live_workers' in cluster:
+                session_line += f"**Worker Aktif:** {cluster['live_workers']}\n"
             return f"""
 **🏥 Status Sistem:**
 
 **Service:** {health_info.get('service_status', 'Unknown')}
 **Backend:** {health_info.get('backend_status', 'Unknown')}
 **Mode:** Hybrid Search ✅
-
+{session_line}
 **Strategi Tersedia:** Hybrid Search
             """
         except Exception as e:
@@ -0,0 +1,102 @@
+"""Presentation starters - Precomputed starter question catalog."""
+
+import bisect
+import json
+import math
+import random
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ..domain import StarterQuestion
+from ..infrastructure import normalize_question
+
+
+@dataclass(frozen=True)
+class StarterCategory:
+    """Starter questions sharing an icon, with cumulative weights for sampling."""
+    icon: str
+    questions: Tuple[StarterQuestion, ...]
+    cumulative_weights: Tuple[float, ...]
+
+    @classmethod
+    def build(cls, icon: str, questions: Iterable[StarterQuestion]) -> 'StarterCategory':
+        """Create a category, precomputing its cumulative weights."""
+        questions = tuple(questions)
+        return cls(icon, questions, tuple(accumulate(q.weight for q in questions)))
+
+    def sample(self, rng: random.Random) -> StarterQuestion:
+        """Pick one question with probability proportional to its weight."""
+        point = rng.random() * self.cumulative_weights[-1]
+        return self.questions[bisect.bisect_right(self.cumulative_weights, point)]
+
+
+@dataclass(frozen=True, eq=False)
+class ProfileVariant:
+    """A pre-rendered chat profile; compared by identity so it can key UI caches."""
+    name: str
+    description: str
+    icon: str
+    starters: Tuple[StarterQuestion, ...]
+
+
+class StarterCatalog:
+    """
+    Immutable catalog of starter questions loaded from a JSON data file.
+
+    The file holds ``{"categories": [{"icon": ..., "questions": [{"label",
+    "message", "weight"}]}]}``; one question is drawn per category.
+    """
+
+    def __init__(self, categories: Sequence[StarterCategory]):
+        self.categories: Tuple[StarterCategory, ...] = tuple(c for c in categories if c.questions)
+        if not self.categories:
+            raise ValueError("Starter catalog must contain at least one question")
+
+    @classmethod
+    def load(cls, path: str) -> 'StarterCatalog':
+        """Load and validate a catalog file."""
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+
+        categories = []
+        for category in data["categories"]:
+            icon = category["icon"]
+            categories.append(StarterCategory.build(icon, (
+                StarterQuestion(
+                    content=item["message"],
+                    icon=f"/public/{icon}",
+                    category=icon.rsplit(".", 1)[0],
+                    label=item["label"],
+                    weight=float(item.get("weight", 1.0))
+                )
+                for item in category["questions"]
+                if float(item.get("weight", 1.0)) > 0
+            )))
+        return cls(categories)
+
+    def normalized_messages(self) -> frozenset:
+        """Normalized text of every starter, as recorded in the query log."""
+        return frozenset(
+            normalize_question(question.content)
+            for category in self.categories for question in category.questions
+        )
+
+    def sample(self, rng: Optional[random.Random] = None) -> List[StarterQuestion]:
+        """One weighted pick per category, in random order."""
+        rng = rng or random
+        starters = [category.sample(rng) for category in self.categories]
+        rng.shuffle(starters)
+        return starters
+
+    def reweighted(self, popularity: Mapping[str, int], strength: float = 1.0) -> 'StarterCatalog':
+        """Catalog whose weights are boosted by how often each starter was asked."""
+        def boost(question: StarterQuestion) -> StarterQuestion:
+            count = popularity.get(normalize_question(question.content), 0)
+            weight = question.weight * (1.0 + strength * math.log1p(count))
+            return StarterQuestion(question.content, question.icon, question.category, question.label, weight)
+
+        return StarterCatalog([
+            StarterCategory.build(category.icon, (boost(q) for q in category.questions))
+            for category in self.categories
+        ])
@@ -0,0 +1,290 @@
+"""Tests for backend load balancing and ejection against local stand-in backends."""
+
+import asyncio
+import http.server
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.application.services import SearchService
+from src.domain import ConversationTurn, SearchQuery
+from src.infrastructure import ApiConfig, EndpointPool, FallbackConfig, RAGApiClient, SearchConfig, build_index
+
+
+class StandInBackend:
+    """Local HTTP server answering searches and health probes; ``status`` makes it fail."""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        self.name = name
+        self.status = 200
+        self.delay = delay
+        self.requests = 0
+        backend = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(backend.status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                backend.requests += 1
+                time.sleep(backend.delay)
+                if backend.status == 200:
+                    body = json.dumps({
+                        "answer": f"Jawaban dari {backend.name}",
+                        "source_urls": [],
+                        "status": "success",
+                        "source_count": 0,
+                        "response_time": 0.01
+                    }).encode("utf-8")
+                else:
+                    body = b'{"detail": "internal error"}'
+                self.send_response(backend.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def api_config(backends, **overrides) -> ApiConfig:
+    config = ApiConfig(
+        base_url=backends[0].url,
+        backend_urls=[backend.url for backend in backends],
+        retry_delay=0.0,
+        request_compression="off",
+        endpoint_failure_threshold=2,
+        endpoint_ejection_time=60.0
+    )
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return config
+
+
+class EndpointPoolTest(unittest.TestCase):
+    def test_power_of_two_choices_avoids_slow_replica(self):
+        pool = EndpointPool(["http://a", "http://b", "http://c"])
+        slow = pool.endpoints[0]
+        slow.ewma_latency = 10.0
+        for endpoint in pool.endpoints[1:]:
+            endpoint.ewma_latency = 0.1
+
+        picked = {pool.select().base_url for _ in range(200)}
+        self.assertNotIn(slow.base_url, picked)
+        self.assertEqual(picked, {"http://b", "http://c"})
+
+    def test_ejection_backoff_doubles_and_resets_on_success(self):
+        clock = [1000.0]
+        with mock.patch("src.infrastructure.endpoints.time.monotonic", lambda: clock[0]):
+            pool = EndpointPool(["http://a", "http://b"], failure_threshold=2, ejection_time=10.0)
+            endpoint = pool.endpoints[0]
+
+            def fail_twice():
+                for _ in range(2):
+                    pool.release(pool.endpoints[0], failed=True)
+
+            fail_twice()
+            self.assertTrue(endpoint.ejected)
+            self.assertEqual(endpoint.ejected_until, 1010.0)
+            self.assertNotIn(endpoint, {pool.select() for _ in range(50)})
+
+            # Re-admitted once the backoff has passed; failing again doubles it
+            clock[0] = 1011.0
+            self.assertFalse(endpoint.ejected)
+            fail_twice()
+            self.assertEqual(endpoint.ejected_until, 1031.0)
+
+            # A success after re-admission resets the backoff
+            clock[0] = 1032.0
+            pool.release(endpoint, latency=0.1)
+            fail_twice()
+            self.assertEqual(endpoint.ejected_until, 1042.0)
+
+    def test_health_check_readmits(self):
+        pool = EndpointPool(["http://a", "http://b"], failure_threshold=1)
+        pool.release(pool.endpoints[0], failed=True)
+        self.assertTrue(pool.endpoints[0].ejected)
+        pool.mark_health(pool.endpoints[0], True)
+        self.assertFalse(pool.endpoints[0].ejected)
+
+    def test_all_ejected(self):
+        pool = EndpointPool(["http://a", "http://b"], failure_threshold=1)
+        pool.release(pool.endpoints[0], failed=True)
+        self.assertFalse(pool.all_ejected)
+        pool.release(pool.endpoints[1], failed=True)
+        self.assertTrue(pool.all_ejected)
+
+
+class MultiBackendTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.backends = [StandInBackend(name) for name in ("a", "b", "c")]
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.index_path = os.path.join(tmp.name, "fallback.idx")
+        build_index([{
+            "question": "Berapa biaya kuliah per semester?",
+            "answer": "Biaya kuliah tersimpan.",
+            "source_urls": []
+        }], self.index_path)
+
+    def tearDown(self):
+        for backend in self.backends:
+            backend.close()
+
+    def service(self, backends, **overrides) -> SearchService:
+        return SearchService(
+            api_config(backends, **overrides),
+            SearchConfig(),
+            FallbackConfig(enabled=True, path=self.index_path, min_coverage=0.5)
+        )
+
+    async def test_concurrent_traffic_spreads_over_backends(self):
+        for backend in self.backends:
+            backend.delay = 0.05
+        service = self.service(self.backends)
+        responses = await asyncio.gather(*(
+            service.search(SearchQuery(text=f"Apa itu KRS {i}?")) for i in range(60)
+        ))
+        await service.aclose()
+
+        self.assertFalse(any(response.error for response in responses))
+        counts = [backend.requests for backend in self.backends]
+        self.assertEqual(sum(counts), 60)
+        for count in counts:
+            self.assertGreaterEqual(count, 10)
+
+    async def test_failing_backend_is_avoided(self):
+        failing, healthy = self.backends[0], self.backends[1]
+        failing.status = 500
+        service = self.service([failing, healthy], max_retries=3)
+
+        for _ in range(20):
+            response = await service.search(SearchQuery(text="Apa itu KRS?"))
+            self.assertFalse(response.error)
+            self.assertEqual(response.answer, "Jawaban dari b")
+        await service.aclose()
+
+        # Retries fail over at once and the failing replica stops being picked
+        self.assertLessEqual(failing.requests, 2)
+        self.assertEqual(healthy.requests, 20)
+
+    async def test_readmitted_after_health_check(self):
+        backends = self.backends[:2]
+        for backend in backends:
+            backend.status = 500
+        service = self.service(backends, max_retries=2)
+        for _ in range(3):
+            await service.search(SearchQuery(text="Apa itu KRS?"))
+        self.assertTrue(service.client.pool.all_ejected)
+
+        # Replicas recover and the next health probe brings them back
+        for backend in backends:
+            backend.status = 200
+        self.assertTrue(await service.client.health_check())
+        self.assertFalse(service.client.pool.all_ejected)
+
+        response = await service.search(SearchQuery(text="Apa itu KRS?"))
+        self.assertFalse(response.error)
+        self.assertNotEqual(response.cache_type, "fallback")
+        await service.aclose()
+
+    async def test_all_ejected_serves_fallback_without_calling_backends(self):
+        for backend in self.backends[:2]:
+            backend.status = 500
+        service = self.service(self.backends[:2], max_retries=2)
+
+        # Trip both replicas
+        for _ in range(3):
+            await service.search(SearchQuery(text="Apa itu KRS?"))
+        self.assertTrue(service.client.pool.all_ejected)
+
+        sent = sum(backend.requests for backend in self.backends[:2])
+        response = await service.search(SearchQuery(text="Berapa biaya kuliah per semester?"))
+        self.assertEqual(response.cache_type, "fallback")
+        self.assertIn("Biaya kuliah tersimpan.", response.answer)
+        self.assertEqual(sum(backend.requests for backend in self.backends[:2]), sent)
+        await service.aclose()
+
+    async def test_fallback_only_when_backend_unavailable(self):
+        backend = self.backends[0]
+        service = self.service([backend], max_retries=1)
+        question = SearchQuery(text="Berapa biaya kuliah per semester?")
+
+        backend.status = 422
+        response = await service.search(question)
+        self.assertTrue(response.error)
+        self.assertNotEqual(response.cache_type, "fallback")
+
+        backend.status = 503
+        response = await service.search(question)
+        self.assertEqual(response.cache_type, "fallback")
+        await service.aclose()
+
+    async def test_followup_never_gets_stored_answer(self):
+        backend = self.backends[0]
+        backend.status = 503
+        service = self.service([backend], max_retries=1)
+        followup = SearchQuery(
+            text="Berapa biaya kuliah per semester?",
+            context=(ConversationTurn(question="Apa itu program D3?", answer="Program diploma."),)
+        )
+
+        response = await service.search(followup)
+        self.assertTrue(response.error)
+        self.assertNotEqual(response.cache_type, "fallback")
+        await service.aclose()
+
+
+class HedgingTest(unittest.IsolatedAsyncioTestCase):
+    async def start_hedged(self):
+        """Run ``_hedged`` until the primary and the hedge are both out; returns the call and their replies."""
+        client = RAGApiClient(ApiConfig(base_url="http://127.0.0.1:1"))
+        client._hedge_tokens = 5.0
+        replies = []
+
+        async def make_request():
+            reply = asyncio.get_running_loop().create_future()
+            replies.append(reply)
+            return await reply
+
+        with mock.patch.object(client, "_hedge_delay", return_value=0.01):
+            hedged = asyncio.ensure_future(client._hedged(make_request))
+            while len(replies) < 2:
+                await asyncio.sleep(0.01)
+        return hedged, replies
+
+    async def test_success_wins_when_both_finish_together(self):
+        hedged, (primary, hedge) = await self.start_hedged()
+        # Primary fails and hedge succeeds in the same loop iteration
+        primary.set_exception(ConnectionError("primary failed"))
+        hedge.set_result({"answer": "ok"})
+        self.assertEqual(await hedged, {"answer": "ok"})
+
+    async def test_error_raised_when_both_fail(self):
+        hedged, replies = await self.start_hedged()
+        for reply in replies:
+            reply.set_exception(ConnectionError("failed"))
+        with self.assertRaises(ConnectionError):
+            await hedged
+
+
+if __name__ == "__main__":
+    unittest.main()
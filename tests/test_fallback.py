@@ -0,0 +1,52 @@
+"""Tests for the local fallback index."""
+
+import os
+import tempfile
+import unittest
+
+from src.infrastructure import FallbackIndex, build_index
+from src.infrastructure.fallback import MAGIC
+
+
+class FallbackIndexTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "fallback.idx")
+
+    def write(self, content: bytes) -> FallbackIndex:
+        with open(self.path, "wb") as file:
+            file.write(content)
+        index = FallbackIndex(self.path)
+        self.addCleanup(index.close)
+        return index
+
+    def test_finds_stored_answer(self):
+        build_index([{"question": "Berapa biaya kuliah per semester?", "answer": "Biaya kuliah tersimpan."}], self.path)
+        index = FallbackIndex(self.path)
+        self.addCleanup(index.close)
+        hit = index.search("biaya kuliah per semester")
+        self.assertEqual(hit.answer, "Biaya kuliah tersimpan.")
+
+    def test_corrupt_files_raise_value_error_once(self):
+        header = b'{"docs": 9, "postings_size": 0}'
+        corrupt = {
+            "empty": b"",
+            "bad magic": b"NOTANINDEX" * 4,
+            "truncated length": MAGIC + b"\x01",
+            "bad header": MAGIC + (5).to_bytes(4, "little") + b"{oops",
+            "missing keys": MAGIC + (2).to_bytes(4, "little") + b"{}",
+            "truncated body": MAGIC + len(header).to_bytes(4, "little") + header
+        }
+        for name, content in corrupt.items():
+            with self.subTest(name):
+                index = self.write(content)
+                with self.assertRaises(ValueError):
+                    index.search("biaya kuliah")
+                # The failure is not retried on every search
+                self.assertIsNone(index.search("biaya kuliah"))
+                self.assertIsNone(index._mmap)
+
+
+if __name__ == "__main__":
+    unittest.main()
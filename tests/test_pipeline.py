@@ -0,0 +1,103 @@
+"""Tests for the search pipeline interceptors."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from src.application import CoalescingInterceptor, RateLimitInterceptor
+from src.domain import ConversationTurn, SearchQuery, SearchResponse
+from src.infrastructure import LocalState, PipelineConfig
+
+
+class StandInSearch:
+    """``call_next`` answering after a delay, with cleanup that itself awaits (like closing a connection)."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self, query: SearchQuery) -> SearchResponse:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+            return SearchResponse(query=query, answer=f"Jawaban {self.calls}")
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            await asyncio.sleep(0)
+
+
+class CoalescingInterceptorTest(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_questions_share_one_call(self):
+        interceptor, search = CoalescingInterceptor(), StandInSearch()
+        first, second = await asyncio.gather(
+            interceptor.search(SearchQuery(text="Apa itu KRS?"), search),
+            interceptor.search(SearchQuery(text=" Apa itu KRS? "), search)
+        )
+        self.assertEqual(search.calls, 1)
+        self.assertEqual(first.answer, second.answer)
+        self.assertIsNot(first, second)
+        self.assertEqual(interceptor._inflight, {})
+
+    async def test_followups_go_alone(self):
+        interceptor, search = CoalescingInterceptor(), StandInSearch()
+        context = (ConversationTurn(question="Apa itu D3?", answer="Program diploma."),)
+        await asyncio.gather(*(
+            interceptor.search(SearchQuery(text="Berapa biayanya?", context=context), search) for _ in range(2)
+        ))
+        self.assertEqual(search.calls, 2)
+
+    async def test_call_cancelled_when_last_caller_leaves(self):
+        interceptor, search = CoalescingInterceptor(), StandInSearch(delay=1.0)
+        callers = [asyncio.ensure_future(interceptor.search(SearchQuery(text="Apa itu KRS?"), search)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        callers[0].cancel()
+        await asyncio.sleep(0.01)
+        self.assertEqual(search.cancelled, 0)
+
+        callers[1].cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0.01)
+        self.assertEqual(search.cancelled, 1)
+        self.assertEqual(interceptor._inflight, {})
+
+    async def test_new_caller_after_cancel_starts_fresh_call(self):
+        interceptor, search = CoalescingInterceptor(), StandInSearch(delay=0.2)
+        leaving = asyncio.ensure_future(interceptor.search(SearchQuery(text="Apa itu KRS?"), search))
+        await asyncio.sleep(0.01)
+        leaving.cancel()
+        # Ask again while the abandoned call is still running its cleanup
+        arriving = asyncio.ensure_future(interceptor.search(SearchQuery(text="Apa itu KRS?"), search))
+
+        with self.assertRaises(asyncio.CancelledError):
+            await leaving
+        response = await arriving
+        self.assertEqual(response.answer, "Jawaban 2")
+        self.assertEqual(search.calls, 2)
+        self.assertEqual(interceptor._inflight, {})
+
+
+class RateLimitInterceptorTest(unittest.IsolatedAsyncioTestCase):
+    async def answered(self, interceptor: RateLimitInterceptor, count: int) -> int:
+        search = StandInSearch(delay=0)
+        responses = [await interceptor.search(SearchQuery(text="Apa itu KRS?"), search) for _ in range(count)]
+        return sum(not response.error for response in responses)
+
+    async def test_local_bucket_allows_burst(self):
+        interceptor = RateLimitInterceptor(PipelineConfig(rate_limit_per_second=1, rate_limit_burst=3))
+        self.assertEqual(await self.answered(interceptor, 5), 3)
+
+    async def test_workers_share_one_limit(self):
+        config = PipelineConfig(rate_limit_per_second=4, rate_limit_burst=100)
+        state = LocalState()
+        workers = [RateLimitInterceptor(config, state) for _ in range(2)]
+        with mock.patch("src.application.pipeline.time.time", return_value=1000.5):
+            answered = sum([await self.answered(worker, 3) for worker in workers])
+        self.assertEqual(answered, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Tests for the query log writer."""
+
+import os
+import tempfile
+import unittest
+
+from src.domain import SearchResponse
+from src.infrastructure import QueryLogConfig, QueryLogWriter, read_query_log
+
+
+class QueryLogWriterTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.response = SearchResponse(query=None, answer="Jawaban")
+
+    def writer(self, path: str, **overrides) -> QueryLogWriter:
+        writer = QueryLogWriter(QueryLogConfig(enabled=True, path=path, flush_interval=0.01, **overrides))
+        self.addCleanup(writer.close)
+        return writer
+
+    def test_writes_entries(self):
+        path = os.path.join(self.dir, "query_log.jsonl")
+        writer = self.writer(path)
+        writer.record("sesi", "Apa  itu KRS?", self.response, 0.5)
+        writer.close()
+        entries = list(read_query_log(path))
+        self.assertEqual([entry["q"] for entry in entries], ["apa itu krs?"])
+
+    def test_unwritable_path_disables_writer(self):
+        # A regular file where the log directory should be
+        blocker = os.path.join(self.dir, "blocker")
+        open(blocker, "w").close()
+        writer = self.writer(os.path.join(blocker, "query_log.jsonl"))
+
+        writer.record("sesi", "Apa itu KRS?", self.response, 0.5)
+        writer._thread.join(timeout=5)
+        self.assertTrue(writer._disabled)
+
+        for _ in range(100):
+            writer.record("sesi", "Apa itu KRS?", self.response, 0.5)
+        self.assertTrue(writer._queue.empty())
+
+    def test_failed_rotation_disables_writer(self):
+        path = os.path.join(self.dir, "query_log.jsonl")
+        # The backup slot is taken by a non-empty directory, so rotation fails
+        os.makedirs(os.path.join(f"{path}.1", "taken"))
+        writer = self.writer(path, max_bytes=200, backup_count=1)
+
+        for _ in range(10):
+            writer.record("sesi", "Apa itu KRS?", self.response, 0.5)
+        writer._thread.join(timeout=5)
+        self.assertFalse(writer._thread.is_alive())
+        self.assertTrue(writer._disabled)
+
+        writer.record("sesi", "Apa itu KRS?", self.response, 0.5)
+        self.assertTrue(writer._queue.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
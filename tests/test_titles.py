@@ -0,0 +1,132 @@
+"""Tests for source title fetching and enrichment against a local HTTP stand-in."""
+
+import asyncio
+import unittest
+
+import httpx
+
+from src.application.services import SourceEnrichmentService
+from src.infrastructure import EnrichmentConfig, PageTitleFetcher, PersistentTitleCache
+
+
+def page(title: str) -> bytes:
+    return f"<html><head><title>{title}</title></head><body>isi</body></html>".encode("utf-8")
+
+
+class StandIn:
+    """MockTransport handler serving canned pages and counting requests."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        route = self.routes.get(request.url.path)
+        if route is None:
+            return httpx.Response(404)
+        if isinstance(route, Exception):
+            raise route
+        return route() if callable(route) else httpx.Response(200, content=route)
+
+
+class PageTitleFetcherTest(unittest.IsolatedAsyncioTestCase):
+    async def fetch(self, routes, path, **kwargs):
+        fetcher = PageTitleFetcher(transport=httpx.MockTransport(StandIn(routes)), **kwargs)
+        try:
+            return await fetcher.fetch_title(f"https://baak.gunadarma.ac.id{path}")
+        finally:
+            await fetcher.aclose()
+
+    async def test_extracts_and_cleans_title(self):
+        title = await self.fetch({"/jadwal": page("  Jadwal\n  Kuliah &amp; Ujian ")}, "/jadwal")
+        self.assertEqual(title, "Jadwal Kuliah & Ujian")
+
+    async def test_missing_title_and_error_status(self):
+        routes = {"/kosong": b"<html><body>tanpa judul</body></html>"}
+        self.assertIsNone(await self.fetch(routes, "/kosong"))
+        self.assertIsNone(await self.fetch(routes, "/tidak-ada"))
+
+    async def test_stops_reading_at_size_cap(self):
+        sent = []
+
+        async def chunks():
+            for _ in range(100):
+                sent.append(1)
+                yield b"x" * 1024
+            yield b"<title>Terlambat</title>"
+
+        routes = {"/besar": lambda: httpx.Response(200, content=chunks())}
+        self.assertIsNone(await self.fetch(routes, "/besar", max_bytes=4096))
+        self.assertLess(len(sent), 100)
+
+    async def test_title_past_cap_in_one_chunk_is_ignored(self):
+        routes = {"/besar": b"x" * 5000 + page("Terlambat")}
+        self.assertIsNone(await self.fetch(routes, "/besar", max_bytes=4096))
+
+    async def test_failed_fetch_returns_none(self):
+        routes = {"/putus": httpx.ConnectError("connection refused")}
+        self.assertIsNone(await self.fetch(routes, "/putus"))
+
+
+class SourceEnrichmentServiceTest(unittest.IsolatedAsyncioTestCase):
+    def make_service(self, routes, failure_ttl=600.0):
+        self.stand_in = StandIn(routes)
+        config = EnrichmentConfig(enabled=True, cache_path="", failure_ttl=failure_ttl)
+        return SourceEnrichmentService(
+            config,
+            fetcher=PageTitleFetcher(transport=httpx.MockTransport(self.stand_in)),
+            cache=PersistentTitleCache(None)
+        )
+
+    async def settle(self, service):
+        while service._tasks:
+            await asyncio.gather(*service._tasks)
+
+    async def test_resolves_titles_in_background(self):
+        service = self.make_service({"/pmb": page("Penerimaan Mahasiswa Baru")})
+        url = "https://pmb.gunadarma.ac.id/pmb"
+        self.assertEqual(service.format_source(url), url)
+
+        service.schedule([url])
+        await self.settle(service)
+        self.assertEqual(service.format_source(url), f"[Penerimaan Mahasiswa Baru]({url})")
+        await service.aclose()
+
+    async def test_escapes_markdown_in_remote_titles(self):
+        service = self.make_service({"/a b(1)": page("Biaya [2024] *resmi* `x`")})
+        url = "https://www.gunadarma.ac.id/a b(1)"
+        service.schedule([url])
+        await self.settle(service)
+        self.assertEqual(
+            service.format_source(url),
+            r"[Biaya \[2024\] \*resmi\* \`x\`](https://www.gunadarma.ac.id/a%20b%281%29)"
+        )
+        await service.aclose()
+
+    async def test_failed_url_is_retried_after_ttl(self):
+        service = self.make_service({"/putus": httpx.ConnectError("refused")}, failure_ttl=0.05)
+        url = "https://www.gunadarma.ac.id/putus"
+        service.schedule([url])
+        await self.settle(service)
+        service.schedule([url])
+        await self.settle(service)
+        self.assertEqual(len(self.stand_in.requests), 1)
+
+        await asyncio.sleep(0.06)
+        service.schedule([url])
+        await self.settle(service)
+        self.assertEqual(len(self.stand_in.requests), 2)
+        await service.aclose()
+
+    async def test_failures_are_bounded(self):
+        service = self.make_service({})
+        service.config.max_entries = 3
+        for index in range(10):
+            service._remember_failure(f"https://www.gunadarma.ac.id/{index}")
+        self.assertEqual(list(service._failed), [f"https://www.gunadarma.ac.id/{i}" for i in (7, 8, 9)])
+        await service.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()